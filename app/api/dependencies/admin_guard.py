@@ -0,0 +1,24 @@
+# app/backend/api/dependencies/admin_guard.py
+
+# Import necessary modules
+import secrets                                                          # Importing secrets to compare the tokens in constant time
+from typing import Optional                                             # Importing Optional for type hints
+from fastapi import Depends, HTTPException, status                      # Importing FastAPI components for dependency injection
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer   # Importing HTTPBearer to read the Authorization header
+from ...config import auth_settings as auths                            # Importing authentication settings (admin token)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Reads the "Authorization: Bearer <token>" header, without the automatic error so a missing header is rejected as an invalid token
+admin_bearer = HTTPBearer(auto_error=False)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Allows the request only with the admin token (ADMIN_API_TOKEN), the protected endpoints are disabled if it is not set
+async def require_admin_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(admin_bearer)) -> None:
+
+    if not auths.ADMIN_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin API disabled")
+
+    if credentials is None or not secrets.compare_digest(credentials.credentials.encode(), auths.ADMIN_API_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token", headers={"WWW-Authenticate": "Bearer"})
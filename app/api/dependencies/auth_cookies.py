@@ -2,61 +2,149 @@
 
 # Import necessary modules
 from fastapi import Cookie, HTTPException, status, Response, Depends, Request   # Importing FastAPI components for routing and error handling
+from fastapi import WebSocket                                                   # Importing WebSocket for authenticating the real-time connections
 from sqlmodel.ext.asyncio.session import AsyncSession                           # Importing AsyncSession for asynchronous database operations
-from jose import JWTError                                                       # Importing JWTError for handling JWT decoding errors
-from ...db.db_handler import get_session                                        # Importing the database session dependency
+from ...db.db_handler import get_session, async_session                         # Importing the database session dependency and factory
 from typing import Optional                                                     # Importing Optional for type hints
 from ..utils.jwt import jwt_handler as jwt                                      # Importing the JWT handler for token operations
 from ...db.models.user.model import User                                           # Importing the DB User model
 from ..services.user_service import UserService as us                          # Importing the UserService for user operations
+from ..services.session_service import SessionService as ss                    # Importing the SessionService for server-side sessions
+from ...config import auth_settings as auths                                    # Importing authentication settings
 import os                                                                       # Importing os for accessing environment variables
+import time                                                                     # Importing time for the single-flight refresh period
 
 # Get the SECURE_COOKIES environment variable and convert it to a boolean
 SECURE_COOKIES = os.getenv("SECURE_COOKIES", "false").lower() == 'true'
 
+# Sliding refresh window: the tokens are only reissued when the access token expires in less than these seconds (or is missing/expired)
+ACCESS_TOKEN_REFRESH_WINDOW_SECONDS = int(os.getenv("ACCESS_TOKEN_REFRESH_WINDOW_SECONDS", 120))
+
+# Period in seconds in which concurrent refreshes with the same refresh token reuse the same reissued tokens
+REFRESH_SINGLE_FLIGHT_SECONDS = int(os.getenv("REFRESH_SINGLE_FLIGHT_SECONDS", 10))
+
 # NOTE: This class handles cookie authentication
 class AuthCookiesHandler:
 
+    def __init__(self):
+        # Recently reissued tokens by refresh token: {refresh_token: (monotonic time, tokens data)}
+        self._recent_refreshes: dict[str, tuple[float, dict]] = {}
+
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
     
     async def get_current_user_from_cookie( self, request: Request, response: Response, access_token: Optional[str] = Cookie(None), 
-                                            refresh_token: Optional[str] = Cookie(None), session : AsyncSession = Depends(get_session)) -> User:
-        """ Get the current user from the access token cookie """
+                                            refresh_token: Optional[str] = Cookie(None), session_id: Optional[str] = Cookie(None),
+                                            session : AsyncSession = Depends(get_session)) -> User:
+        """ Get the current user from the access token cookie, or from the session ID cookie if the "session" auth backend is enabled.
+            The tokens are only refreshed when the access token is missing, expired or about to expire (sliding refresh). """
         
         # DEBUG: check cookies from request
         # print("Cookies:", request.cookies)
 
-        # If no access token cookie is found, raise an error that no token cookie was found
+        # Server-side sessions backend: the session is validated from the cache, without any token or user query
+        if auths.sessions_enabled:
+            return await self.get_current_user_from_session(session_id, session)
+
+        user_id = None
+
+        # If there is an access token cookie, tries to get the user ID from it
         if access_token:
             try:
                 # Decodes the access token using the JWT handler
                 payload = jwt.decode_jwt(access_token)
                 user_id = int(payload.get("sub"))
 
-                if not user_id or not isinstance(user_id, int):
-                    raise HTTPException(status_code=401, detail="Invalid token")
+                # If the access token is about to expire, refreshes the tokens, but the request goes on with the still valid access token if it fails
+                if refresh_token and jwt.seconds_until_expiry(payload) <= ACCESS_TOKEN_REFRESH_WINDOW_SECONDS:
+                    try:
+                        await self.refresh_tokens(refresh_token, response)
+                    except HTTPException:
+                        pass
 
-                user = await us.read_user_by_id(user_id, session)
-                await session.refresh(user)
-                return user
+            # Expired or invalid access token (decode_jwt raises HTTPException), or an invalid "sub" claim
+            except (HTTPException, TypeError, ValueError):
+                user_id = None
 
-            except JWTError:
-                pass
-
-        # If no access token cookie is found, check the refresh token cookie
-        if refresh_token:
+        # If there is no valid access token, check the refresh token cookie
+        if not user_id and refresh_token:
             user_id = await self.refresh_tokens(refresh_token, response)
-            
-            # Gets the user from the database using the user_id
-            user = await us.read_user_by_id(user_id, session)
-            await session.refresh(user)
-            return user
+
+        if not user_id:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="No valid access or refresh token", headers={"WWW-Authenticate": "Bearer"},)
         
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="No valid access or refresh token", headers={"WWW-Authenticate": "Bearer"},)
+        # Gets the user from the database using the user_id
+        user = await us.read_user_by_id(user_id, session)
+
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+
+        return user
+    
+    async def get_current_user_from_session(self, session_id: Optional[str], session: AsyncSession) -> User:
+        """ Get the current user from the session ID cookie """
+
+        user = await ss.read_session_user(session_id, session) if session_id else None
+
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="No valid session", headers={"WWW-Authenticate": "Bearer"},)
+
+        return user
     
+    async def get_user_id_from_websocket(self, websocket: WebSocket) -> Optional[int]:
+        """ Get the current user ID from the cookies of a WebSocket handshake, or None if it is not authenticated.
+            WebSockets cannot set cookies, so the tokens are never refreshed here: the client reconnects after any HTTP request refreshes them. """
+
+        # Server-side sessions backend: validates the session ID cookie
+        if auths.sessions_enabled:
+            session_id = websocket.cookies.get("session_id")
+            if not session_id:
+                return None
+
+            async with async_session() as session:
+                user = await ss.read_session_user(session_id, session)
+
+            return user.id if user else None
+
+        access_token = websocket.cookies.get("access_token")
+        if not access_token:
+            return None
+
+        try:
+            payload = jwt.decode_jwt(access_token)
+            return int(payload.get("sub"))
+
+        # Expired or invalid access token (decode_jwt raises HTTPException), or an invalid "sub" claim
+        except (HTTPException, TypeError, ValueError):
+            return None
+
     async def refresh_tokens(self, refresh_token: str, response: Response) -> int:
-        """ Refresh access and refresh tokens, and return user_id """
+        """ Refresh access and refresh tokens, and return user_id.
+            Concurrent refreshes with the same refresh token are single-flighted, so the tokens are only minted once. """
         
+        tokens = self._reissue_tokens(refresh_token)
+
+        # Sets the new cookies (overwriting the old ones, so there is no need to clear them first)
+        self.set_access_token_cookie(response, tokens["access_token"])
+        self.set_refresh_token_cookie(response, tokens["refresh_token"])
+
+        return tokens["user_id"]
+
+    def _reissue_tokens(self, refresh_token: str) -> dict:
+        """ Mints new access and refresh tokens from a refresh token, reusing the ones reissued recently for the same refresh token.
+            NOTE: It has no awaits, so there is no interleaving between requests in the event loop and the cache lookup is enough to single-flight. """
+
+        now = time.monotonic()
+
+        # Removes the expired entries, so the cache only holds the refreshes of the last seconds
+        expired = [token for token, (issued_at, _) in self._recent_refreshes.items() if now - issued_at > REFRESH_SINGLE_FLIGHT_SECONDS]
+        for token in expired:
+            del self._recent_refreshes[token]
+
+        # If the tokens were reissued recently, reuses them
+        recent = self._recent_refreshes.get(refresh_token)
+        if recent:
+            return recent[1]
+
         try:
             payload = jwt.decode_jwt(refresh_token)
             user_id = int(payload.get("sub"))
@@ -69,20 +157,18 @@ class AuthCookiesHandler:
                                 "nickname": payload["nickname"],
                             }
 
-            new_access_token = jwt.create_access_token(new_token_data)
-            new_refresh_token = jwt.create_refresh_token(new_token_data)
-
-            # Clears the cookies
-            self.clear_auth_cookies(response)
-            
-            self.set_access_token_cookie(response, new_access_token)
-            self.set_refresh_token_cookie(response, new_refresh_token)
-
-            return user_id
+            tokens = {
+                        "access_token": jwt.create_access_token(new_token_data),
+                        "refresh_token": jwt.create_refresh_token(new_token_data),
+                        "user_id": user_id,
+                    }
 
-        except JWTError:
+        except (KeyError, TypeError, ValueError):
             raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
 
+        self._recent_refreshes[refresh_token] = (now, tokens)
+        return tokens
+
 
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
@@ -117,11 +203,27 @@ class AuthCookiesHandler:
         
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
+    def set_session_cookie(self, response: Response, session_id: str) -> None:
+        """ Sets the session ID cookie (server-side sessions backend) """
+
+        response.set_cookie(
+                                key="session_id",
+                                value=session_id,
+                                httponly=True,
+                                secure=SECURE_COOKIES,  # In localhost, secure=False
+                                samesite="strict",
+                                max_age=auths.SESSION_EXPIRE_DAYS * 86400,
+                                path="/"
+                            )
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
     def clear_auth_cookies (self, response: Response) -> None:
-        """ Clears the access and refresh token cookies """
+        """ Clears the access and refresh token cookies, and the session ID cookie """
         
         response.delete_cookie("access_token", path="/", httponly=True)
         response.delete_cookie("refresh_token", path="/", httponly=True)
+        response.delete_cookie("session_id", path="/", httponly=True)
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 # Create an instance of the AuthCookiesHandler class
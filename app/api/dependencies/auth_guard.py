@@ -3,7 +3,6 @@
 # Import necessary modules
 from fastapi import Depends, HTTPException, status                  # Importing FastAPI components for dependency injection
 from fastapi.security import OAuth2PasswordBearer                   # Importing OAuth2PasswordBearer for token-based authentication
-from jose import JWTError                                           # Importing JWTError for handling JWT decoding errors
 from ..utils.jwt import jwt_handler as jwt                         # Importing the JWT handler for token operations
 from ...db.db_handler import get_session                            # Importing the database session dependency
 from ..services.user_service import UserService as us              # Importing the UserService for user operations
@@ -47,8 +46,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme), session=Depends(
         # Return the current user
         return user
     
-    # Raise an error if the token is invalid or expired
-    except JWTError:
+    # Raise an error if the "sub" claim is invalid (decode_jwt already raises HTTPException if the token is invalid or expired)
+    except (TypeError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication credentials")  # Handle JWT errors
     
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
\ No newline at end of file
@@ -5,7 +5,8 @@ from typing import Optional
 from fastapi import APIRouter, Cookie, HTTPException, status, Depends, Request, Response      # Importing FastAPI components for routing and error handling
 from sqlmodel.ext.asyncio.session import AsyncSession                                         # Importing AsyncSession for asynchronous database operations
 
-from ...db.models.user.DTOs import RefreshResponse, TokenResponse, MessageResponse               # Importing token DTOs
+from ...db.models.user.DTOs import AuthenticatedUser, RefreshResponse, TokenResponse, MessageResponse, LogoutAllResponse    # Importing token DTOs
+from ...db.models.session.DTOs import SessionRead                                                # Importing the session DTO for listing sessions
 from ...db.models.user.model import User                                                         # Importing the DB User model
 from ...db.models.user.DTOs import UserLogin, UserCreate, UserRead                               # Importing DTOs for validating input/output of user data
 from fastapi.security import OAuth2PasswordRequestForm                                        # Importing OAuth2PasswordRequestForm for token authentication
@@ -14,6 +15,8 @@ from ..dependencies.auth_cookies import auth_cookies_handler as ach
 from ..services.user_service import UserService as us                                        # Importing the user service for user-related operations
 from ...db.db_handler import get_session                                                      # Importing the get_session function to manage database sessions
 from ..dependencies.auth_guard import get_current_user                                   # Importing the dependency to get the current user from the generated token
+from ..services.session_service import SessionService as ss                                  # Importing the session service for server-side sessions
+from ...config import auth_settings as auths                                                  # Importing authentication settings
 
 # Create a new API router for auth-related endpoints
 auth_router = APIRouter(tags=["auth"])
@@ -45,36 +48,100 @@ async def api_auth_login_OAuth(form_data: OAuth2PasswordRequestForm = Depends(),
 
 @auth_router.post("/loginJSON", response_model=TokenResponse)
 async def api_auth_login_JSON(data: UserLogin, response: Response, session: AsyncSession = Depends(get_session)):
-    """ API endpoint to authenticate an user using JSON payload, expects username and password, returns a JWT token if credentials are valid """
-    
-    # Calls the UserService login method with username and password to validate and generate token
-    token = await us.login_user(data.nickname, data.password, session)
-
-    # If token is None, raise an error
-    if not token:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Credenciales invalidos")
+    """ API endpoint to authenticate an user using JSON payload, expects username and password, returns a JWT token if credentials are valid.
+        If the "session" auth backend is enabled, a server-side session is created instead and only its opaque ID cookie is set.
+        The response includes the user profile, so the frontend knows who logged in without calling /me-cookie. """
     
     # Clear cookies to avoid security issues
     ach.clear_auth_cookies(response)
     
+    # Authenticates the user
+    user = await us.authenticate_user(data.nickname, data.password, session)
+    
+    # If user is not authenticated or does not exist, raise an error
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Credenciales invalidos")
+    
+    user_profile = AuthenticatedUser(id=user.id, nickname=user.nickname)
+    
+    # Server-side sessions backend
+    if auths.sessions_enabled:
+        
+        # Creates the session
+        session_id = await ss.create_session(user, session)
+        await session.commit()
+        
+        # Creates the cookie with the session ID
+        ach.set_session_cookie(response, session_id)
+        
+        return {"token_type": "session", "user": user_profile}
+    
+    # Generates the access and refresh tokens
+    token = us.create_user_tokens(user)
+    
     # Creates cookies with the access and refresh tokens
     ach.set_access_token_cookie(response, token['access_token'])
     ach.set_refresh_token_cookie(response, token['refresh_token'])
     
-    # Returns the access token and the refresh token and token type (bearer)
+    # Returns the access token and the refresh token, token type (bearer) and the user profile
     return {
                 "access_token": token['access_token'],
                 "refresh_token": token['refresh_token'],
-                "token_type": "bearer"
+                "token_type": "bearer",
+                "user": user_profile
             }
 
 @auth_router.post("/logout", response_model=MessageResponse)
-async def logout(response: Response):
-    """ API endpoint to log out the user, clears the cookies """
+async def logout(response: Response, session_id: Optional[str] = Cookie(None), session: AsyncSession = Depends(get_session)):
+    """ API endpoint to log out the user, clears the cookies (and removes the server-side session if there is one) """
+    
+    # Removes the server-side session
+    if session_id:
+        await ss.delete_session(session_id, session)
+        await session.commit()
     
     # Clear authorization cookies
     ach.clear_auth_cookies(response)
     return {"message": "Logged out"}  
+
+
+@auth_router.post("/logout-all", response_model=LogoutAllResponse)
+async def logout_all(response: Response, session: AsyncSession = Depends(get_session), current_user: User = Depends(ach.get_current_user_from_cookie)):
+    """ API endpoint to log out the user everywhere, removes every server-side session of the user and clears the cookies.
+        Only the "session" auth backend can revoke the other devices: the refresh tokens of the "jwt" backend stay valid until they expire. """
+    
+    if not auths.sessions_enabled:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Logout everywhere requires the session auth backend")
+    
+    sessions_closed = await ss.delete_user_sessions(current_user.id, session)
+    await session.commit()
+    
+    # Clear authorization cookies
+    ach.clear_auth_cookies(response)
+    return {"message": "Logged out everywhere", "sessions_closed": sessions_closed}
+
+
+@auth_router.get("/sessions", response_model=list[SessionRead])
+async def api_auth_get_sessions(session: AsyncSession = Depends(get_session), current_user: User = Depends(ach.get_current_user_from_cookie)):
+    """ API endpoint to list the active server-side sessions of the current user """
+    
+    sessions = await ss.read_user_sessions(current_user.id, session)
+    return [SessionRead.model_validate(user_session) for user_session in sessions]
+
+
+# NOTE: The path parameter is not named "session_id", the session cookie read by get_current_user_from_cookie already has that name.
+@auth_router.delete("/sessions/{session_digest}", response_model=MessageResponse)
+async def api_auth_revoke_session(session_digest: str, session: AsyncSession = Depends(get_session), current_user: User = Depends(ach.get_current_user_from_cookie)):
+    """ API endpoint to revoke one of the server-side sessions of the current user, by the ID (digest) returned in the sessions list """
+    
+    was_deleted = await ss.delete_user_session_by_id(session_digest, current_user.id, session)
+    
+    # If session was not found, raise an error
+    if not was_deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    
+    await session.commit()
+    return {"message": "Session revoked"}
     
     
 # @auth_router.post("/refresh-token")
@@ -130,15 +197,11 @@ async def api_auth_get_me(current_user: User = Depends(get_current_user)):
     return {"id": current_user.id, "nickname": current_user.nickname}
 
 
-@auth_router.get("/me-cookie")
+@auth_router.get("/me-cookie", response_model=AuthenticatedUser)
 async def api_auth_get_me_cookie(current_user: User = Depends(ach.get_current_user_from_cookie)):
     """ API endpoint to retrieve the currently authenticated user's information, requires the user to be authenticated with the token validated using cookies """
 
-    return {
-        "is_authenticated": True,
-        "id": current_user.id,
-        "nickname": current_user.nickname
-    }
+    return AuthenticatedUser(id=current_user.id, nickname=current_user.nickname)
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 # REGISTRATION ENDPOINT #
@@ -0,0 +1,18 @@
+# app/backend/api/routes/cache_admin.py
+
+# Import necessary modules
+from fastapi import APIRouter, Depends                                 # Importing FastAPI components for routing
+from ..dependencies.admin_guard import require_admin_token             # Importing the admin token guard
+from ..utils.response_cache import response_cache                      # Importing the in-process response cache
+
+# Create a new API router for cache-related endpoints for admin
+cache_admin_router = APIRouter(tags=["admin_cache"])
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+# READ ENDPOINTS #
+
+@cache_admin_router.get("/admin/cache/stats", dependencies=[Depends(require_admin_token)])
+async def api_get_cache_stats():
+    """ API endpoint to get the per-route hit ratio and memory usage of the in-process response cache, admin token required """
+
+    return response_cache.stats()
@@ -1,15 +1,19 @@
 # app/backend/api/routes/events.py
 
 # Import necessary modules
-from fastapi import APIRouter, HTTPException, status, Depends          # Importing FastAPI components for routing and error handling
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response    # Importing FastAPI components for routing and error handling
 from typing import Optional                                            # Importing Optional for type hints
 from ...db.db_handler import get_session                               # Importing the get_session function to manage database sessions
-from .auth import api_auth_get_me_cookie                  # Importing the dependency to get the current user from the generated token
+from ..dependencies.auth_cookies import auth_cookies_handler as ach    # Importing the dependency to get the current user from the cookies
+from ..utils.etag import make_weak_etag, is_not_modified, not_modified_response, set_etag_headers    # Importing the ETag helpers for conditional GETs
+from ..utils.response_cache import response_cache                      # Importing the in-process response cache for the title search
+from ..utils.sync_token import encode_sync_token, decode_sync_token, is_sync_token_expired    # Importing the sync token helpers for the delta sync
+from datetime import datetime                                          # Importing datetime for the sync timestamps
 from sqlmodel.ext.asyncio.session import AsyncSession                  # Importing AsyncSession for asynchronous database operations
 from ..services.event_service import EventService as es               # Importing the event service for event-related operations                     
 from ...db.models.event.model import Event                                # Importing the DB Event model
 from ...db.models.user.model import User                                  # Importing the DB User model
-from ...db.models.event.DTOs import EventCreate, EventRead, EventUpdate   # Importing DTOs for user input/output validation and transformation
+from ...db.models.event.DTOs import EventCreate, EventRead, EventUpdate, EventChanges   # Importing DTOs for user input/output validation and transformation
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError             # TODO: Cambiar por funciones SQLMODEL (Importing SQLAlchemy exceptions)
 
 # Create a new API router for user-related endpoints
@@ -19,7 +23,7 @@ event_router = APIRouter(tags=["events_user"])
 # CREATE ENDPOINTS #
 
 @event_router.post("/events", response_model=EventRead)
-async def api_create_event(event_to_create: EventCreate, session: AsyncSession = Depends(get_session), current_user: User = Depends(api_auth_get_me_cookie)):
+async def api_create_event(event_to_create: EventCreate, session: AsyncSession = Depends(get_session), current_user: User = Depends(ach.get_current_user_from_cookie)):
     """ API endpoint to create a new event for the current user, expects an EventCreate DTO and returns an EventRead DTO.
         This endpoint requires an user session and cookies with a validated token."""
 
@@ -53,26 +57,78 @@ async def api_create_event(event_to_create: EventCreate, session: AsyncSession =
 # READ ENDPOINTS #
 
 @event_router.get("/events", response_model=list[EventRead])
-async def api_get_events(amount: Optional[int] = None, session: AsyncSession = Depends(get_session), current_user: User = Depends(api_auth_get_me_cookie)):
+async def api_get_events(request: Request, response: Response, amount: Optional[int] = None, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                         session: AsyncSession = Depends(get_session), current_user: User = Depends(ach.get_current_user_from_cookie)):
     """ API endpoint to get all events from the database for the current user and returns a list of EventRead DTOs.
+        With start and/or end, only returns the events overlapping that date window (the calendar loads a week or a month at a time).
+        Supports conditional GETs: if the If-None-Match header matches the ETag, returns 304 Not Modified without loading the events.
         This endpoint requires an user session and cookies with a validated token."""
     
+    if start and end and start >= end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Start date cannot be after end date.")
+    
+    # Builds the ETag from the last modification and the amount of events, with a single aggregate query
+    last_modification, events_count = await es.read_user_events_version(current_user, session)
+    etag = make_weak_etag(last_modification, events_count, amount or 0, start.isoformat() if start else "", end.isoformat() if end else "")
+    
+    # If the client already has this version, short-circuits before loading or serializing any row
+    if events_count and is_not_modified(request, etag):
+        return not_modified_response(response, etag)
+    
     # Retrieves all events from the database.
-    events: list[Event] | None = await es.read_all_user_events(current_user, session, maxAmount=amount)
+    events: list[Event] | None = await es.read_all_user_events(current_user, session, maxAmount=amount, start=start, end=end)
     
     # If no events found, raise an error
     if not events or events == [] or events is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Events not found")
+    
+    set_etag_headers(response, etag)
         
     # Convert each Event model instance to EventRead DTO for serialization
     return [EventRead.model_validate(event) for event in events[:amount]]
 
 
+@event_router.get("/events/changes", response_model=EventChanges)
+async def api_get_event_changes(since: Optional[str] = None, session: AsyncSession = Depends(get_session), 
+                                current_user: User = Depends(ach.get_current_user_from_cookie)):
+    """ API endpoint to get the events of the current user created, modified or deleted since a sync token, and returns an EventChanges DTO
+        with the token for the next sync. Without a token, returns every event (first sync).
+        If the token is older than the tombstones retention, returns 410 Gone and the client must sync again without a token.
+        This endpoint requires an user session and cookies with a validated token."""
+    
+    watermark = None
+    if since:
+        try:
+            watermark = decode_sync_token(since)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid sync token")
+        
+        # The deletions after the token may have been compacted already
+        if is_sync_token_expired(watermark):
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail="Sync token expired, sync again without a token")
+    
+    # The next token is taken before reading, so nothing committed during the reads is skipped
+    synced_at = datetime.now()
+    changed, deleted = await es.read_user_event_changes(watermark, current_user, session)
+    
+    return EventChanges(changed=[EventRead.model_validate(event) for event in changed], deleted=deleted, sync_token=encode_sync_token(synced_at))
+
+
 @event_router.get("/events/{event_id}", response_model=EventRead)
-async def api_read_event_by_id(event_id: int, session: AsyncSession = Depends(get_session), current_user: User = Depends(api_auth_get_me_cookie)):
+async def api_read_event_by_id(event_id: int, request: Request, response: Response, session: AsyncSession = Depends(get_session), 
+                               current_user: User = Depends(ach.get_current_user_from_cookie)):
     """ API endpoint to get an event by its ID from the database for the current user and returns an EventRead DTO.
+        Supports conditional GETs: if the If-None-Match header matches the ETag, returns 304 Not Modified without loading the event.
         This endpoint requires an user session and cookies with a validated token."""
 
+    # Builds the ETag from the modification timestamp of the event, querying only that column
+    last_modification = await es.read_user_event_modification(event_id, current_user, session)
+    etag = make_weak_etag(last_modification, event_id)
+    
+    # If the client already has this version, short-circuits before loading or serializing the event
+    if last_modification and is_not_modified(request, etag):
+        return not_modified_response(response, etag)
+
     # Calls the EventService function to get the event by its ID
     event: Event | None = await es.read_user_event_by_id(event_id, current_user, session)
 
@@ -80,14 +136,26 @@ async def api_read_event_by_id(event_id: int, session: AsyncSession = Depends(ge
     if not event or event is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     
+    set_etag_headers(response, etag)
+    
     return EventRead.model_validate(event)
 
 
 @event_router.get("/events/title/{title}", response_model=list[EventRead])
-async def api_read_events_by_title(title: str, session: AsyncSession = Depends(get_session), current_user: User = Depends(api_auth_get_me_cookie)):
+async def api_read_events_by_title(title: str, response: Response, session: AsyncSession = Depends(get_session), 
+                                   current_user: User = Depends(ach.get_current_user_from_cookie)):
     """ API endpoint to get all events by title from the database for the current user and returns a list of EventRead DTOs.
+        The serialized response is cached until an event is written (the refreshed auth cookies are still sent with it).
         This endpoint requires an user session and cookies with a validated token."""
     
+    # The title search is case-insensitive, so the cache key uses the lowercased title (and the user, as the results are private)
+    cache_params = {"user_id": current_user.id, "title": title.lower()}
+    
+    # Returns the cached response if the events did not change since it was stored
+    cached, generations = response_cache.get("events_title", cache_params, ("events",), response)
+    if cached:
+        return cached
+    
     # Calls the EventService to get all events by title
     events: list[Event] | None = await es.read_all_user_events_by_title(title, current_user, session)
     
@@ -95,13 +163,13 @@ async def api_read_events_by_title(title: str, session: AsyncSession = Depends(g
     if not events or events == [] or events is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Events not found with this title")
     
-    return [EventRead.model_validate(event) for event in events]
+    return response_cache.store("events_title", cache_params, ("events",), generations, [EventRead.model_validate(event) for event in events], response)
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 # UPDATE ENDPOINTS #
 
 @event_router.put("/events/{event_id}", response_model=EventRead)
-async def api_update_event_by_id(event_id: int, event_to_update: EventUpdate, session: AsyncSession = Depends(get_session), current_user: User = Depends(api_auth_get_me_cookie)):
+async def api_update_event_by_id(event_id: int, event_to_update: EventUpdate, session: AsyncSession = Depends(get_session), current_user: User = Depends(ach.get_current_user_from_cookie)):
     """ API endpoint to update an event by its ID in the database for the current user and returns an EventRead DTO. 
         This endpoint requires an user session and cookies with a validated token."""
 
@@ -122,7 +190,7 @@ async def api_update_event_by_id(event_id: int, event_to_update: EventUpdate, se
 # DELETE ENDPOINTS #
 
 @event_router.delete("/events/{event_id}", status_code=status.HTTP_200_OK)
-async def api_delete_event_by_id(event_id: int, session: AsyncSession = Depends(get_session), current_user: User = Depends(api_auth_get_me_cookie)):
+async def api_delete_event_by_id(event_id: int, session: AsyncSession = Depends(get_session), current_user: User = Depends(ach.get_current_user_from_cookie)):
     """ API endpoint to delete an event by its ID from the database for the current user and returns a success message. 
         This endpoint requires an user session and cookies with a validated token."""
 
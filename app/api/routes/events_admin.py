@@ -11,6 +11,7 @@ from ...db.models.event.model import Event                                # Impo
 from ...db.models.user.model import User                                  # Importing the DB User model
 from ...db.models.event.DTOs import EventCreate, EventRead, EventUpdate   # Importing DTOs for user input/output validation and transformation                
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError             # TODO: Cambiar por funciones SQLMODEL (Importing SQLAlchemy exceptions)
+from ..utils.response_cache import response_cache                      # Importing the in-process response cache for the listing endpoints
 
 # Create a new API router for event-related endpoints for admin
 event_admin_router = APIRouter(tags=["events_admin"])
@@ -53,7 +54,13 @@ async def api_create_event(event_to_create: EventCreate, user_id: int, session:
 
 @event_admin_router.get("/admin/events/", response_model=list[EventRead])
 async def api_get_events(amount: Optional[int] = None, session: AsyncSession = Depends(get_session)):
-    """ API endpoint to get all events from the database and returns a list of EventRead DTOs. """
+    """ API endpoint to get all events from the database and returns a list of EventRead DTOs.
+        The serialized response is cached until an event is written. """
+    
+    # Returns the cached response if the events did not change since it was stored
+    cached, generations = response_cache.get("admin_events", {"amount": amount}, ("events",))
+    if cached:
+        return cached
     
     # Retrieves all events from the database.
     events: list[Event] | None = await es.read_all_events(session, maxAmount=amount)
@@ -62,8 +69,8 @@ async def api_get_events(amount: Optional[int] = None, session: AsyncSession = D
     if not events or events == [] or events is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Events not found")
         
-    # Convert each Event model instance to EventRead DTO for serialization
-    return [EventRead.model_validate(event) for event in events[:amount]]
+    # Convert each Event model instance to EventRead DTO for serialization and caches the serialized response
+    return response_cache.store("admin_events", {"amount": amount}, ("events",), generations, [EventRead.model_validate(event) for event in events[:amount]])
 
 
 @event_admin_router.get("/admin/events/{event_id}", response_model=EventRead)
@@ -96,7 +103,16 @@ async def api_read_events_by_user_id(user_id: int, session: AsyncSession = Depen
 
 @event_admin_router.get("/admin/events/title/{title}", response_model=list[EventRead])
 async def api_read_events_by_title(title: str, session: AsyncSession = Depends(get_session)):
-    """ API endpoint to get all events by title from the database and returns a list of EventRead DTOs. """
+    """ API endpoint to get all events by title from the database and returns a list of EventRead DTOs.
+        The serialized response is cached until an event is written. """
+    
+    # The title search is case-insensitive, so the cache key uses the lowercased title
+    cache_params = {"title": title.lower()}
+    
+    # Returns the cached response if the events did not change since it was stored
+    cached, generations = response_cache.get("admin_events_title", cache_params, ("events",))
+    if cached:
+        return cached
     
     # Calls the EventService to get all events by title
     events: list[Event] | None = await es.read_all_events_by_title(title, session)
@@ -105,7 +121,7 @@ async def api_read_events_by_title(title: str, session: AsyncSession = Depends(g
     if not events or events == [] or events is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Events not found with this title")
     
-    return [EventRead.model_validate(event) for event in events]
+    return response_cache.store("admin_events_title", cache_params, ("events",), generations, [EventRead.model_validate(event) for event in events])
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 # UPDATE ENDPOINTS #
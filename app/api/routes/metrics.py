@@ -0,0 +1,17 @@
+# app/backend/api/routes/metrics.py
+
+# Import necessary modules
+from fastapi import APIRouter, Response                                # Importing FastAPI components for routing
+from ..utils.metrics import CONTENT_TYPE, request_metrics             # Importing the requests metrics and their content type
+
+# Create a new API router for the metrics endpoint (scraped by Prometheus, keep it private at the proxy)
+metrics_router = APIRouter(tags=["metrics"])
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+# READ ENDPOINTS #
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def api_get_metrics():
+    """ API endpoint to get the requests, database pool and password hasher metrics in the Prometheus text exposition format """
+
+    return Response(content=request_metrics.render(), media_type=CONTENT_TYPE)
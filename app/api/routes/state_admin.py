@@ -0,0 +1,18 @@
+# app/backend/api/routes/state_admin.py
+
+# Import necessary modules
+from fastapi import APIRouter, Depends, Query                          # Importing FastAPI components for routing
+from ..dependencies.admin_guard import require_admin_token             # Importing the admin token guard
+from ...state.session_memory import session_memory_monitor             # Importing the memory monitor of the Reflex states
+
+# Create a new API router for Reflex state-related endpoints for admin
+state_admin_router = APIRouter(tags=["admin_state"])
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+# READ ENDPOINTS #
+
+@state_admin_router.get("/admin/state/sessions", dependencies=[Depends(require_admin_token)])
+async def api_get_state_sessions(limit: int = Query(20, ge=1, le=500)):
+    """ API endpoint to get the approximate memory of the Reflex states by state class and the largest sessions (by hashed token), admin token required """
+
+    return session_memory_monitor.stats(limit)
@@ -7,6 +7,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession                  # Importi
 from ..services.user_service import UserService as us                 # Importing the user service for user-related operations                     
 from ...db.models.user.model import User                                  # Importing the DB User model
 from ...db.models.user.DTOs import UserCreate, UserRead, UserUpdate       # Importing DTOs for user input/output validation and transformation
+from ..utils.response_cache import response_cache                      # Importing the in-process response cache for the listing endpoints
 
 # Creates a new API router for user-related endpoints
 user_admin_router = APIRouter(tags=["admin_users"])
@@ -52,7 +53,13 @@ async def api_read_user_by_id(user_id: int, session: AsyncSession = Depends(get_
 
 @user_admin_router.get("/admin/users", response_model=list[UserRead])
 async def api_get_all_users(session: AsyncSession = Depends(get_session)):
-    """ API endpoint to get all users from the database and returns a list of UserRead DTOs """
+    """ API endpoint to get all users from the database and returns a list of UserRead DTOs.
+        The serialized response is cached until an user is written. """
+    
+    # Returns the cached response if the users did not change since it was stored
+    cached, generations = response_cache.get("admin_users", {}, ("users",))
+    if cached:
+        return cached
     
     # Calls the UserService function to retrieve all users from the database
     users: list[User] | None = await us.get_all_users(session)                 
@@ -61,8 +68,8 @@ async def api_get_all_users(session: AsyncSession = Depends(get_session)):
     if not users or users == [] or users is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found") 
     
-    # Convert each User model instance to UserRead DTO for serialization
-    return [UserRead.model_validate(user) for user in users]
+    # Convert each User model instance to UserRead DTO for serialization and caches the serialized response
+    return response_cache.store("admin_users", {}, ("users",), generations, [UserRead.model_validate(user) for user in users])
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 # UPDATE ENDPOINTS #
@@ -2,12 +2,19 @@
 
 # Import necessary modules
 from ...db.models.event.model import Event                            # Importing the DB Event model
-from sqlmodel import select                                       # Importing SQLModel for database operations
+from ...db.models.tombstone.model import EventTombstone               # Importing the DB EventTombstone model for the deleted events
+from sqlmodel import select, func                                 # Importing SQLModel for database operations
 from sqlmodel.ext.asyncio.session import AsyncSession             # Importing AsyncSession for asynchronous database operations
-from datetime import datetime                                     # Importing for timestamps management
+from datetime import datetime, timedelta                          # Importing for timestamps management and the tombstones retention
 from ...db.models.event.DTOs import EventCreate, EventUpdate          # Importing DTOs for event input/output validation and transformation
 from ...db.models.user.model import User                              # Importing the DB User model        
 from sqlalchemy.sql.operators import ilike_op                     # Import ILIKE operator for case-insensitive filtering
+from ..utils.response_cache import mark_stale                     # Importing mark_stale to invalidate the cached responses on writes
+from ..utils.realtime import notify_event_change                  # Importing notify_event_change to push the changes to the owner's WebSockets
+from sqlalchemy import delete                                     # Importing delete for the tombstones compaction
+from ...db.db_handler import async_session                        # Importing the session factory for the background compaction
+from ...config import sync_settings as sys_s                      # Importing the delta sync settings
+import asyncio                                                    # Importing asyncio for the background compaction
 
 # NOTE: This class contains functions related to event management which will be used primarly in the API endpoints, but it may contain a few other functions as well 
 class EventService:
@@ -25,6 +32,34 @@ class EventService:
         # Return the next ID (last ID + 1), or 1 if no users exist yet  
         return (last_id or 0) + 1
     
+    
+    async def read_user_events_version(current_user: User, session: AsyncSession) -> tuple[datetime | None, int]:
+        """Gets the last modification timestamp and the amount of events of the current user with a single aggregate query (used for ETags)."""
+        
+        # Query the database for max(record_modification) and count(*) without loading any row
+        result = await session.exec(select(func.max(Event.record_modification), func.count(Event.id)).where(Event.user_id == current_user.id))
+        last_modification, amount = result.one()
+        
+        return last_modification, amount
+    
+    
+    async def read_user_event_modification(event_id: int, current_user: User, session: AsyncSession) -> datetime | None:
+        """Gets the last modification timestamp of an event of the current user, or None if it does not exist (used for ETags)."""
+        
+        # Query the database only for the modification timestamp column
+        result = await session.exec(select(Event.record_modification).where(
+                                                                                Event.id == event_id,
+                                                                                Event.user_id == current_user.id
+                                                                            ))
+        
+        return result.first()
+    
+    
+    def add_tombstone(db_event: Event, session: AsyncSession) -> None:
+        """Adds a tombstone of a deleted event to the session, so the delta sync can report the deletion."""
+        
+        session.add(EventTombstone(event_id=db_event.id, user_id=db_event.user_id, deletion=datetime.now()))
+    
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
     # CREATE METHODS #
     
@@ -56,6 +91,8 @@ class EventService:
 
         # Add the created event to the session
         session.add(db_event)
+        mark_stale(session, "events")
+        notify_event_change(session, db_event.user_id, "create", db_event.id, db_event.record_modification)
         return db_event
     
     # --------------------- #
@@ -86,6 +123,8 @@ class EventService:
 
         # Add the created event to the session
         session.add(db_event)
+        mark_stale(session, "events")
+        notify_event_change(session, db_event.user_id, "create", db_event.id, db_event.record_modification)
         return db_event
     
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
@@ -106,18 +145,51 @@ class EventService:
         
         return result.first()
     
-    async def read_all_user_events(current_user: User, session: AsyncSession, maxAmount: int) -> list[Event]:
-        """Retrieves all events for a the actual user from the database."""
+    async def read_all_user_events(current_user: User, session: AsyncSession, maxAmount: int, 
+                                   start: datetime | None = None, end: datetime | None = None) -> list[Event]:
+        """Retrieves all events for a the actual user from the database.
+           With a start and/or an end, only the events overlapping that window (uses the (user, start time) index)."""
         
         # Query the database for all events from a specific user with its ID
+        query = select(Event).where(Event.user_id == current_user.id)
+        
+        # An event overlaps the window if it starts before the window ends and ends after the window starts
+        if end is not None:
+            query = query.where(Event.start_date < end)
+        if start is not None:
+            query = query.where(Event.end_date > start)
+        
         if maxAmount is not None and maxAmount > 0:
-            result = await session.exec(select(Event).where(Event.user_id == current_user.id).limit(maxAmount))
+            result = await session.exec(query.limit(maxAmount))
         else:
-            result = await session.exec(select(Event).where(Event.user_id == current_user.id))
+            result = await session.exec(query)
             
         return result.all()
     
     
+    async def read_user_event_changes(since: datetime | None, current_user: User, session: AsyncSession) -> tuple[list[Event], list[int]]:
+        """Retrieves the events of the current user created or modified after a timestamp, and the IDs of the ones deleted after it.
+           Without a timestamp, retrieves every event (first sync)."""
+        
+        # Query the database for the modified events, using the (user, modification) index
+        query = select(Event).where(Event.user_id == current_user.id)
+        if since is None:
+            result = await session.exec(query)
+            return result.all(), []
+        
+        result = await session.exec(query.where(Event.record_modification > since).order_by(Event.record_modification))
+        changed = result.all()
+        
+        # Query the database for the tombstones, using the (user, deletion) index
+        result = await session.exec(select(EventTombstone.event_id).where(
+                                                                            EventTombstone.user_id == current_user.id,
+                                                                            EventTombstone.deletion > since
+                                                                        ))
+        
+        # An event deleted and then recreated with the same ID is reported in both lists (the deletions are applied first)
+        return changed, list(dict.fromkeys(result.all()))
+    
+    
     async def read_all_user_events_by_title(title: str, current_user: User, session: AsyncSession) -> list[Event] | None:
         """Retrieves all user events with a specific title from the database."""
     
@@ -216,6 +288,8 @@ class EventService:
         
         # Add the updated event to the session
         session.add(db_event)
+        mark_stale(session, "events")
+        notify_event_change(session, db_event.user_id, "update", db_event.id, db_event.record_modification)
         
         return db_event
     
@@ -261,6 +335,8 @@ class EventService:
         
         # Add the updated event to the session
         session.add(db_event)
+        mark_stale(session, "events")
+        notify_event_change(session, db_event.user_id, "update", db_event.id, db_event.record_modification)
         
         return db_event
     
@@ -279,8 +355,11 @@ class EventService:
         if not db_event:
             return False
 
-        # Delete the event
+        # Delete the event and leave its tombstone for the delta sync
         await session.delete(db_event)  
+        EventService.add_tombstone(db_event, session)
+        mark_stale(session, "events")
+        notify_event_change(session, db_event.user_id, "delete", db_event.id, datetime.now())
         
         return True
     
@@ -296,12 +375,49 @@ class EventService:
         if not db_event:
             return False
 
-        # Delete the event
+        # Delete the event and leave its tombstone for the delta sync
         await session.delete(db_event)  
+        EventService.add_tombstone(db_event, session)
+        mark_stale(session, "events")
+        notify_event_change(session, db_event.user_id, "delete", db_event.id, datetime.now())
         
         return True
     
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+    # COMPACTION METHODS #
+    
+    async def compact_tombstones(session: AsyncSession, batch_size: int) -> int:
+        """Deletes the tombstones older than the retention in batches, using the deletion index, and returns how many were deleted."""
+        
+        horizon = datetime.now() - timedelta(days=sys_s.SYNC_TOMBSTONE_RETENTION_DAYS)
+        total = 0
+        
+        while True:
+            old_ids = select(EventTombstone.id).where(EventTombstone.deletion < horizon).limit(batch_size)
+            result = await session.execute(delete(EventTombstone).where(EventTombstone.id.in_(old_ids)))
+            await session.commit()
+            
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
+    
+    
+    async def run_tombstone_compactor() -> None:
+        """Background loop which compacts the old tombstones periodically, started by the app lifespan."""
+        
+        while True:
+            try:
+                async with async_session() as session:
+                    deleted = await EventService.compact_tombstones(session, sys_s.SYNC_COMPACTION_BATCH_SIZE)
+                    if deleted:
+                        print(f"Event tombstones compacted: {deleted}")
+            
+            except Exception as e:
+                print(f"Error compacting event tombstones: {e}")
+            
+            await asyncio.sleep(sys_s.SYNC_COMPACTION_INTERVAL_SECONDS)
+    
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
 # Creates a single instance of EventService to use throughout the app
 event_Service = EventService()
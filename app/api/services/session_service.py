@@ -0,0 +1,228 @@
+# app/backend/services/session_service.py
+
+# Import necessary modules
+from ...db.models.session.model import UserSession                   # Importing the DB UserSession model
+from ...db.models.user.model import User                              # Importing the DB User model
+from sqlmodel import select                                           # Importing SQLModel for database operations
+from sqlalchemy import delete, event                                  # Importing delete for bulk deletes and event for the session hooks
+from sqlalchemy.orm import Session                                    # Importing Session to listen to every ORM session
+from sqlmodel.ext.asyncio.session import AsyncSession                 # Importing AsyncSession for asynchronous database operations
+from datetime import datetime, timedelta                              # Importing for timestamps management
+from collections import OrderedDict                                   # Importing OrderedDict for the LRU session cache
+from ...db.db_handler import async_session                            # Importing the session factory for the background sweeper
+from ...config import auth_settings as auths                          # Importing authentication settings
+from ..utils.change_broker import change_broker                       # Importing the change broker to drop the cached sessions in every worker
+import asyncio                                                        # Importing asyncio for the background sweeper
+import hashlib                                                        # Importing hashlib to store a digest of the session ID
+import secrets                                                        # Importing secrets to generate opaque session IDs
+import time                                                           # Importing time for the cache TTL
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: In-memory read-through cache of the validated sessions: {session_id cookie: (user, expiration, cached_at)}
+        # The cached user is a detached copy, so validating a session is a dictionary hit instead of a digest lookup plus an user query.
+        # Revocations are spread to the other workers by the change broker; entries are still only trusted for SESSION_CACHE_TTL_SECONDS,
+        # which bounds how long a revoked session stays usable if a notification is lost.
+_session_cache: "OrderedDict[str, tuple[User, datetime, float]]" = OrderedDict()
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class contains functions related to server-side sessions management, used by the "session" auth backend
+class SessionService:
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+    # AUXILIARY METHODS #
+
+    def digest_session_id(session_id: str) -> str:
+        """ Returns the SHA-256 digest of a session ID, which is the value stored in the database. """
+
+        return hashlib.sha256(session_id.encode()).hexdigest()
+
+
+    def _cache_session(session_id: str, user: User, expiration: datetime) -> None:
+        """ Stores a detached copy of the user of a session in the cache, evicting the least recently used entries. """
+
+        cached_user = User(id=user.id, nickname=user.nickname, record_creation=user.record_creation, record_modification=user.record_modification)
+
+        _session_cache[session_id] = (cached_user, expiration, time.monotonic())
+        _session_cache.move_to_end(session_id)
+
+        while len(_session_cache) > auths.SESSION_CACHE_SIZE:
+            _session_cache.popitem(last=False)
+
+
+    def invalidate_user_cache(user_id: int, session: AsyncSession | None = None) -> None:
+        """ Removes every cached session of an user (logout everywhere, user updated or deleted).
+            If the database session is provided, the other workers drop them too when it commits. """
+
+        for session_id in [sid for sid, (user, _, _) in _session_cache.items() if user.id == user_id]:
+            del _session_cache[session_id]
+
+        if session is not None:
+            session.sync_session.info.setdefault("stale_sessions", set()).add(user_id)
+
+
+    def _apply_remote_invalidation(user_ids: list[int]) -> None:
+        """ Drops the cached sessions of the users changed by another worker. """
+
+        for user_id in user_ids:
+            SessionService.invalidate_user_cache(user_id)
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+    # CREATE METHODS #
+
+    async def create_session(user: User, session: AsyncSession) -> str:
+        """ Creates a new session for the user in the database and returns the opaque session ID for the cookie. """
+
+        # Generates an opaque and unguessable session ID
+        session_id = secrets.token_urlsafe(32)
+        expiration = datetime.now() + timedelta(days=auths.SESSION_EXPIRE_DAYS)
+
+        db_session = UserSession(
+                                    id=SessionService.digest_session_id(session_id),
+                                    user_id=user.id,
+                                    expiration=expiration,
+                                    record_creation=datetime.now()
+                                )
+
+        # Add the created session to the session and warms up the cache
+        session.add(db_session)
+        SessionService._cache_session(session_id, user, expiration)
+
+        return session_id
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+    # READ METHODS #
+
+    async def read_session_user(session_id: str, session: AsyncSession) -> User | None:
+        """ Validates a session ID and returns its user, reading through the in-memory cache. """
+
+        now = datetime.now()
+
+        # Cache hit: no database access
+        cached = _session_cache.get(session_id)
+        if cached:
+            user, expiration, cached_at = cached
+            if expiration > now and time.monotonic() - cached_at < auths.SESSION_CACHE_TTL_SECONDS:
+                _session_cache.move_to_end(session_id)
+                return user
+            del _session_cache[session_id]
+
+        # Cache miss: reads the session and its user with a single query
+        result = await session.exec(select(UserSession, User)
+                                    .join(User, User.id == UserSession.user_id)
+                                    .where(
+                                                UserSession.id == SessionService.digest_session_id(session_id),
+                                                UserSession.expiration > now
+                                            ))
+        row = result.first()
+        if not row:
+            return None
+
+        db_session, user = row
+        SessionService._cache_session(session_id, user, db_session.expiration)
+
+        return user
+
+
+    async def read_user_sessions(user_id: int, session: AsyncSession) -> list[UserSession]:
+        """ Retrieves all the active sessions of an user from the database. """
+
+        result = await session.exec(select(UserSession).where(
+                                                                UserSession.user_id == user_id,
+                                                                UserSession.expiration > datetime.now()
+                                                            ).order_by(UserSession.record_creation.desc()))
+
+        return result.all()
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+    # DELETE METHODS #
+
+    async def delete_session(session_id: str, session: AsyncSession) -> bool:
+        """ Deletes a session from the database by its cookie value (logout). """
+
+        _session_cache.pop(session_id, None)
+
+        result = await session.execute(delete(UserSession)
+                                       .where(UserSession.id == SessionService.digest_session_id(session_id))
+                                       .returning(UserSession.user_id))
+        user_id = result.scalar_one_or_none()
+
+        # The other workers cache it by the cookie value, which is never sent, so they drop every cached session of the user
+        if user_id is not None:
+            SessionService.invalidate_user_cache(user_id, session)
+
+        return user_id is not None
+
+
+    async def delete_user_session_by_id(digest: str, user_id: int, session: AsyncSession) -> bool:
+        """ Deletes a session of an user from the database by its stored ID (revocation from the sessions list). """
+
+        result = await session.execute(delete(UserSession).where(
+                                                                    UserSession.id == digest,
+                                                                    UserSession.user_id == user_id
+                                                                ))
+
+        # The cache is keyed by the cookie value, so every cached session of the user is dropped
+        SessionService.invalidate_user_cache(user_id, session)
+
+        return result.rowcount > 0
+
+
+    async def delete_user_sessions(user_id: int, session: AsyncSession) -> int:
+        """ Deletes every session of an user from the database (logout everywhere) and returns how many were deleted. """
+
+        SessionService.invalidate_user_cache(user_id, session)
+
+        result = await session.execute(delete(UserSession).where(UserSession.user_id == user_id))
+
+        return result.rowcount
+
+
+    async def sweep_expired_sessions(session: AsyncSession, batch_size: int) -> int:
+        """ Deletes the expired sessions in batches, using the expiration index, and returns how many were deleted. """
+
+        total = 0
+
+        while True:
+            expired_ids = select(UserSession.id).where(UserSession.expiration <= datetime.now()).limit(batch_size)
+            result = await session.execute(delete(UserSession).where(UserSession.id.in_(expired_ids)))
+            await session.commit()
+
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
+
+
+    async def run_expiry_sweeper() -> None:
+        """ Background loop which sweeps the expired sessions periodically, started by the app lifespan. """
+
+        while True:
+            try:
+                async with async_session() as session:
+                    deleted = await SessionService.sweep_expired_sessions(session, auths.SESSION_SWEEP_BATCH_SIZE)
+                    if deleted:
+                        print(f"Expired sessions swept: {deleted}")
+
+            except Exception as e:
+                print(f"Error sweeping expired sessions: {e}")
+
+            await asyncio.sleep(auths.SESSION_SWEEP_INTERVAL_SECONDS)
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# The revoked sessions were already dropped locally and sent by the broker before the commit, so they are cleared once the session ends
+@event.listens_for(Session, "after_commit")
+def _clear_after_commit(sync_session: Session) -> None:
+    sync_session.info.pop("stale_sessions", None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(sync_session: Session) -> None:
+    sync_session.info.pop("stale_sessions", None)
+
+# The sessions revoked or changed by the other workers are dropped from the cache, or the whole cache if some changes were missed
+change_broker.register("stale_sessions", SessionService._apply_remote_invalidation, _session_cache.clear)
+
+# Creates a single instance of SessionService to use throughout the app
+session_Service = SessionService()
@@ -3,11 +3,19 @@
 # Import necessary modules
 from ...db.models.user.model import User                              # Importing the DB User model
 from sqlmodel import select                                       # Importing SQLModel for database operations
+from sqlalchemy import update                                     # Importing update for the conditional rehash write
 from sqlmodel.ext.asyncio.session import AsyncSession             # Importing AsyncSession for asynchronous database operations
 from datetime import datetime                                     # Importing for timestamps management
+import asyncio                                                    # Importing asyncio for background tasks and thread offloading
 from ..utils.hashing import hash_handler as hh                    # Importing for password hashing management
 from ..utils.jwt import jwt_handler as jwt                        # Importing for JWT token management
 from ...db.models.user.DTOs import UserCreate, UserUpdate             # Importing DTOs for user input/output validation and transformation
+from ...db.db_handler import async_session                         # Importing the session factory for background tasks
+from .session_service import SessionService as ss                 # Importing the SessionService to invalidate cached sessions
+from ..utils.response_cache import mark_stale                     # Importing mark_stale to invalidate the cached responses on writes
+
+# Keeps a strong reference to the background tasks so they are not garbage collected before finishing
+_background_tasks: set[asyncio.Task] = set()
 
 # NOTE: This class contains functions related to user management which will be used primarly in the API endpoints, but it may contain a few other functions as well 
 class UserService:
@@ -24,6 +32,26 @@ class UserService:
         
         # Return the next ID (last ID + 1), or 1 if no users exist yet
         return (last_id or 0) + 1
+    
+    
+    async def rehash_user_password(user_id: int, password: str, old_hash: str) -> None:
+        """ Upgrades the stored password hash of an user to the current argon2 cost profile.
+            It runs in the background after a successful login, so it uses its own database session.
+            The hash is only replaced if it is still the one verified at login, so a password changed meanwhile is kept. """
+        
+        try:
+            # Hashes the password in a worker thread so the event loop is not blocked
+            new_hash = await asyncio.to_thread(hh.hash_password, password)
+            
+            # The modification timestamp is not updated, as the password itself did not change
+            async with async_session() as session:
+                await session.execute(update(User)
+                                      .where(User.id == user_id, User.hashed_password == old_hash)
+                                      .values(hashed_password=new_hash))
+                await session.commit()
+                
+        except Exception as e:
+            print(f"Error rehashing password for user {user_id}: {e}")
 
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
     # CREATE METHODS #
@@ -34,17 +62,21 @@ class UserService:
         # Gets the next ID for the new user
         new_id = await UserService.get_next_user_id(session)
         
+        # Hashes the password in a worker thread so the event loop is not blocked
+        hashed_password = await asyncio.to_thread(hh.hash_password, userToCreate.password)
+        
         # Creates a new User model instance with provided data and hashed password
         db_user = User(
                             id=new_id,                                                  # Assign new user ID
                             nickname=userToCreate.nickname,                             # Set user nickname
-                            hashed_password=hh.hash_password(userToCreate.password),    # Hash the password securely
+                            hashed_password=hashed_password,                            # Set the securely hashed password
                             record_creation=datetime.now(),                             # Set creation timestamp to now
                             record_modification=datetime.now()                          # Set modification timestamp to now
                         )
         
         # Add the created user to the session
         session.add(db_user)
+        mark_stale(session, "users")
         
         return db_user
     
@@ -99,12 +131,12 @@ class UserService:
             user.nickname = user_to_update.nickname
             updated = True
         
-        # Updates password if it's provided and different from the existing one
+        # Updates password if it's provided and different from the existing one (verified and hashed in worker threads)
         if user_to_update.password:
-            if not hh.verify_password(user_to_update.password, user.hashed_password):
+            if not await asyncio.to_thread(hh.verify_password, user_to_update.password, user.hashed_password):
                 
                 # Hash the new password
-                user.hashed_password = hh.hash_password(user_to_update.password)
+                user.hashed_password = await asyncio.to_thread(hh.hash_password, user_to_update.password)
                 updated = True
         
         # If no fields were updated, return user with False
@@ -113,9 +145,13 @@ class UserService:
         
         # If update happened, updates modification timestamp and save the changes
         user.record_modification = datetime.now()
+        
+        # The cached sessions hold a copy of the user, so they are dropped to pick up the changes
+        ss.invalidate_user_cache(user.id, session)
 
         # Add the created user to the session
         session.add(user)
+        mark_stale(session, "users")
         
         return user, updated
     
@@ -133,6 +169,10 @@ class UserService:
             return False
         
         await session.delete(user_to_delete)
+        mark_stale(session, "users", "events")
+        
+        # The sessions rows are deleted by the database (cascade), but the cached ones must be dropped too
+        ss.invalidate_user_cache(user_id, session)
         
         return True
     
@@ -149,9 +189,15 @@ class UserService:
         if not user_to_authenticate:
             return None
         
-        # Verify that the provided password matches the stored password hash
-        if not hh.verify_password(password, user_to_authenticate.hashed_password):
+        # Verify that the provided password matches the stored password hash, in a worker thread so the event loop is not blocked
+        if not await asyncio.to_thread(hh.verify_password, password, user_to_authenticate.hashed_password):
             return None
+        
+        # If the stored hash was created with an outdated cost profile, upgrades it in the background
+        if hh.needs_rehash(user_to_authenticate.hashed_password):
+            task = asyncio.create_task(UserService.rehash_user_password(user_to_authenticate.id, password, user_to_authenticate.hashed_password))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
     
         # Return the user if credentials are valid
         return user_to_authenticate
@@ -169,10 +215,16 @@ class UserService:
         if not user_to_login:
             return None
         
+        return UserService.create_user_tokens(user_to_login)
+    
+    
+    def create_user_tokens(user: User) -> dict[str, str]:
+        """ Generates and returns a pair of JWT tokens (access and refresh) for an already authenticated user """
+        
         # Prepare data to encode in the token
         token_data = {
-            "sub": str(user_to_login.id),
-            "nickname": user_to_login.nickname
+            "sub": str(user.id),
+            "nickname": user.nickname
         }
         
         # Creates access and refresh tokens with the token data which contains the user ID and nickname as claims to be used for authentication by middleware
@@ -0,0 +1,194 @@
+# app/backend/utils/change_broker.py
+
+# Import necessary modules
+import asyncio                                                      # Importing asyncio for the listener task
+import json                                                         # Importing json to serialize the change payloads
+import os                                                           # Importing os to identify the worker
+import uuid                                                         # Importing uuid to identify the worker
+from abc import ABC, abstractmethod                                 # Importing ABC and abstractmethod for the broker backends
+from typing import Any, Callable, Optional                          # Importing typing helpers for type hints
+from sqlalchemy import event, text                                  # Importing event and text to send the NOTIFY inside the transactions
+from sqlalchemy.orm import Session                                  # Importing Session to listen to every ORM session
+from ...db.db_handler import get_engine                             # Importing the engine to hold the listening connection
+from ...config import change_broker_settings as cbs                 # Importing the change broker settings
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class spreads the committed changes of a worker to the other workers, so their in-process state stays in sync.
+        # Every in-process consumer (response cache, WebSocket hub, sessions cache) registers the key it writes in the session info
+        # ("stale_cache", "pending_notifications"...) with a function to apply a remote change and another one to reset its state.
+        # Before a session commits, the pending values of those keys are sent as a single compact payload; each worker applies its
+        # own changes locally after the commit, so it ignores the payloads it sent.
+class ChangeBroker(ABC):
+
+    def __init__(self):
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+        # {info key: (apply, reset)}
+        self._consumers: dict[str, tuple[Callable[[Any], None], Callable[[], None]]] = {}
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Registers an in-process consumer of the changes written in the session info under a key
+    def register(self, info_key: str, apply: Callable[[Any], None], reset: Callable[[], None]) -> None:
+        self._consumers[info_key] = (apply, reset)
+
+    # Builds the payloads of the pending changes of a session, or a reset one if they do not fit in a single NOTIFY
+    def build_payloads(self, sync_session: Session) -> list[str]:
+        changes = {key: list(sync_session.info[key]) for key in self._consumers if sync_session.info.get(key)}
+        if not changes:
+            return []
+
+        payload = json.dumps({"w": self.worker_id, "c": changes}, separators=(",", ":"), default=str)
+        if len(payload.encode("utf-8")) <= MAX_PAYLOAD_BYTES:
+            return [payload]
+
+        # Too many changes for a single payload: the other workers reset their state instead
+        return [json.dumps({"w": self.worker_id, "reset": True}, separators=(",", ":"))]
+
+    # Applies a payload sent by another worker
+    def dispatch(self, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+        except ValueError:
+            return
+
+        if change.get("w") == self.worker_id:
+            return
+
+        if change.get("reset"):
+            self.reset()
+            return
+
+        for key, values in change.get("c", {}).items():
+            consumer = self._consumers.get(key)
+            if consumer:
+                consumer[0](values)
+
+    # Resets every consumer, when some changes may have been missed (listener reconnection, oversized payload)
+    def reset(self) -> None:
+        for _, reset in self._consumers.values():
+            reset()
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Sends the payloads of a committing session (called from the "before_commit" event)
+    @abstractmethod
+    def publish(self, sync_session: Session, payloads: list[str]) -> None:
+        ...
+
+    # Receives the payloads of the other workers until cancelled (runs as a background task during the app lifespan)
+    @abstractmethod
+    async def run(self) -> None:
+        ...
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class sends the changes with PostgreSQL NOTIFY and receives them with LISTEN on one dedicated connection of the engine.
+        # The NOTIFY is executed inside the committing transaction, so PostgreSQL only delivers it if the transaction commits.
+class PostgresChangeBroker(ChangeBroker):
+
+    def __init__(self, channel: str, retry_seconds: float):
+        super().__init__()
+        self.channel = channel
+        self.retry_seconds = retry_seconds
+
+    def publish(self, sync_session: Session, payloads: list[str]) -> None:
+        for payload in payloads:
+            sync_session.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload})
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        self.dispatch(payload)
+
+    async def run(self) -> None:
+        reconnecting = False
+
+        while True:
+            try:
+                # Holds one connection of the pool for the whole life of the worker
+                async with get_engine().connect() as conn:
+                    raw_connection = await conn.get_raw_connection()
+                    driver_connection = raw_connection.driver_connection
+                    connection_lost = asyncio.Event()
+
+                    driver_connection.add_termination_listener(lambda _: connection_lost.set())
+                    await driver_connection.add_listener(self.channel, self._on_notification)
+
+                    # The notifications sent while the listener was down are lost
+                    if reconnecting:
+                        self.reset()
+
+                    try:
+                        await connection_lost.wait()
+                    finally:
+                        if not driver_connection.is_closed():
+                            await driver_connection.remove_listener(self.channel, self._on_notification)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Change listener error: {e}")
+
+            reconnecting = True
+            await asyncio.sleep(self.retry_seconds)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class sends the changes to the other brokers of the same process, so the fan-out can run in tests without PostgreSQL.
+        # There is no transaction to hold the payloads, so they are kept in the session and delivered after the commit.
+class MemoryChangeBroker(ChangeBroker):
+
+    # Brokers currently running in the process, each one acting as a worker
+    _bus: list["MemoryChangeBroker"] = []
+
+    def publish(self, sync_session: Session, payloads: list[str]) -> None:
+        sync_session.info.setdefault("broker_outbox", []).extend(payloads)
+
+    @staticmethod
+    def deliver(payloads: list[str]) -> None:
+        for broker in list(MemoryChangeBroker._bus):
+            for payload in payloads:
+                broker.dispatch(payload)
+
+    async def run(self) -> None:
+        MemoryChangeBroker._bus.append(self)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            MemoryChangeBroker._bus.remove(self)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+@event.listens_for(Session, "before_commit")
+def _publish_before_commit(sync_session: Session) -> None:
+    payloads = change_broker.build_payloads(sync_session)
+    if payloads:
+        change_broker.publish(sync_session, payloads)
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_after_commit(sync_session: Session) -> None:
+    payloads = sync_session.info.pop("broker_outbox", None)
+    if payloads:
+        MemoryChangeBroker.deliver(payloads)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(sync_session: Session) -> None:
+    sync_session.info.pop("broker_outbox", None)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Creates the change broker of the configured backend: "postgres" (LISTEN/NOTIFY) or "memory" (single process, tests)
+def create_change_broker(backend: Optional[str] = None) -> ChangeBroker:
+    backend = (backend or cbs.CHANGE_BROKER).lower()
+    if backend == "memory":
+        return MemoryChangeBroker()
+    return PostgresChangeBroker(cbs.CHANGE_BROKER_CHANNEL, cbs.CHANGE_BROKER_RETRY_SECONDS)
+
+
+# Create an instance of the change broker to use throughout the app
+change_broker = create_change_broker()
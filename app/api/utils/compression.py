@@ -0,0 +1,217 @@
+# backend/utils/compression.py
+
+# Import necessary modules
+import zlib                                                     # Importing zlib for gzip compression (always available)
+from fastapi import FastAPI                                     # Importing FastAPI
+from ...config import compression_settings as cps               # Importing the response compression settings
+
+# Optional encoders, only negotiated if the packages are installed
+try:
+    import brotli                                               # Importing brotli for 'br' compression
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard                                            # Importing zstandard for 'zstd' compression
+except ImportError:
+    zstandard = None
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Content types worth compressing, the rest (images, already compressed files...) are sent as they are
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+# Compressible content types sent as they are anyway: server-sent events are read as they arrive, so they are never held by a compressor
+EXCLUDED_TYPES = ("text/event-stream",)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: These classes wrap the streaming compressors of every encoding with the same interface (compress + sync_flush + flush).
+        # sync_flush returns everything compressed so far without ending the stream, so the client can decode each chunk as it arrives.
+class GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)    # wbits=31 writes the gzip header and trailer
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def sync_flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def sync_flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def sync_flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Gets the available encodings, in order of server preference
+def available_encodings() -> list[str]:
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+# Creates a new streaming encoder for an encoding with the configured level
+def new_encoder(encoding: str) -> GzipEncoder | BrotliEncoder | ZstdEncoder:
+    if encoding == "zstd":
+        return ZstdEncoder(cps.COMPRESSION_ZSTD_LEVEL)
+    if encoding == "br":
+        return BrotliEncoder(cps.COMPRESSION_BROTLI_QUALITY)
+    return GzipEncoder(cps.COMPRESSION_GZIP_LEVEL)
+
+
+# Chooses the encoding from the Accept-Encoding header, or None if the client does not accept any of the available ones
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in available_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+
+    return None
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class is a pure ASGI middleware which compresses the HTTP responses.
+        # It is streaming-compatible: a body sent in one message is only compressed if it reaches the size threshold, a streamed body is
+        # compressed from its first chunk and every chunk is flushed as it arrives, so the client never waits for the end of the stream.
+        # Responses already encoded, not compressible (or server-sent events) or smaller than the threshold are sent untouched.
+class CompressionMiddleware:
+
+    def __init__(self, app, minimum_size: int = cps.COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {key.lower(): value for key, value in scope.get("headers", [])}
+        encoding = negotiate_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressedResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressedResponder:
+
+    def __init__(self, app, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = None
+        self.start_message = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message):
+        message_type = message["type"]
+
+        # The start message is held until we know if the body will be compressed
+        if message_type == "http.response.start":
+            self.start_message = message
+            headers = {key.lower(): value for key, value in message.get("headers", [])}
+            content_type = headers.get(b"content-type", b"").decode("latin-1")
+
+            self.passthrough = (
+                                    b"content-encoding" in headers
+                                    or message["status"] in (204, 304)
+                                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                                    or content_type.startswith(EXCLUDED_TYPES)
+                                )
+            if self.passthrough:
+                await self.send(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        # Already compressing: compresses every chunk as it arrives
+        if self.encoder is not None:
+            await self.send({"type": "http.response.body", "body": self._compress(body, more_body), "more_body": more_body})
+            return
+
+        # The whole body under the threshold: sent uncompressed
+        if not more_body and len(body) < self.minimum_size:
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": body, "more_body": False})
+            return
+
+        # Over the threshold or streamed: starts compressing, the length is not known anymore if the body is streamed
+        self.encoder = new_encoder(self.encoding)
+        data = self._compress(body, more_body)
+
+        vary = [value for key, value in self.start_message.get("headers", []) if key.lower() == b"vary"]
+        headers = [(key, value) for key, value in self.start_message.get("headers", []) if key.lower() not in (b"content-length", b"vary")]
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        headers.append((b"vary", b", ".join(vary + [b"Accept-Encoding"])))
+        if not more_body:
+            headers.append((b"content-length", str(len(data)).encode("latin-1")))
+
+        await self.send({**self.start_message, "headers": headers})
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    # Compresses a chunk, flushed so the client can decode it at once, or ending the stream if it is the last one
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        data = self.encoder.compress(body)
+        return data + (self.encoder.sync_flush() if more_body else self.encoder.flush())
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This function is used to configure the response compression for the FastAPI application.
+def setup_compression(app: FastAPI):
+    """ Configure the compression middleware for FastAPI app based on env vars: COMPRESSION_MIN_SIZE and the per-encoding levels."""
+
+    app.add_middleware(CompressionMiddleware, minimum_size=cps.COMPRESSION_MIN_SIZE)
@@ -0,0 +1,52 @@
+# app/backend/utils/etag.py
+
+# Import necessary modules
+from datetime import datetime                           # Importing datetime for the modification timestamps
+from fastapi import Request, Response, status           # Importing FastAPI components for the conditional responses
+from typing import Optional                             # Importing Optional for type hints
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: Helpers for conditional GET requests with weak ETags.
+        # The ETags are built from cheap values (modification timestamps, row counts), so they can be checked before any row is loaded or serialized.
+
+def make_weak_etag(last_modification: Optional[datetime], *parts) -> str:
+    """ Builds a weak ETag from a modification timestamp and any other values that change the response (row count, query parameters) """
+
+    timestamp = int(last_modification.timestamp() * 1_000_000) if last_modification else 0
+    return 'W/"' + "-".join(str(part) for part in (timestamp, *parts)) + '"'
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """ Checks if the If-None-Match header of the request matches the ETag (weak comparison) """
+
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # Weak comparison: the W/ prefix is ignored on both sides
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def not_modified_response(response: Response, etag: str) -> Response:
+    """ Returns an empty 304 Not Modified response with the ETag and the headers set on the injected response (e.g. the refreshed auth cookies),
+        which FastAPI drops when an endpoint returns its own response """
+
+    not_modified = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    not_modified.raw_headers.extend(header for header in response.raw_headers if header[0] != b"content-length")
+    set_etag_headers(not_modified, etag)
+    return not_modified
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """ Sets the ETag on a full response, so the client revalidates it on every request """
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
@@ -0,0 +1,91 @@
+# app/backend/utils/hash_calibration.py
+
+# NOTE: Calibration command for the argon2 cost parameters.
+        # It benchmarks this host and suggests the parameters which hit a target verify latency, printed as environment variables.
+        # Usage: python -m app.api.utils.hash_calibration --target-ms 250 [--parallelism 4] [--max-memory 262144]
+
+# Import necessary modules
+import argparse                                                          # Importing argparse to parse the command line arguments
+import statistics                                                        # Importing statistics to get the median of the samples
+import time                                                              # Importing time for measuring the verify latency
+from argon2 import PasswordHasher                                        # Importing PasswordHasher to benchmark the parameters
+from ...config import hashing_settings as hs                             # Importing hashing settings (argon2 cost profiles)
+
+# Memory costs (KiB) that are tried, from the OWASP minimum up to 1 GiB
+MEMORY_CANDIDATES = [19456, 32768, 65536, 131072, 262144, 524288, 1048576]
+
+# Maximum time cost tried for each memory cost
+MAX_TIME_COST = 10
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def measure_verify_ms(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    """ Returns the median verify latency in milliseconds for the given argon2 parameters """
+
+    ph = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    hashed = ph.hash("calibration-password")
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        ph.verify(hashed, "calibration-password")
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def calibrate(target_ms: float, parallelism: int, max_memory: int, samples: int) -> dict[str, int | float] | None:
+    """ Benchmarks the host and returns the parameters whose verify latency is closest to the target.
+        Higher memory costs are preferred on ties, as they make the hashes harder to crack with GPUs. """
+
+    best = None
+
+    for memory_cost in [m for m in MEMORY_CANDIDATES if m <= max_memory]:
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            elapsed = measure_verify_ms(time_cost, memory_cost, parallelism, samples)
+            print(f"  time_cost={time_cost:<3} memory_cost={memory_cost:<8} parallelism={parallelism:<3} -> {elapsed:8.1f} ms")
+
+            candidate = {"time_cost": time_cost, "memory_cost": memory_cost, "parallelism": parallelism, "verify_ms": elapsed}
+            if best is None or abs(elapsed - target_ms) <= abs(best["verify_ms"] - target_ms):
+                best = candidate
+
+            # Higher time costs for this memory cost will only be slower
+            if elapsed >= target_ms:
+                break
+
+        # With time_cost=1 over the target, higher memory costs will only be slower
+        if time_cost == 1 and elapsed >= target_ms:
+            break
+
+    return best
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def main() -> None:
+    current = hs.hash_params
+
+    parser = argparse.ArgumentParser(description="Benchmark this host and suggest argon2 parameters for a target verify latency.")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Target verify latency in milliseconds (default: 250)")
+    parser.add_argument("--parallelism", type=int, default=current["parallelism"], help="Argon2 lanes (default: current profile)")
+    parser.add_argument("--max-memory", type=int, default=262144, help="Maximum memory cost in KiB (default: 262144, 256 MiB)")
+    parser.add_argument("--samples", type=int, default=5, help="Verify samples per parameter set (default: 5)")
+    args = parser.parse_args()
+
+    print(f"Current profile '{hs.HASH_PROFILE}': {current}")
+    print(f"Calibrating for a target verify latency of {args.target_ms:.0f} ms...")
+
+    best = calibrate(args.target_ms, args.parallelism, args.max_memory, args.samples)
+    if best is None:
+        print("No parameters could be benchmarked, check --max-memory.")
+        return
+
+    print(f"\nSuggested parameters ({best['verify_ms']:.1f} ms per verify):")
+    print(f"HASH_TIME_COST={best['time_cost']}")
+    print(f"HASH_MEMORY_COST={best['memory_cost']}")
+    print(f"HASH_PARALLELISM={best['parallelism']}")
+    print("\nExisting hashes will be upgraded transparently on the next successful login of each user.")
+
+
+if __name__ == "__main__":
+    main()
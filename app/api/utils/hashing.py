@@ -1,31 +1,82 @@
 # app/backend/utils/hashing.py
 
 # Import necessary modules
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+import threading                                                        # Importing threading to count the operations of the worker threads
+import time                                                             # Importing time for measuring the operations
+from contextlib import contextmanager                                   # Importing contextmanager to track every operation
+from typing import Any, Optional                                        # Importing Any and Optional for type hints
+from ...config import hashing_settings as hs                            # Importing hashing settings (argon2 cost profiles)
 
-# NOTE: This class handles password hashing and verification 
+# NOTE: This class handles password hashing and verification.
+        # argon2 is imported and the hasher is built on the first hash or verify, so importing the app does not load it.
+        # The services call it through asyncio.to_thread, so argon2 never blocks the event loop. It counts the hashes and verifies
+        # running in the worker threads (see /metrics), the ones done and their total time.
 class HashHandler:
 
-    def __init__(self):
-        # Initialize the password hashing context
-        self.ph = PasswordHasher()
+    def __init__(self, params: Optional[dict[str, int]] = None):
+        # The password hashing context uses the configured cost profile
+        self.params = params or hs.hash_params
+        self._ph: Any = None
+
+        # Operations statistics, updated from the worker threads
+        self._stats_lock = threading.Lock()
+        self.in_progress = 0
+        self.operations_total = {"hash": 0, "verify": 0}
+        self.seconds_total = {"hash": 0.0, "verify": 0.0}
+
+    # Returns the password hashing context, creating it on first use
+    @property
+    def ph(self):
+        if self._ph is None:
+            from argon2 import PasswordHasher
+            self._ph = PasswordHasher(**self.params)
+        return self._ph
+
+    # Counts an operation while it runs, then its time
+    @contextmanager
+    def _track(self, operation: str):
+        with self._stats_lock:
+            self.in_progress += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self.in_progress -= 1
+                self.operations_total[operation] += 1
+                self.seconds_total[operation] += elapsed
 
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
     # Hash a plain password using argon2
     def hash_password(self, password: str) -> str:
-        return self.ph.hash(password)
+        with self._track("hash"):
+            return self.ph.hash(password)
 
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
     # Verifies a plain password against a hashed password
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        from argon2.exceptions import VerifyMismatchError
+
+        with self._track("verify"):
+            try:
+                return self.ph.verify(hashed_password, plain_password)
+            except VerifyMismatchError:
+                return False
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Checks if a hashed password was created with parameters different from the current profile, so it should be upgraded
+    def needs_rehash(self, hashed_password: str) -> bool:
+        from argon2.exceptions import InvalidHashError
+
         try:
-            return self.ph.verify(hashed_password, plain_password)
-        except VerifyMismatchError:
-            return False
-    
+            return self.ph.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return True
+
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
@@ -1,11 +1,11 @@
 # app/backend/utils/jwt.py
 
 # Import necessary modules
-from datetime import datetime, timedelta                # Importing datetime and timedelta for working with dates
+from datetime import datetime, timedelta, timezone      # Importing datetime, timedelta and timezone for working with dates
 from fastapi import HTTPException                       # Importing HTTPException for error handling
-from jose import jwt, JWTError, ExpiredSignatureError   # Importing JWTError for handling JWT decoding errors
 from typing import Optional, Dict, Any                  # Importing Optional, Dict, and Any for type hints
 import os                                               # Importing os for accessing environment variables
+import time                                             # Importing time for checking the remaining lifetime of the tokens
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
@@ -27,7 +27,9 @@ REFRESH_TOKEN_EXPIRE_DAYS = 7
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
-# NOTE: This class handles JWT creation and decoding
+# NOTE: This class handles JWT creation and decoding.
+        # python-jose is imported on the first token operation, so importing the app does not load it. The decoding errors are
+        # always raised as HTTPException, so the callers never need to import the python-jose exceptions either.
 class JWTHandler:
     def __init__(self):
         self.secret_key = SECRET_KEY
@@ -40,11 +42,14 @@ class JWTHandler:
     # Function to create a JWT with the given data and expiration time
     def create_jwt(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         
+        from jose import jwt
+
         # Creates a copy of the data to encode, set the expiration time, and encode the data into a JWT
         to_encode = data.copy()
         
         # Sets the expiration time for the token, defaulting to ACCESS_TOKEN_EXPIRE_MINUTES if not provided
-        expire = datetime.now() + (expires_delta or timedelta(minutes=self.access_token_expire_minutes))
+        # NOTE: The expiration is built as an aware UTC datetime, because python-jose treats naive datetimes as UTC
+        expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=self.access_token_expire_minutes))
         
         # Updates the data with the expiration time
         to_encode.update({"exp": expire})
@@ -59,6 +64,8 @@ class JWTHandler:
 
     # Function to decode a JWT and return the payload
     def decode_jwt(self, token: str) -> Dict[str, Any]:
+        from jose import jwt, JWTError, ExpiredSignatureError
+
         try:
             
             # Decodes the JWT using the secret key and algorithm, then returns the payload
@@ -75,6 +82,12 @@ class JWTHandler:
         
     # ---------------------------------------------------------------------------------------------------------------------------------------------------- #   
 
+    # Function to get the remaining lifetime in seconds of an already decoded token
+    def seconds_until_expiry(self, payload: Dict[str, Any]) -> float:
+        return float(payload.get("exp", 0)) - time.time()
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #   
+
     # Function to create an access token directly
     def create_access_token(self, data: Dict[str, Any]) -> str:
         return self.create_jwt(data)
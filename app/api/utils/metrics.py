@@ -0,0 +1,193 @@
+# app/backend/utils/metrics.py
+
+# Import necessary modules
+import time                                                     # Importing time for measuring the requests
+from bisect import bisect_left                                  # Importing bisect_left to find the histogram bucket of a value
+from fastapi import FastAPI                                     # Importing FastAPI
+from ...config import metrics_settings as ms                    # Importing the metrics settings (buckets)
+from ...db.db_handler import get_pool_stats                     # Importing the connection pool statistics
+from .hashing import hash_handler                               # Importing the password hasher (operations in progress)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Route label of the requests which did not match any route (so unknown paths do not create new series)
+UNMATCHED_ROUTE = "unmatched"
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class is a cumulative histogram with fixed buckets (the last one is +Inf).
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: list[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    # Returns the (upper bound, cumulative count) pairs, as exposed by Prometheus
+    def cumulative(self) -> list[tuple[str, int]]:
+        pairs, total = [], 0
+        for bound, count in zip([*map(_format_value, self.bounds), "+Inf"], self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class keeps the HTTP metrics of the process, by method and route template (never the raw path).
+        # Everything runs in the event loop, so the counters need no lock.
+class RequestMetrics:
+
+    def __init__(self, latency_buckets: list[float] = ms.METRICS_LATENCY_BUCKETS, size_buckets: list[int] = ms.METRICS_SIZE_BUCKETS):
+        self.latency_buckets = sorted(latency_buckets)
+        self.size_buckets = sorted(size_buckets)
+        self.in_progress = 0
+        self.requests: dict[tuple[str, str, int], int] = {}          # (method, route, status) -> requests
+        self.latency: dict[tuple[str, str], Histogram] = {}           # (method, route) -> seconds
+        self.sizes: dict[tuple[str, str], Histogram] = {}             # (method, route) -> response body bytes
+
+    def observe(self, method: str, route: str, status: int, seconds: float, size: int):
+        key = (method, route, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        key = (method, route)
+        latency = self.latency.get(key)
+        if latency is None:
+            latency = self.latency[key] = Histogram(self.latency_buckets)
+            self.sizes[key] = Histogram(self.size_buckets)
+        latency.observe(seconds)
+        self.sizes[key].observe(size)
+
+    def reset(self):
+        self.in_progress = 0
+        self.requests.clear()
+        self.latency.clear()
+        self.sizes.clear()
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Returns every metric (requests, connection pool and password hasher) in the Prometheus text exposition format
+    def render(self) -> str:
+        lines = []
+
+        _header(lines, "http_requests_total", "counter", "HTTP requests by method, route and status")
+        for (method, route, status), count in sorted(self.requests.items()):
+            lines.append(f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}')
+
+        _header(lines, "http_requests_in_progress", "gauge", "HTTP requests being served")
+        lines.append(f"http_requests_in_progress {self.in_progress}")
+
+        for name, help_text, histograms in (
+                                                ("http_request_duration_seconds", "HTTP request latency by method and route", self.latency),
+                                                ("http_response_size_bytes", "HTTP response body size by method and route", self.sizes),
+                                            ):
+            _header(lines, name, "histogram", help_text)
+            for (method, route), histogram in sorted(histograms.items()):
+                labels = f'method="{method}",route="{_escape(route)}"'
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        # Connection pool of the database engine (nothing until the first query creates it)
+        pool = get_pool_stats()
+        if pool is not None:
+            for stat, help_text in (
+                                        ("size", "Connections kept open by the database pool"),
+                                        ("checked_in", "Idle connections of the database pool"),
+                                        ("checked_out", "Connections of the database pool in use"),
+                                        ("overflow", "Connections opened over the database pool size"),
+                                    ):
+                _header(lines, f"db_pool_{stat}", "gauge", help_text)
+                lines.append(f"db_pool_{stat} {pool[stat]}")
+
+        # Password hasher, the operations in progress are the ones running in the worker threads
+        _header(lines, "password_hash_in_progress", "gauge", "Password hashes and verifies in progress")
+        lines.append(f"password_hash_in_progress {hash_handler.in_progress}")
+        _header(lines, "password_hash_operations_total", "counter", "Password hashes and verifies done")
+        for operation, count in hash_handler.operations_total.items():
+            lines.append(f'password_hash_operations_total{{operation="{operation}"}} {count}')
+        _header(lines, "password_hash_seconds_total", "counter", "Time spent hashing and verifying passwords")
+        for operation, seconds in hash_handler.seconds_total.items():
+            lines.append(f'password_hash_seconds_total{{operation="{operation}"}} {_format_value(seconds)}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _header(lines: list[str], name: str, metric_type: str, help_text: str):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {metric_type}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class is a pure ASGI middleware which records the HTTP requests (count, latency, in progress and response size).
+        # The route is read after the request was served, from the route matched by the router (FastAPI stores it in the scope).
+        # WebSockets and the lifespan are not recorded.
+class MetricsMiddleware:
+
+    def __init__(self, app, metrics: "RequestMetrics | None" = None):
+        self.app = app
+        self.metrics = metrics or request_metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        response = [500, 0]      # Status and body size, 500 if the app fails before starting the response
+
+        async def send_recorded(message):
+            if message["type"] == "http.response.start":
+                response[0] = message["status"]
+            elif message["type"] == "http.response.body":
+                response[1] += len(message.get("body", b""))
+            await send(message)
+
+        metrics.in_progress += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_recorded)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.in_progress -= 1
+            metrics.observe(scope["method"], _route_label(scope), response[0], elapsed, response[1])
+
+
+# Gets the route template of a served request (e.g. /events/{event_id}), or UNMATCHED_ROUTE
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or UNMATCHED_ROUTE
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Create an instance of RequestMetrics to use throughout the app
+request_metrics = RequestMetrics()
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This function is used to configure the requests metrics for the FastAPI application.
+def setup_metrics(app: FastAPI):
+    """ Configure the metrics middleware for FastAPI app based on env vars: METRICS_ENABLED and the histogram buckets."""
+
+    if ms.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware, metrics=request_metrics)
@@ -0,0 +1,255 @@
+# app/backend/utils/realtime.py
+
+# Import necessary modules
+import asyncio                                                      # Importing asyncio for the sender and heartbeat tasks
+import json                                                         # Importing json to serialize every notification only once
+import time                                                         # Importing time for the idle timeouts
+from collections import OrderedDict                                 # Importing OrderedDict for the coalescing send queues
+from datetime import datetime                                       # Importing datetime for the modification timestamps
+from fastapi import WebSocket                                       # Importing WebSocket for the subscribed connections
+from sqlalchemy import event                                        # Importing event to send the notifications after commits
+from sqlalchemy.orm import Session                                  # Importing Session to listen to every ORM session
+from sqlmodel.ext.asyncio.session import AsyncSession               # Importing AsyncSession for type hints
+from typing import Any, Hashable, Iterable, Optional                # Importing typing helpers for type hints
+from ...config import realtime_settings as rts                      # Importing the real-time notifications settings
+from .change_broker import change_broker                            # Importing the change broker to receive the changes of the other workers
+
+# Notifications sent by the server itself
+PING_MESSAGE = json.dumps({"op": "ping"}, separators=(",", ":"))
+RESYNC_MESSAGE = json.dumps({"op": "resync"}, separators=(",", ":"))
+
+# Gets the coalescing key of an event notification (None if it has no event id, so it is never coalesced)
+def event_key(message: dict[str, Any]) -> Optional[tuple[str, Any]]:
+    event_id = message.get("id")
+    return None if event_id is None else ("event", event_id)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class is a single subscribed WebSocket with its own bounded send queue and sender task.
+        # The queue holds serialized notifications keyed for coalescing: with the "coalesce" policy, a pending notification of the same event
+        # is replaced by the newer one. The keys are namespaced, ("event", id) for the events and ("seq", n) for the notifications which are
+        # never coalesced, so an event id can not replace an unrelated notification. If the queue still overflows, the client has missed changes anyway, so the whole queue is replaced
+        # by a single "resync" notification and the client reloads its events.
+class Connection:
+
+    def __init__(self, websocket: WebSocket, user_id: int, queue_size: int, policy: str):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.queue_size = queue_size
+        self.policy = policy
+        self.last_seen = time.monotonic()
+        self.dropped = 0
+        self.closed = False
+        self.sender: Optional[asyncio.Task] = None
+
+        self._pending: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._sequence = 0
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Queues a serialized notification without waiting, applying the slow consumer policy
+    def enqueue(self, text: str, coalesce_key: Optional[Hashable] = None) -> None:
+        if self.closed:
+            return
+
+        if coalesce_key is None or self.policy != "coalesce":
+            self._sequence += 1
+            coalesce_key = ("seq", self._sequence)
+
+        self._pending[coalesce_key] = text
+        self._pending.move_to_end(coalesce_key)
+
+        if len(self._pending) > self.queue_size:
+            self.dropped += len(self._pending)
+            self._pending.clear()
+            self._pending["resync"] = RESYNC_MESSAGE
+
+        self._wakeup.set()
+
+    # Sends the queued notifications until the connection is closed. A send slower than the timeout closes the connection.
+    async def run_sender(self, send_timeout: float) -> None:
+        while not self.closed:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._pending:
+                _, text = self._pending.popitem(last=False)
+                await asyncio.wait_for(self.websocket.send_text(text), send_timeout)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the WebSocket connections subscribed to the changes of each user.
+        # Publishing never awaits a socket: the notifications are serialized once per batch and queued in every connection of the user,
+        # and each connection has its own sender task, so a slow client only fills its own queue.
+        # A single heartbeat task pings every connection and closes the ones that did not send anything (pong) within the idle timeout.
+class ConnectionManager:
+
+    def __init__(self, queue_size: int, policy: str, send_timeout: float, heartbeat_interval: float, idle_timeout: float):
+        self.queue_size = queue_size
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+
+        # {user_id: set of connections}
+        self._connections: dict[int, set[Connection]] = {}
+
+        # Keeps a strong reference to the closing tasks so they are not garbage collected before finishing
+        self._closing_tasks: set[asyncio.Task] = set()
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Subscribes an accepted WebSocket to the changes of an user and starts its sender task
+    def connect(self, user_id: int, websocket: WebSocket) -> Connection:
+        connection = Connection(websocket, user_id, self.queue_size, self.policy)
+        connection.sender = asyncio.create_task(self._run_sender(connection))
+        self._connections.setdefault(user_id, set()).add(connection)
+        return connection
+
+    # Unsubscribes a connection and stops its sender task
+    def disconnect(self, connection: Connection) -> None:
+        connection.closed = True
+        if connection.sender and connection.sender is not asyncio.current_task():
+            connection.sender.cancel()
+
+        connections = self._connections.get(connection.user_id)
+        if connections is None:
+            return
+
+        connections.discard(connection)
+        if not connections:
+            del self._connections[connection.user_id]
+
+    # Marks a connection as alive, every message received from the client counts as a pong
+    def touch(self, connection: Connection) -> None:
+        connection.last_seen = time.monotonic()
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Queues some notifications in every connection of an user, without waiting for the sends
+    def publish(self, user_id: int, messages: Iterable[dict[str, Any]]) -> None:
+        connections = self._connections.get(user_id)
+        if not connections:
+            return
+
+        serialized = [(json.dumps(message, separators=(",", ":")), event_key(message)) for message in messages]
+        for connection in connections:
+            for text, coalesce_key in serialized:
+                connection.enqueue(text, coalesce_key)
+
+    # Groups some (user_id, notification) pairs by user and publishes every group at once
+    def publish_grouped(self, notifications: Iterable[tuple[int, dict[str, Any]]]) -> None:
+        grouped: dict[int, list[dict[str, Any]]] = {}
+        for user_id, message in notifications:
+            grouped.setdefault(user_id, []).append(message)
+
+        for user_id, messages in grouped.items():
+            self.publish(user_id, messages)
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    async def _run_sender(self, connection: Connection) -> None:
+        try:
+            await connection.run_sender(self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Slow (send timeout) or gone connection
+            self.close(connection)
+
+    # Closes a connection from the server side, without waiting for the close handshake
+    def close(self, connection: Connection, code: int = 1001) -> None:
+        if connection.closed:
+            return
+
+        self.disconnect(connection)
+        task = asyncio.create_task(self._close_websocket(connection.websocket, code))
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    async def _close_websocket(self, websocket: WebSocket, code: int) -> None:
+        try:
+            await asyncio.wait_for(websocket.close(code=code), self.send_timeout)
+        except Exception:
+            pass
+
+    # Asks every connection to reload its events, when some changes of the other workers may have been missed
+    def resync_all(self) -> None:
+        for connections in self._connections.values():
+            for connection in connections:
+                connection.enqueue(RESYNC_MESSAGE, "resync")
+
+    # Closes every connection (app shutdown)
+    def close_all(self) -> None:
+        for connections in list(self._connections.values()):
+            for connection in list(connections):
+                self.close(connection)
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Pings every connection periodically and closes the idle ones (runs as a background task during the app lifespan)
+    async def run_heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+
+            now = time.monotonic()
+            for connections in list(self._connections.values()):
+                for connection in list(connections):
+                    if now - connection.last_seen > self.idle_timeout:
+                        self.close(connection, code=1001)
+                    else:
+                        connection.enqueue(PING_MESSAGE, "ping")
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Gets the amount of connections and the notifications dropped by slow consumers
+    def stats(self) -> dict[str, Any]:
+        connections = [connection for user_connections in self._connections.values() for connection in user_connections]
+        return {
+                    "users": len(self._connections),
+                    "connections": len(connections),
+                    "dropped": sum(connection.dropped for connection in connections),
+                    "policy": self.policy,
+                    "queue_size": self.queue_size,
+                }
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Builds a compact change notification: {"op": "create" | "update" | "delete", "id": event ID, "ts": modification timestamp}
+def event_change_message(operation: str, event_id: int, modification: Optional[datetime]) -> dict[str, Any]:
+    return {"op": operation, "id": event_id, "ts": modification.isoformat() if modification else None}
+
+
+# Queues a change notification in a database session, it is sent to the subscribers when the session commits
+def notify_event_change(session: AsyncSession, user_id: Optional[int], operation: str, event_id: int, modification: Optional[datetime] = None) -> None:
+    if user_id is None:
+        return
+
+    session.sync_session.info.setdefault("pending_notifications", []).append((user_id, event_change_message(operation, event_id, modification)))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(sync_session: Session) -> None:
+    notifications = sync_session.info.pop("pending_notifications", None)
+    if notifications:
+        connection_manager.publish_grouped(notifications)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(sync_session: Session) -> None:
+    sync_session.info.pop("pending_notifications", None)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Create an instance of ConnectionManager to use throughout the app
+connection_manager = ConnectionManager(
+                                            rts.REALTIME_SEND_QUEUE_SIZE,
+                                            rts.REALTIME_SLOW_CONSUMER_POLICY,
+                                            rts.REALTIME_SEND_TIMEOUT_SECONDS,
+                                            rts.REALTIME_HEARTBEAT_INTERVAL_SECONDS,
+                                            rts.REALTIME_IDLE_TIMEOUT_SECONDS,
+                                        )
+
+# The notifications of the writes committed by the other workers are pushed to the local subscribers too
+change_broker.register("pending_notifications", connection_manager.publish_grouped, connection_manager.resync_all)
@@ -0,0 +1,165 @@
+# app/backend/utils/response_cache.py
+
+# Import necessary modules
+from collections import OrderedDict                                 # Importing OrderedDict for the LRU eviction
+from typing import Any, Optional                                    # Importing Any and Optional for type hints
+from fastapi import Response                                        # Importing Response to return the pre-serialized bodies
+from pydantic_core import to_json                                   # Importing to_json to serialize the DTOs straight to bytes
+from sqlalchemy import event                                        # Importing event to bump the generations after commits
+from sqlalchemy.orm import Session                                  # Importing Session to listen to every ORM session
+from sqlmodel.ext.asyncio.session import AsyncSession               # Importing AsyncSession for type hints
+from ...config import cache_settings as cs                          # Importing the response cache settings
+from .change_broker import change_broker                            # Importing the change broker to invalidate the cache in every worker
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles a bounded in-process cache of pre-serialized responses for the admin listing endpoints.
+        # Each entry is keyed by route and normalized query parameters, and stores the generation of the data it depends on ("events", "users").
+        # The service write methods mark the data as stale in the database session, and the generation is bumped when that session commits,
+        # so a response read before the commit can never be stored as fresh.
+class ResponseCache:
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.generations: dict[str, int] = {}
+        self.size_bytes = 0
+
+        # {(route, params): (generations, body)}
+        self._entries: "OrderedDict[tuple, tuple[tuple[int, ...], bytes]]" = OrderedDict()
+
+        # {route: {"hits": int, "misses": int}}
+        self._route_stats: dict[str, dict[str, int]] = {}
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Builds the cache key from the route name and the query parameters, ignoring the ones not provided
+    def _make_key(self, route: str, params: dict[str, Any]) -> tuple:
+        return (route, tuple(sorted((name, value) for name, value in params.items() if value is not None)))
+
+    # Gets the current generations of the data a response depends on
+    def _current_generations(self, depends_on: tuple[str, ...]) -> tuple[int, ...]:
+        return tuple(self.generations.get(name, 0) for name in depends_on)
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Bumps the generation of some data, so every cached response that depends on it becomes stale
+    def bump(self, *names: str) -> None:
+        for name in names:
+            self.generations[name] = self.generations.get(name, 0) + 1
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Builds the JSON response of a body, with the headers set on the injected response of the endpoint (e.g. the refreshed auth cookies),
+    # which FastAPI drops when an endpoint returns its own response
+    @staticmethod
+    def _make_response(body: bytes, response: Optional[Response]) -> Response:
+        json_response = Response(content=body, media_type="application/json")
+        if response is not None:
+            json_response.raw_headers.extend(header for header in response.raw_headers if header[0] != b"content-length")
+        return json_response
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Gets a cached response, or None if it is not cached or stale. Also returns the generations to store the fresh response with.
+    def get(self, route: str, params: dict[str, Any], depends_on: tuple[str, ...],
+            response: Optional[Response] = None) -> tuple[Optional[Response], tuple[int, ...]]:
+        stats = self._route_stats.setdefault(route, {"hits": 0, "misses": 0})
+        generations = self._current_generations(depends_on)
+        key = self._make_key(route, params)
+
+        entry = self._entries.get(key)
+        if entry and entry[0] == generations:
+            stats["hits"] += 1
+            self._entries.move_to_end(key)
+            return self._make_response(entry[1], response), generations
+
+        stats["misses"] += 1
+        if entry:
+            self._remove(key)
+
+        return None, generations
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Serializes the content, stores it if the data did not change while it was being read, and returns the response
+    def store(self, route: str, params: dict[str, Any], depends_on: tuple[str, ...], generations: tuple[int, ...], content: Any,
+              response: Optional[Response] = None) -> Response:
+        body = to_json(content)
+
+        if generations == self._current_generations(depends_on) and len(body) <= self.max_bytes:
+            key = self._make_key(route, params)
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (generations, body)
+            self.size_bytes += len(body)
+
+            # Evicts the least recently used responses while over the limits
+            while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+        return self._make_response(body, response)
+
+    # Removes every entry, when some changes of the other workers may have been missed
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Removes an entry and updates the memory usage
+    def _remove(self, key: tuple) -> None:
+        _, body = self._entries.pop(key)
+        self.size_bytes -= len(body)
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Gets the per-route hit ratio and memory usage
+    def stats(self) -> dict[str, Any]:
+        routes = {}
+        for route, counters in self._route_stats.items():
+            entries = [body for (entry_route, _), (_, body) in self._entries.items() if entry_route == route]
+            requests = counters["hits"] + counters["misses"]
+            routes[route] = {
+                                "hits": counters["hits"],
+                                "misses": counters["misses"],
+                                "hit_ratio": round(counters["hits"] / requests, 4) if requests else 0.0,
+                                "entries": len(entries),
+                                "bytes": sum(len(body) for body in entries),
+                            }
+
+        return {
+                    "entries": len(self._entries),
+                    "bytes": self.size_bytes,
+                    "max_entries": self.max_entries,
+                    "max_bytes": self.max_bytes,
+                    "generations": dict(self.generations),
+                    "routes": routes,
+                }
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Marks some cached data as stale in a database session, its generation is bumped when the session commits
+def mark_stale(session: AsyncSession, *names: str) -> None:
+    session.sync_session.info.setdefault("stale_cache", set()).update(names)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_after_commit(sync_session: Session) -> None:
+    names = sync_session.info.pop("stale_cache", None)
+    if names:
+        response_cache.bump(*names)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(sync_session: Session) -> None:
+    sync_session.info.pop("stale_cache", None)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Create an instance of ResponseCache to use throughout the app
+response_cache = ResponseCache(cs.RESPONSE_CACHE_MAX_ENTRIES, cs.RESPONSE_CACHE_MAX_BYTES)
+
+# The data changed by the other workers is bumped too
+change_broker.register("stale_cache", lambda names: response_cache.bump(*names), response_cache.clear)
@@ -0,0 +1,45 @@
+# app/backend/utils/sync_token.py
+
+# Import necessary modules
+import base64                                           # Importing base64 to make the tokens opaque and URL safe
+from datetime import datetime, timedelta                # Importing datetime for the watermarks
+from ...config import sync_settings as sys_s            # Importing the delta sync settings
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: Helpers for the opaque sync tokens of the delta sync (GET /events/changes).
+        # A token is a watermark timestamp: the next sync returns the events modified and the tombstones written after it.
+        # The watermark is set SYNC_TOKEN_OVERLAP_SECONDS before the sync, because the timestamps are set before the commits: a change
+        # committed a bit later than its timestamp is still returned by the next sync (the clients apply the changes idempotently).
+
+TOKEN_VERSION = "1"
+
+def encode_sync_token(synced_at: datetime) -> str:
+    """ Builds the sync token of a sync started at the given time """
+
+    watermark = synced_at - timedelta(seconds=sys_s.SYNC_TOKEN_OVERLAP_SECONDS)
+    raw = f"{TOKEN_VERSION}:{watermark.isoformat()}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def decode_sync_token(token: str) -> datetime:
+    """ Gets the watermark of a sync token, raises ValueError if it is not valid """
+
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid sync token")
+
+    version, _, watermark = raw.partition(":")
+    if version != TOKEN_VERSION:
+        raise ValueError("Invalid sync token")
+
+    return datetime.fromisoformat(watermark)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def is_sync_token_expired(watermark: datetime) -> bool:
+    """ Checks if the tombstones after the watermark may have been compacted already, so the client must reload every event """
+
+    return watermark < datetime.now() - timedelta(days=sys_s.SYNC_TOMBSTONE_RETENTION_DAYS)
@@ -1,28 +1,31 @@
 import reflex as rx
-from typing import Dict, Any
-from ...state.app_state import AppState
+from ...state.app_state import AppState, SEARCH_DEBOUNCE_MS
+from ...state.records import ClientRecord
 from ...utils.styles import (
     colors, 
     spacing, 
     typography, 
-    get_card_styles,
-    get_button_styles,
     get_input_styles,
     get_badge_styles,
-    get_text_styles
+    get_text_styles,
+    button_class
 )
-from ..shared import Card, CardHeader, CardBody, CardFooter, Button, Input, Badge, StatusBadge
+from ..shared import Card, CardHeader, CardBody, CardFooter, Button, Input, Badge, StatusBadge, VirtualList
 
 def _search_bar() -> rx.Component:
     """Search bar component using new design system."""
     return rx.box(
         rx.hstack(
-            Input(
-                placeholder="Search clients by name, email or phone...",
-                value=AppState.clients_search_query,
-                on_change=AppState.set_clients_search_query,
-                icon_left="search",
-                width="100%"
+            # Debounced on the client: the query is only sent once the typing pauses
+            rx.debounce_input(
+                Input(
+                    placeholder="Search clients by name, email or phone...",
+                    value=AppState.clients_search_query,
+                    on_change=AppState.set_clients_search_query,
+                    icon_left="search",
+                    width="100%"
+                ),
+                debounce_timeout=SEARCH_DEBOUNCE_MS
             ),
             Button(
                 "Add Client",
@@ -43,8 +46,32 @@ def _client_status_badge(status: str) -> rx.Component:
     """Client status badge using new design system."""
     return StatusBadge(status, size="sm")
 
-def _client_card(client: Dict[str, Any]) -> rx.Component:
-    """Individual client card."""
+# Height of a client card. Every text of the card is a single truncated line, so it does not depend on the client. Upper bound, top
+# to bottom, with the sizes used by _client_card (stack spacing props in the Radix scale: "2" = 8px, "4" = 16px):
+CLIENT_CARD_HEIGHT = (
+    48                      # Header: the 48px avatar, taller than the name and company lines next to it
+    + 16 + 1 + 16           # Divider, with the "4" spacing of the card stack around it
+    + 3 * 24 + 2 * 8        # Email, phone and address lines (24px, md text) with the "2" spacing of their stack
+    + 16 + 16 + 1 + 26      # Footer: margin, padding and border on top, and the row of 14px icons with a 6px padding
+    + 2 * 16 + 2            # Card padding and border
+)
+
+# Space between the cards of the grid (half of it on each side of every card)
+CLIENT_GRID_GAP = 24
+
+# Height of a row of the clients grid: the card, the gap and some room for the font metrics of the browser, so no card is clipped
+CLIENT_ROW_HEIGHT = CLIENT_CARD_HEIGHT + CLIENT_GRID_GAP + 14
+
+# Single line text, cut with an ellipsis (min_width lets it shrink inside the flex stacks)
+_TRUNCATE = {
+    "overflow": "hidden",
+    "text_overflow": "ellipsis",
+    "white_space": "nowrap",
+    "min_width": "0"
+}
+
+def _client_card(client: ClientRecord) -> rx.Component:
+    """Individual client card (fixed height, see CLIENT_ROW_HEIGHT)."""
     return Card(
         CardBody(
             rx.vstack(
@@ -70,28 +97,33 @@ def _client_card(client: Dict[str, Any]) -> rx.Component:
                     rx.vstack(
                         rx.hstack(
                             rx.text(
-                                client.get("name", "Unknown"),
+                                rx.cond(client.name, client.name, "Unknown"),
                                 style={
                                     **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
+                                    **_TRUNCATE,
                                     "font_weight": "600",
                                     "line_height": "1.2"
                                 }
                             ),
-                            _client_status_badge(client.get("status", "inactive")),
+                            rx.box(_client_status_badge(client.status), flex_shrink="0"),
                             spacing="2",
-                            align="center"
+                            align="center",
+                            max_width="100%"
                         ),
                         rx.text(
-                            client.get("company", "No company"),
+                            rx.cond(client.company, client.company, "No company"),
                             style={
                                 **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
+                                **_TRUNCATE,
                                 "color": colors["text_muted"],
-                                "margin_top": "-2px"
+                                "margin_top": "-2px",
+                                "max_width": "100%"
                             }
                         ),
                         align="start",
                         spacing="0",
-                        flex="1"
+                        flex="1",
+                        min_width="0"
                     ),
                     spacing="3",
                     align="start",
@@ -106,9 +138,10 @@ def _client_card(client: Dict[str, Any]) -> rx.Component:
                     rx.hstack(
                         rx.icon("mail", size=16, color=colors["text_muted"]),
                         rx.text(
-                            client.get("email", "No email"),
+                            rx.cond(client.email, client.email, "No email"),
                             style={
                                 **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
+                                **_TRUNCATE,
                                 "color": colors["text_secondary"]
                             }
                         ),
@@ -119,9 +152,10 @@ def _client_card(client: Dict[str, Any]) -> rx.Component:
                     rx.hstack(
                         rx.icon("phone", size=16, color=colors["text_muted"]),
                         rx.text(
-                            client.get("phone", "No phone"),
+                            rx.cond(client.phone, client.phone, "No phone"),
                             style={
                                 **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
+                                **_TRUNCATE,
                                 "color": colors["text_secondary"]
                             }
                         ),
@@ -132,13 +166,11 @@ def _client_card(client: Dict[str, Any]) -> rx.Component:
                     rx.hstack(
                         rx.icon("map", size=16, color=colors["text_muted"]),
                         rx.text(
-                            client.get("address", "No address"),
+                            rx.cond(client.address, client.address, "No address"),
                             style={
                                 **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
-                                "color": colors["text_secondary"],
-                                "overflow": "hidden",
-                                "text_overflow": "ellipsis",
-                                "white_space": "nowrap"
+                                **_TRUNCATE,
+                                "color": colors["text_secondary"]
                             }
                         ),
                         spacing="2",
@@ -168,7 +200,7 @@ def _client_card(client: Dict[str, Any]) -> rx.Component:
                 rx.hstack(
                     rx.box(
                         rx.icon("settings", size=14, color=colors["text_muted"]),
-                        on_click=lambda client_id=str(client.get("id", "")): AppState.open_client_modal(client_id),
+                        on_click=AppState.open_client_modal(client.id.to_string()),
                         style={
                             "padding": "6px",
                             "border_radius": "6px",
@@ -245,8 +277,8 @@ def _empty_state() -> rx.Component:
                     }
                 ),
                 on_click=lambda: AppState.open_client_modal(""),
+                class_name=button_class(variant="outline", size="md"),
                 style={
-                    **get_button_styles(variant="outline", size="md"),
                     "display": "flex",
                     "align_items": "center",
                     "justify_content": "center",
@@ -262,18 +294,35 @@ def _empty_state() -> rx.Component:
         }
     )
 
+def _load_progress() -> rx.Component:
+    """Progress of the running clients load (the clients are shown as their chunks arrive)."""
+    return rx.cond(
+        AppState.clients_loading,
+        rx.progress(
+            value=AppState.clients_load_progress,
+            max=100,
+            style={
+                "width": "100%",
+                "margin_bottom": "16px"
+            }
+        )
+    )
+
 def _clients_grid() -> rx.Component:
-    """Grid of client cards."""
+    """Virtualized grid of client cards (only the visible rows are sent by the state)."""
     return rx.cond(
-        AppState.filtered_clients.length() > 0,
-        rx.grid(
-            rx.foreach(
-                AppState.filtered_clients,
-                _client_card
-            ),
-            columns="3",
-            spacing="6",
-            width="100%"
+        AppState.clients_filtered_total > 0,
+        VirtualList(
+            items=AppState.filtered_clients,
+            render_fn=_client_card,
+            list_id="clients-grid",
+            row_height=CLIENT_ROW_HEIGHT,
+            items_before=AppState.clients_window_start,
+            items_after=AppState.clients_after_window,
+            on_window=AppState.set_clients_window,
+            columns=3,
+            gap=CLIENT_GRID_GAP,
+            reset_key=AppState.clients_results_query
         ),
         _empty_state()
     )
@@ -425,8 +474,8 @@ def ClientsView() -> rx.Component:
                         spacing="2",
                         align="center"
                     ),
+                    class_name=button_class(variant="ghost", size="sm"),
                     style={
-                        **get_button_styles(variant="ghost", size="sm"),
                         "display": "flex",
                         "align_items": "center",
                         "justify_content": "center"
@@ -451,6 +500,9 @@ def ClientsView() -> rx.Component:
                 # Stats summary
                 _stats_summary(),
                 
+                # Load progress
+                _load_progress(),
+                
                 # Clients grid
                 _clients_grid(),
                 
@@ -5,8 +5,8 @@ from ...utils.styles import (
     spacing, 
     typography, 
     get_container_styles,
-    get_card_styles,
-    get_text_styles
+    get_text_styles,
+    card_class
 )
 from ...utils.styles.theme import components
 
@@ -62,8 +62,8 @@ def _toast_notification() -> rx.Component:
                 align="center",
                 width="100%"
             ),
+            class_name=card_class(),
             style={
-                **get_card_styles(),
                 "position": "fixed",
                 "top": spacing["lg"],
                 "right": spacing["lg"],
@@ -164,8 +164,8 @@ def SPALayout() -> rx.Component:
                         align="center",
                         width="100%"
                     ),
+                    class_name=card_class(),
                     style={
-                        **get_card_styles(),
                         "position": "fixed",
                         "top": "0",
                         "left": "0",
@@ -1,16 +1,15 @@
 import reflex as rx
-from typing import Dict, Any
-from ...state.app_state import AppState
+from ...state.app_state import AppState, SEARCH_DEBOUNCE_MS
+from ...state.records import OrderRecord
 from ...utils.styles import (
     colors, 
     spacing, 
     typography, 
-    get_card_styles, 
-    get_button_styles,
     get_input_styles,
-    get_text_styles
+    get_text_styles,
+    button_class
 )
-from ..shared import Card, CardHeader, CardBody, CardFooter
+from ..shared import Card, CardHeader, CardBody, CardFooter, VirtualList
 
 # Colors now imported directly from design system
 
@@ -63,15 +62,19 @@ def _search_and_filters() -> rx.Component:
                         "z_index": "1"
                     }
                 ),
-                rx.input(
-                    placeholder="Search orders by ID, client or description...",
-                    value=AppState.orders_search_query,
-                    on_change=AppState.set_orders_search_query,
-                    style={
-                        **get_input_styles(),
-                        "padding_left": "44px",
-                        "width": "100%"
-                    }
+                # Debounced on the client: the query is only sent once the typing pauses
+                rx.debounce_input(
+                    rx.input(
+                        placeholder="Search orders by ID, client or description...",
+                        value=AppState.orders_search_query,
+                        on_change=AppState.set_orders_search_query,
+                        style={
+                            **get_input_styles(),
+                            "padding_left": "44px",
+                            "width": "100%"
+                        }
+                    ),
+                    debounce_timeout=SEARCH_DEBOUNCE_MS
                 ),
                 style={"position": "relative", "flex": "1"}
             ),
@@ -85,8 +88,8 @@ def _search_and_filters() -> rx.Component:
                     }
                 ),
                 on_click=lambda: AppState.open_order_modal(""),
+                class_name=button_class(variant="primary", size="md"),
                 style={
-                    **get_button_styles(variant="primary", size="md"),
                     "display": "flex",
                     "align_items": "center",
                     "justify_content": "center",
@@ -214,14 +217,14 @@ def _search_and_filters() -> rx.Component:
         margin_bottom="24px"
     )
 
-def _order_row(order: Dict[str, Any]) -> rx.Component:
+def _order_row(order: OrderRecord) -> rx.Component:
     """Single order row for the table."""
     return rx.box(
         rx.hstack(
             # Order ID and Date
             rx.vstack(
                 rx.text(
-                    f"#{order.get('id', 'N/A')}",
+                    "#", order.id,
                     style={
                         **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
                         "font_weight": "600",
@@ -229,7 +232,7 @@ def _order_row(order: Dict[str, Any]) -> rx.Component:
                     }
                 ),
                 rx.text(
-                    order.get("created_at", "Unknown"),
+                    rx.cond(order.created_at, order.created_at, "Unknown"),
                     style={
                         **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
                         "color": colors["text_muted"]
@@ -243,7 +246,7 @@ def _order_row(order: Dict[str, Any]) -> rx.Component:
             # Client
             rx.vstack(
                 rx.text(
-                    order.get("client_name", "Unknown Client"),
+                    rx.cond(order.client_name, order.client_name, "Unknown Client"),
                     style={
                         **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
                         "font_weight": "500"
@@ -265,7 +268,7 @@ def _order_row(order: Dict[str, Any]) -> rx.Component:
             # Description
             rx.vstack(
                 rx.text(
-                    order.get("description", "No description"),
+                    rx.cond(order.description, order.description, "No description"),
                     style={
                         **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
                         "overflow": "hidden",
@@ -290,7 +293,7 @@ def _order_row(order: Dict[str, Any]) -> rx.Component:
             # Amount
             rx.vstack(
                 rx.text(
-                    f"€{order.get('amount', 0):,.2f}",
+                    f"€{order.amount:,.2f}",     # Thousands separator and 2 decimals, formatted in the browser
                     style={
                         **get_text_styles(size=typography["sizes"]["md"], color=colors["text_primary"]),
                         "font_weight": "600",
@@ -311,7 +314,7 @@ def _order_row(order: Dict[str, Any]) -> rx.Component:
             
             # Status
             rx.vstack(
-                _order_status_badge(order.get("status", "pending")),
+                _order_status_badge(order.status),
                 rx.text(
                     "Status",
                     style={
@@ -328,7 +331,7 @@ def _order_row(order: Dict[str, Any]) -> rx.Component:
             rx.hstack(
                 rx.box(
                     rx.icon("settings", size=14, color=colors["text_muted"]),
-                    on_click=lambda order_id=str(order.get("id", "")): AppState.open_order_modal(order_id),
+                    on_click=AppState.open_order_modal(order.id.to_string()),
                     style={
                         "padding": "8px",
                         "border_radius": "6px",
@@ -443,6 +446,20 @@ def _orders_table_header() -> rx.Component:
         }
     )
 
+def _load_progress() -> rx.Component:
+    """Progress of the running orders load (the orders are shown as their chunks arrive)."""
+    return rx.cond(
+        AppState.orders_loading,
+        rx.progress(
+            value=AppState.orders_load_progress,
+            max=100,
+            style={
+                "width": "100%",
+                "margin_bottom": "16px"
+            }
+        )
+    )
+
 def _orders_table() -> rx.Component:
     """Orders table component."""
     return Card(
@@ -450,14 +467,16 @@ def _orders_table() -> rx.Component:
             rx.vstack(
                 _orders_table_header(),
                 rx.cond(
-                    AppState.filtered_orders.length() > 0,
-                    rx.vstack(
-                        rx.foreach(
-                            AppState.filtered_orders,
-                            _order_row
-                        ),
-                        spacing="0",
-                        width="100%"
+                    AppState.orders_filtered_total > 0,
+                    VirtualList(
+                        items=AppState.filtered_orders,
+                        render_fn=_order_row,
+                        list_id="orders-table",
+                        row_height=96,
+                        items_before=AppState.orders_window_start,
+                        items_after=AppState.orders_after_window,
+                        on_window=AppState.set_orders_window,
+                        reset_key=AppState.orders_results_query + AppState.orders_status_filter
                     ),
                     rx.center(
                         rx.vstack(
@@ -678,8 +697,8 @@ def OrdersView() -> rx.Component:
                         spacing="2",
                         align="center"
                     ),
+                    class_name=button_class(variant="ghost", size="sm"),
                     style={
-                        **get_button_styles(variant="ghost", size="sm"),
                         "display": "flex",
                         "align_items": "center",
                         "justify_content": "center"
@@ -704,6 +723,9 @@ def OrdersView() -> rx.Component:
                 # Stats summary
                 _stats_summary(),
                 
+                # Load progress
+                _load_progress(),
+                
                 # Orders table
                 _orders_table(),
                 
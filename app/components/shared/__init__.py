@@ -14,6 +14,7 @@ from .text import Text, Heading, Caption, Label
 from .modal import Modal, ModalHeader, ModalBody, ModalFooter, AlertDialog
 from .spinner import Spinner, LoadingOverlay
 from .badge import Badge, StatusBadge, NotificationBadge
+from .virtual_list import VirtualList
 
 __all__ = [
     # Button components
@@ -56,4 +57,7 @@ __all__ = [
     "Badge",
     "StatusBadge",
     "NotificationBadge",
+    
+    # Virtualized list components
+    "VirtualList",
 ]
@@ -9,7 +9,7 @@ import reflex as rx
 from typing import Union, Optional
 
 # Import styles from the design system
-from app.utils.styles import get_badge_styles
+from app.utils.styles import get_badge_styles, badge_class, class_names
 
 def Badge(
     children: Union[str, int, float],
@@ -34,8 +34,9 @@ def Badge(
         A styled Badge component
     """
     
-    # Get badge styles
-    badge_styles = get_badge_styles(
+    # Get the static classes of the badge (or its inline styles if it has no classes)
+    badge_classes = badge_class(variant=variant, size=size)
+    badge_styles = {} if badge_classes else get_badge_styles(
         variant=variant,
         size=size
     )
@@ -62,7 +63,7 @@ def Badge(
     return rx.box(
         *badge_content,
         style=badge_styles,
-        class_name=class_name,
+        class_name=class_names(badge_classes, class_name),
         **props
     )
 
@@ -9,7 +9,7 @@ import reflex as rx
 from typing import List, Union, Optional, Callable, Any
 
 # Import styles from the design system
-from app.utils.styles import get_button_styles
+from app.utils.styles import get_button_styles, button_class, class_names
 
 def Button(
     children: Union[str, List[rx.Component]],
@@ -43,8 +43,9 @@ def Button(
     Returns:
         A styled Button component
     """
-    # Get style dictionary based on props
-    button_styles = get_button_styles(
+    # Get the static classes of the variant (or its inline styles if it has no classes)
+    button_classes = button_class(variant=variant, size=size, full_width=full_width, disabled=is_disabled)
+    button_styles = {} if button_classes else get_button_styles(
         variant=variant,
         size=size,
         full_width=full_width,
@@ -90,7 +91,7 @@ def Button(
         on_click=on_click,
         disabled=is_disabled,
         style=button_styles,
-        class_name=class_name,
+        class_name=class_names(button_classes, class_name),
         **kwargs
     )
 
@@ -122,8 +123,9 @@ def IconButton(
     Returns:
         A styled IconButton component
     """
-    # Get base styles
-    button_styles = get_button_styles(
+    # Get the static classes of the variant (or its inline styles if it has no classes)
+    button_classes = button_class(variant=variant, size=size, disabled=is_disabled)
+    button_styles = {} if button_classes else get_button_styles(
         variant=variant,
         size=size,
         disabled=is_disabled
@@ -164,6 +166,6 @@ def IconButton(
         disabled=is_disabled,
         style=button_styles,
         aria_label=aria_label or f"{icon} button",
-        class_name=class_name,
+        class_name=class_names(button_classes, class_name),
         **kwargs
     )
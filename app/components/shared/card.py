@@ -9,7 +9,7 @@ import reflex as rx
 from typing import List, Union, Optional, Any
 
 # Import styles from the design system
-from app.utils.styles import get_card_styles, spacing, colors, typography
+from app.utils.styles import get_card_styles, spacing, colors, typography, card_class, class_names
 
 def Card(
     children: Union[List[rx.Component], rx.Component],
@@ -35,8 +35,9 @@ def Card(
     Returns:
         A styled Card component
     """
-    # Get style dictionary based on props
-    card_styles = get_card_styles(
+    # Get the static classes of the variant (or its inline styles if it has no classes)
+    card_classes = card_class(variant=variant, padding=padding, hoverable=hoverable, elevated=elevated)
+    card_styles = {} if card_classes else get_card_styles(
         variant=variant,
         padding=padding,
         hoverable=hoverable,
@@ -53,7 +54,7 @@ def Card(
     return rx.box(
         children,
         style=card_styles,
-        class_name=class_name,
+        class_name=class_names(card_classes, class_name),
         **kwargs
     )
 
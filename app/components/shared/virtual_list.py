@@ -0,0 +1,101 @@
+"""
+Virtual List Component
+
+This module provides a reusable VirtualList component that only renders the rows visible in its
+scroll container (plus an overscan), for long lists such as the clients grid and the orders table.
+"""
+
+import reflex as rx
+from typing import Optional, Callable, Union
+
+
+def _window_script(list_id: str, row_height: int, columns: int, overscan: int) -> str:
+    """Build the browser expression returning the [start, end) item range visible in the list, with the overscan rows."""
+    return (
+        f"(el => el ? [Math.max(0, Math.floor(el.scrollTop / {row_height}) - {overscan}) * {columns}, "
+        f"(Math.ceil((el.scrollTop + el.clientHeight) / {row_height}) + {overscan}) * {columns}] : [0, 0])"
+        f"(document.getElementById('{list_id}'))"
+    )
+
+
+def _spacer_height(items: Union[int, rx.Var], columns: int, row_height: int) -> str:
+    """Height of the rows holding some items (a partial row counts as a whole row), as a CSS length."""
+    return f"{(items + columns - 1) // columns * row_height}px"
+
+
+def VirtualList(
+    items: rx.Var,
+    render_fn: Callable,
+    list_id: str,
+    row_height: int,
+    items_before: Union[int, rx.Var],
+    items_after: Union[int, rx.Var],
+    on_window: Callable,
+    columns: int = 1,
+    overscan: int = 3,
+    gap: int = 0,
+    height: str = "70vh",
+    reset_key: Optional[Union[str, rx.Var]] = None,
+    throttle_ms: int = 100,
+    class_name: Optional[str] = None,
+    **props
+) -> rx.Component:
+    """
+    Virtualized list component following the design system.
+
+    The state only sends the window of items to render. Spacers above and below the window keep the
+    scroll height of the whole list, and the scroll events send the new window to the state.
+
+    Args:
+        items: Items of the current window
+        render_fn: Function rendering an item
+        list_id: ID of the scroll container (unique in the page)
+        row_height: Height of a row in pixels (every row has the same height)
+        items_before: Amount of items above the window
+        items_after: Amount of items below the window
+        on_window: Event handler receiving the [start, end) item range to render
+        columns: Items per row (grid layout)
+        overscan: Rows rendered above and below the visible ones
+        gap: Space between the items in pixels (included in the row height)
+        height: Height of the scroll container
+        reset_key: Value that scrolls the list back to the top when it changes (e.g. the search query)
+        throttle_ms: Minimum time between two window updates while scrolling
+        class_name: Additional CSS class names
+        **props: Additional props
+
+    Returns:
+        A styled VirtualList component
+    """
+
+    script = _window_script(list_id, row_height, columns, overscan)
+
+    return rx.box(
+        rx.box(height=_spacer_height(items_before, columns, row_height)),
+        rx.grid(
+            rx.foreach(
+                items,
+                lambda item: rx.box(
+                    render_fn(item),
+                    style={
+                        "height": f"{row_height}px",
+                        "padding": f"{gap // 2}px",
+                        "overflow": "hidden"
+                    }
+                )
+            ),
+            columns=str(columns),
+            width="100%"
+        ),
+        rx.box(height=_spacer_height(items_after, columns, row_height)),
+        id=list_id,
+        key=reset_key,
+        on_mount=rx.call_script(script, callback=on_window),
+        on_scroll=rx.call_script(script, callback=on_window).throttle(throttle_ms),
+        class_name=class_name,
+        style={
+            "height": height,
+            "overflow_y": "auto",
+            "width": "100%"
+        },
+        **props
+    )
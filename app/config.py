@@ -51,6 +51,158 @@ class EventTableSettings:
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
+# NOTE: This class handles sessions table settings (only used by the "session" auth backend)
+class SessionsTableSettings:
+    SESSIONS_TABLE = os.getenv("DB_SESSIONS_TABLE", "SESSIONS_NSE")
+    SESSIONS_ID_COL = os.getenv("DB_SESSIONS_TABLE_ID", "nse_id")
+    SESSIONS_USER_ID_COL = os.getenv("DB_SESSIONS_TABLE_USER_ID", "nue_nse_n_fk")
+    SESSIONS_EXPIRATION_COL = os.getenv("DB_SESSIONS_TABLE_EXPIRATION", "nse_expiration")
+    SESSIONS_RECORDCREATION_COL = os.getenv("DB_SESSIONS_TABLE_RECORDCREATION", "nse_recordcreation")
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the event tombstones table settings (deleted events, reported by the delta sync)
+class TombstonesTableSettings:
+    TOMBSTONES_TABLE = os.getenv("DB_TOMBSTONES_TABLE", "TOMBSTONES_NTB")
+    TOMBSTONES_ID_COL = os.getenv("DB_TOMBSTONES_TABLE_ID", "ntb_id")
+    TOMBSTONES_EVENT_ID_COL = os.getenv("DB_TOMBSTONES_TABLE_EVENT_ID", "ntb_eventid")
+    TOMBSTONES_USER_ID_COL = os.getenv("DB_TOMBSTONES_TABLE_USER_ID", "nue_ntb_n_fk")
+    TOMBSTONES_DELETION_COL = os.getenv("DB_TOMBSTONES_TABLE_DELETION", "ntb_deletion")
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles authentication settings
+class AuthSettings:
+    AUTH_BACKEND = os.getenv("AUTH_BACKEND", "jwt")                                               # "jwt" (access + refresh tokens) or "session" (server-side sessions)
+    SESSION_EXPIRE_DAYS = int(os.getenv("SESSION_EXPIRE_DAYS", 7))                                # Default to 7 days, as the refresh tokens
+    SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", 10000))                              # Maximum sessions kept in the in-memory cache
+    SESSION_CACHE_TTL_SECONDS = int(os.getenv("SESSION_CACHE_TTL_SECONDS", 60))                   # Seconds a cached session is trusted before reading it again
+    SESSION_SWEEP_INTERVAL_SECONDS = int(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", 600))        # Seconds between expired sessions sweeps
+    SESSION_SWEEP_BATCH_SIZE = int(os.getenv("SESSION_SWEEP_BATCH_SIZE", 1000))                   # Expired sessions deleted per statement
+    ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN", "")                                            # Bearer token of the admin monitoring endpoints (disabled if empty)
+
+    @property
+    # Whether the server-side sessions backend is enabled
+    def sessions_enabled(self) -> bool:
+        return self.AUTH_BACKEND.lower() == "session"
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the in-process response cache settings
+class CacheSettings:
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024))                # Maximum cached responses
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))         # Maximum size of the cached bodies (32 MiB by default)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the response compression settings
+class CompressionSettings:
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))                 # Responses smaller than this (bytes) are sent uncompressed
+    COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))                # 1 (fastest) to 9 (smallest)
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))        # 0 (fastest) to 11 (smallest), only if 'brotli' is installed
+    COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", 3))                # 1 (fastest) to 22 (smallest), only if 'zstandard' is installed
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the real-time notifications (WebSocket) settings
+class RealtimeSettings:
+    REALTIME_SEND_QUEUE_SIZE = int(os.getenv("REALTIME_SEND_QUEUE_SIZE", 100))                          # Pending notifications per connection
+    REALTIME_SLOW_CONSUMER_POLICY = os.getenv("REALTIME_SLOW_CONSUMER_POLICY", "coalesce").lower()      # "coalesce" or "drop"
+    REALTIME_SEND_TIMEOUT_SECONDS = float(os.getenv("REALTIME_SEND_TIMEOUT_SECONDS", 10))               # A send slower than this closes the connection
+    REALTIME_HEARTBEAT_INTERVAL_SECONDS = float(os.getenv("REALTIME_HEARTBEAT_INTERVAL_SECONDS", 25))   # Period of the pings sent to every connection
+    REALTIME_IDLE_TIMEOUT_SECONDS = float(os.getenv("REALTIME_IDLE_TIMEOUT_SECONDS", 60))               # Connections silent for longer are closed
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the settings of the changes fan-out between workers
+class ChangeBrokerSettings:
+    CHANGE_BROKER = os.getenv("CHANGE_BROKER", "postgres")                                      # "postgres" (LISTEN/NOTIFY) or "memory" (single process, tests)
+    CHANGE_BROKER_CHANNEL = os.getenv("CHANGE_BROKER_CHANNEL", "integra_changes")               # PostgreSQL notification channel
+    CHANGE_BROKER_RETRY_SECONDS = float(os.getenv("CHANGE_BROKER_RETRY_SECONDS", 5))            # Wait before reconnecting a lost listener
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the events delta sync settings
+class SyncSettings:
+    SYNC_TOKEN_OVERLAP_SECONDS = int(os.getenv("SYNC_TOKEN_OVERLAP_SECONDS", 5))                        # Changes not committed yet when the token was issued
+    SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", 30))                 # Older tokens must reload every event
+    SYNC_COMPACTION_INTERVAL_SECONDS = int(os.getenv("SYNC_COMPACTION_INTERVAL_SECONDS", 3600))         # Period of the tombstones compaction
+    SYNC_COMPACTION_BATCH_SIZE = int(os.getenv("SYNC_COMPACTION_BATCH_SIZE", 1000))                     # Tombstones deleted per statement
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles password hashing (argon2) settings
+class HashingSettings:
+
+    # Named argon2 cost profiles, so the cost can be retuned as hardware changes without forcing password resets
+    # (memory_cost is expressed in KiB, as expected by argon2-cffi)
+    PROFILES = {
+        "low":      {"time_cost": 2, "memory_cost": 19456,  "parallelism": 1},      # OWASP minimum, for small instances and tests
+        "default":  {"time_cost": 3, "memory_cost": 65536,  "parallelism": 4},      # RFC 9106 low memory profile (argon2-cffi defaults)
+        "high":     {"time_cost": 4, "memory_cost": 131072, "parallelism": 4},      # For dedicated hosts with spare CPU and memory
+    }
+
+    HASH_PROFILE = os.getenv("HASH_PROFILE", "default")                         # Default to 'default' profile if not set
+
+    # Optional overrides for single parameters of the selected profile (e.g. values suggested by the calibration command)
+    HASH_TIME_COST = os.getenv("HASH_TIME_COST")
+    HASH_MEMORY_COST = os.getenv("HASH_MEMORY_COST")
+    HASH_PARALLELISM = os.getenv("HASH_PARALLELISM")
+
+    @property
+    # Argon2 parameters of the selected profile with the overrides applied
+    def hash_params(self) -> dict[str, int]:
+        if self.HASH_PROFILE not in self.PROFILES:
+            raise ValueError(f"Unknown HASH_PROFILE '{self.HASH_PROFILE}', expected one of: {', '.join(self.PROFILES)}")
+
+        params = dict(self.PROFILES[self.HASH_PROFILE])
+
+        if self.HASH_TIME_COST:
+            params["time_cost"] = int(self.HASH_TIME_COST)
+        if self.HASH_MEMORY_COST:
+            params["memory_cost"] = int(self.HASH_MEMORY_COST)
+        if self.HASH_PARALLELISM:
+            params["parallelism"] = int(self.HASH_PARALLELISM)
+
+        return params
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the settings of the API client shared by the Reflex states
+class ApiClientSettings:
+    API_CLIENT_TRANSPORT = os.getenv("API_CLIENT_TRANSPORT", "asgi").lower()                   # "asgi" (in-process, same app) or "http" (remote API)
+    API_CLIENT_MAX_CONNECTIONS = int(os.getenv("API_CLIENT_MAX_CONNECTIONS", 20))               # Pooled connections of the "http" transport
+    API_CLIENT_MAX_KEEPALIVE = int(os.getenv("API_CLIENT_MAX_KEEPALIVE", 10))                   # Idle connections kept alive of the "http" transport
+    API_CLIENT_KEEPALIVE_SECONDS = float(os.getenv("API_CLIENT_KEEPALIVE_SECONDS", 30))         # Idle connections older than this are closed
+    API_CLIENT_TIMEOUT_SECONDS = float(os.getenv("API_CLIENT_TIMEOUT_SECONDS", 10))             # Timeout of every request
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the settings of the calendar state (events loaded by week or month)
+class CalendarSettings:
+    CALENDAR_WINDOW_CACHE_SIZE = int(os.getenv("CALENDAR_WINDOW_CACHE_SIZE", 12))                # Loaded windows kept per session (LRU)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the memory settings of the Reflex states kept per session (browser tab)
+class StateMemorySettings:
+    STATE_IDLE_POLICY = os.getenv("STATE_IDLE_POLICY", "offload").lower()                      # "offload" (to disk, restored on the next event) or "none"
+    STATE_IDLE_SECONDS = float(os.getenv("STATE_IDLE_SECONDS", 900))                            # Sessions without events for longer are idle
+    STATE_SWEEP_INTERVAL_SECONDS = float(os.getenv("STATE_SWEEP_INTERVAL_SECONDS", 60))         # Period of the idle sessions sweep
+    STATE_OFFLOAD_DIR = os.getenv("STATE_OFFLOAD_DIR", "")                                      # Private (0700) directory of the offloaded lists (new temporary one if empty)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the settings of the /metrics endpoint (Prometheus text format)
+class MetricsSettings:
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"                    # Record the requests and expose /metrics
+    METRICS_LATENCY_BUCKETS = [float(bucket) for bucket in os.getenv(                           # Upper bounds (seconds) of the latency histogram
+        "METRICS_LATENCY_BUCKETS", "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10").split(",")]
+    METRICS_SIZE_BUCKETS = [int(bucket) for bucket in os.getenv(                                # Upper bounds (bytes) of the response size histogram
+        "METRICS_SIZE_BUCKETS", "256,1024,4096,16384,65536,262144,1048576").split(",")]
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
 # NOTE: This class handles app settings
 class AppSettings:
     APP_MODE = os.getenv("APP_STATUS", "DEVELOPMENT")
@@ -71,3 +223,16 @@ app_settings = AppSettings()
 db_settings = DatabaseSettings()
 users_table_settings = UsersTableSettings()
 events_table_settings = EventTableSettings()
+sessions_table_settings = SessionsTableSettings()
+tombstones_table_settings = TombstonesTableSettings()
+auth_settings = AuthSettings()
+hashing_settings = HashingSettings()
+cache_settings = CacheSettings()
+compression_settings = CompressionSettings()
+realtime_settings = RealtimeSettings()
+change_broker_settings = ChangeBrokerSettings()
+sync_settings = SyncSettings()
+api_client_settings = ApiClientSettings()
+calendar_settings = CalendarSettings()
+state_memory_settings = StateMemorySettings()
+metrics_settings = MetricsSettings()
@@ -0,0 +1,39 @@
+"""Add sessions table
+
+Revision ID: a3c5e7f9b1d2
+Revises: 632fbd0fdb81
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f9b1d2'
+down_revision: Union[str, Sequence[str], None] = '632fbd0fdb81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('SESSIONS_NSE',
+    sa.Column('nse_id', sa.String(length=64), nullable=False),
+    sa.Column('nue_nse_n_fk', sa.Integer(), nullable=False),
+    sa.Column('nse_expiration', sa.TIMESTAMP(), nullable=False),
+    sa.Column('nse_recordcreation', sa.TIMESTAMP(), nullable=False),
+    sa.ForeignKeyConstraint(['nue_nse_n_fk'], ['USERS_NUE.nue_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('nse_id')
+    )
+    op.create_index(op.f('ix_SESSIONS_NSE_nue_nse_n_fk'), 'SESSIONS_NSE', ['nue_nse_n_fk'], unique=False)
+    op.create_index(op.f('ix_SESSIONS_NSE_nse_expiration'), 'SESSIONS_NSE', ['nse_expiration'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_SESSIONS_NSE_nse_expiration'), table_name='SESSIONS_NSE')
+    op.drop_index(op.f('ix_SESSIONS_NSE_nue_nse_n_fk'), table_name='SESSIONS_NSE')
+    op.drop_table('SESSIONS_NSE')
@@ -0,0 +1,41 @@
+"""Add event tombstones table and events modification index
+
+Revision ID: b7d9f1a3c5e8
+Revises: a3c5e7f9b1d2
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d9f1a3c5e8'
+down_revision: Union[str, Sequence[str], None] = 'a3c5e7f9b1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('TOMBSTONES_NTB',
+    sa.Column('ntb_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('ntb_eventid', sa.Integer(), nullable=False),
+    sa.Column('nue_ntb_n_fk', sa.Integer(), nullable=False),
+    sa.Column('ntb_deletion', sa.TIMESTAMP(), nullable=False),
+    sa.ForeignKeyConstraint(['nue_ntb_n_fk'], ['USERS_NUE.nue_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ntb_id')
+    )
+    op.create_index(op.f('ix_TOMBSTONES_NTB_ntb_deletion'), 'TOMBSTONES_NTB', ['ntb_deletion'], unique=False)
+    op.create_index('ix_TOMBSTONES_NTB_user_deletion', 'TOMBSTONES_NTB', ['nue_ntb_n_fk', 'ntb_deletion'], unique=False)
+    op.create_index('ix_EVENTS_NEV_user_recordmodification', 'EVENTS_NEV', ['nue_nev_n_fk', 'nev_recordmodification'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_EVENTS_NEV_user_recordmodification', table_name='EVENTS_NEV')
+    op.drop_index('ix_TOMBSTONES_NTB_user_deletion', table_name='TOMBSTONES_NTB')
+    op.drop_index(op.f('ix_TOMBSTONES_NTB_ntb_deletion'), table_name='TOMBSTONES_NTB')
+    op.drop_table('TOMBSTONES_NTB')
@@ -0,0 +1,28 @@
+"""Add events start time index
+
+Revision ID: c9e1a3b5d7f2
+Revises: b7d9f1a3c5e8
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e1a3b5d7f2'
+down_revision: Union[str, Sequence[str], None] = 'b7d9f1a3c5e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_EVENTS_NEV_user_starttime', 'EVENTS_NEV', ['nue_nev_n_fk', 'nev_starttime'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_EVENTS_NEV_user_starttime', table_name='EVENTS_NEV')
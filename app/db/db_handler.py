@@ -4,25 +4,61 @@
 from sqlmodel.ext.asyncio.session import AsyncSession                    # Importing AsyncSession for asynchronous database operations
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine      # Importing AsyncEngine and create_async_engine for creating the async engine
 from sqlalchemy.orm import sessionmaker                                  # Importing sessionmaker for creating session factories
-from typing import AsyncGenerator                                        # Importing AsyncGenerator for asynchronous generators
+from typing import AsyncGenerator, Optional                              # Importing AsyncGenerator and Optional for type hints
 from ..config import db_settings                                         # Importing db_settings for database settings
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
-# Creates the asynchronous database engine, this engine manages the connection pool to your database in an async way.
-engine:AsyncEngine = create_async_engine(
-                                            db_settings.database_url,    # Database connection string from config
-                                            echo = True,                 # Enable SQL query logging for debugging    
+# The asynchronous database engine and the session factory, created on first use (see get_engine), so importing the app
+# (alembic, the Reflex compile step, the workers) does not load the database driver or build the connection pool.
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[sessionmaker] = None
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Returns the asynchronous database engine, this engine manages the connection pool to your database in an async way.
+def get_engine() -> AsyncEngine:
+    global _engine
+
+    if _engine is None:
+        _engine = create_async_engine(
+                                        db_settings.database_url,    # Database connection string from config
+                                        echo = True,                 # Enable SQL query logging for debugging    
+                                    )
+    return _engine
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Returns a new AsyncSession from a session factory bound to the async engine (created with the engine on first use).
+def async_session() -> AsyncSession:
+    global _session_factory
+
+    if _session_factory is None:
+        _session_factory = sessionmaker(
+                                            bind=get_engine(),          # Use the engine of the app
+                                            expire_on_commit = False,   # Prevent objects from expiring after commit (keep them usable)
+                                            class_ = AsyncSession       # Use async session for async DB operations
                                         )
+    return _session_factory()
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
-# Creates a session factory bound to the async engine, this factory will generate AsyncSession instances when called.
-async_session = sessionmaker(
-                                bind=engine,                # Use the previously created engine       
-                                expire_on_commit = False,   # Prevent objects from expiring after commit (keep them usable)
-                                class_ = AsyncSession       # Use async session for async DB operations
-                            )
+# Returns the connection pool statistics of the engine (for /metrics), or None if the engine was not created yet
+def get_pool_stats() -> Optional[dict[str, int]]:
+    if _engine is None:
+        return None
+
+    pool = _engine.pool
+    try:
+        return {
+                    "size": pool.size(),                    # Connections the pool keeps open
+                    "checked_in": pool.checkedin(),         # Idle connections
+                    "checked_out": pool.checkedout(),       # Connections in use
+                    "overflow": pool.overflow(),            # Connections opened over the size (negative while the pool is not full)
+                }
+    except AttributeError:
+        # Pools without statistics (NullPool, StaticPool)
+        return None
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
 
@@ -31,12 +67,8 @@ async def init_db():
     """ Starts a connection context with the engine
     This is where you can run database migrations or create tables """
 
-    if engine is None:
-        print("Database engine is not initialized.")
-        return
-    
     try:
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             print("Database connection initialized successfully.")
             
             # NOTE: Uncomment this line only if you want to create the tables automatically.
@@ -55,11 +87,14 @@ async def close_db():
     This is important to release resources when the app stops or no longer needs the database connection
     It ensures that all connections are properly closed and cleaned up. """
     
-    if engine is None:
+    global _engine, _session_factory
+
+    if _engine is None:
         print("No database engine to close.")
         return
     
     try:
+        engine, _engine, _session_factory = _engine, None, None
         await engine.dispose()
         print("Database connection closed successfully.")
     except Exception as e:
@@ -1,9 +1,11 @@
 from .create import EventCreate
 from .read import EventRead
 from .update import EventUpdate
+from .changes import EventChanges
 
 __all__ = [
     "EventCreateDTO",
     "EventReadDTO",
-    "EventUpdateDTO"
+    "EventUpdateDTO",
+    "EventChanges"
 ]
\ No newline at end of file
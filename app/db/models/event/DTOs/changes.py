@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from .read import EventRead
+
+class EventChanges(BaseModel):
+    # Events created or modified since the sync token
+    changed: list[EventRead]
+    # IDs of the events deleted since the sync token, they must be applied before the changed ones (an ID may be reused)
+    deleted: list[int]
+    # Token for the next sync
+    sync_token: str
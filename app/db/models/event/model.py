@@ -2,6 +2,7 @@
 
 # Import necessary modules
 from sqlmodel import SQLModel, Field, Column, Integer, String, TIMESTAMP, ForeignKey    # Importing SQLModel for database operations
+from sqlalchemy import Index                                                            # Importing Index for the composite indexes
 from datetime import datetime                                                           # Importing for timestamps management
 from typing import Optional                                                             # Importing Optional for type hints
 from ....config import events_table_settings as et                                  # Importing events table settings
@@ -17,6 +18,13 @@ import reflex as rx
 class Event(rx.Model, table=True): 
     # Table name
     __tablename__ = et.EVENTS_TABLE
+
+    # The delta sync and the ETags look for the last modifications of an user, so they only scan that user's most recent events.
+    # The calendar loads the events of an user by date window (week or month), so it only scans that user's events in the window.
+    __table_args__ = (
+                        Index(f"ix_{et.EVENTS_TABLE}_user_recordmodification", et.EVENTS_USER_ID_COL, et.EVENTS_RECORDMODIFICATION_COL),
+                        Index(f"ix_{et.EVENTS_TABLE}_user_starttime", et.EVENTS_USER_ID_COL, et.EVENTS_STARTTIME_COL),
+                    )
     
     # Primary key column - unique identifier for each user
     id: Optional[int] = Field(default = None, sa_column = Column(et.EVENTS_ID_COL, Integer, primary_key = True))
@@ -0,0 +1,5 @@
+from .read import SessionRead
+
+__all__ = [
+    "SessionRead",
+]
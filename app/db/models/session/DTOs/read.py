@@ -0,0 +1,16 @@
+# app/backend/models/session/DTOs/read.py
+
+# Import necessary modules
+from pydantic import BaseModel                               # Importing pydantic for data validation and serialization
+from datetime import datetime                                # Importing datetime for working with dates
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This DTO (Data Transfer Object) defines the session read model used in the client-side to list the active sessions of an user.
+class SessionRead(BaseModel):
+    id: str                                     # Session identifier (digest, not the cookie value)
+    record_creation: datetime                   # Timestamp of when the session was created (login)
+    expiration: datetime                        # Timestamp of when the session expires
+
+    class Config:
+        from_attributes = True
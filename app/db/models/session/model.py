@@ -0,0 +1,30 @@
+# app/backend/models/session/model.py
+
+# Import necessary modules
+from sqlmodel import Field, Column, Integer, String, TIMESTAMP, ForeignKey              # Importing SQLModel for database operations
+from datetime import datetime                                                           # Importing for timestamps management
+from typing import Optional                                                             # Importing Optional for type hints
+from ....config import sessions_table_settings as st                                # Importing sessions table settings
+from ....config import users_table_settings as ut                                   # Importing users table settings for using the fk
+
+import reflex as rx
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class model represents a server-side user session in the database (only used by the "session" auth backend)
+        # The session ID stored is a SHA-256 digest of the opaque cookie value, so a leaked table can not be used to impersonate users.
+class UserSession(rx.Model, table=True):
+    # Table name
+    __tablename__ = st.SESSIONS_TABLE
+
+    # Primary key column - SHA-256 digest (hex) of the session ID cookie
+    id: Optional[str] = Field(default = None, sa_column = Column(st.SESSIONS_ID_COL, String(64), primary_key = True))
+
+    # User ID column - foreign key referencing the user table, the sessions are removed with the user
+    user_id: Optional[int] = Field(default = None, sa_column = Column(st.SESSIONS_USER_ID_COL, Integer, ForeignKey(f"{ut.USERS_TABLE}.{ut.USERS_ID_COL}", ondelete = "CASCADE"), nullable = False, index = True))
+
+    # Expiration timestamp - indexed, so the expired sessions can be swept in batches
+    expiration: Optional[datetime] = Field(default = None, sa_column = Column(st.SESSIONS_EXPIRATION_COL, TIMESTAMP, nullable = False, index = True))
+
+    # Record creation timestamp - when the session was created (login)
+    record_creation: Optional[datetime] = Field(default_factory=datetime.now, sa_column = Column(st.SESSIONS_RECORDCREATION_COL, TIMESTAMP, nullable = False))
@@ -0,0 +1,34 @@
+# app/backend/models/tombstone/model.py
+
+# Import necessary modules
+from sqlmodel import Field, Column, Integer, TIMESTAMP, ForeignKey                      # Importing SQLModel for database operations
+from sqlalchemy import Index                                                            # Importing Index for the composite indexes
+from datetime import datetime                                                           # Importing for timestamps management
+from typing import Optional                                                             # Importing Optional for type hints
+from ....config import tombstones_table_settings as tt                              # Importing tombstones table settings
+from ....config import users_table_settings as ut                                   # Importing users table settings for using the fk
+
+import reflex as rx
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class model represents a deleted event in the database, so the delta sync can report the deletions since a sync token
+        # They are removed by the periodic compaction after SYNC_TOMBSTONE_RETENTION_DAYS, and with the user.
+class EventTombstone(rx.Model, table=True):
+    # Table name
+    __tablename__ = tt.TOMBSTONES_TABLE
+
+    # The delta sync looks for the deletions of an user since a timestamp
+    __table_args__ = (Index(f"ix_{tt.TOMBSTONES_TABLE}_user_deletion", tt.TOMBSTONES_USER_ID_COL, tt.TOMBSTONES_DELETION_COL),)
+
+    # Primary key column - unique identifier for each tombstone
+    id: Optional[int] = Field(default = None, sa_column = Column(tt.TOMBSTONES_ID_COL, Integer, primary_key = True, autoincrement = True))
+
+    # Event ID column - the ID of the deleted event (not a foreign key, the event does not exist anymore)
+    event_id: Optional[int] = Field(default = None, sa_column = Column(tt.TOMBSTONES_EVENT_ID_COL, Integer, nullable = False))
+
+    # User ID column - foreign key referencing the user table, the tombstones are removed with the user
+    user_id: Optional[int] = Field(default = None, sa_column = Column(tt.TOMBSTONES_USER_ID_COL, Integer, ForeignKey(f"{ut.USERS_TABLE}.{ut.USERS_ID_COL}", ondelete = "CASCADE"), nullable = False))
+
+    # Deletion timestamp - indexed, so the old tombstones can be compacted in batches
+    deletion: Optional[datetime] = Field(default_factory=datetime.now, sa_column = Column(tt.TOMBSTONES_DELETION_COL, TIMESTAMP, nullable = False, index = True))
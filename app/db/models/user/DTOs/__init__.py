@@ -2,14 +2,16 @@ from .create import UserCreate
 from .read import UserRead
 from .update import UserUpdate
 from .login import UserLogin
-from .token import RefreshResponse, TokenResponse, MessageResponse
+from .token import AuthenticatedUser, RefreshResponse, TokenResponse, MessageResponse, LogoutAllResponse
 
 __all__ = [
     "UserCreate",
     "UserRead",
     "UserUpdate",
     "UserLogin",
+    "AuthenticatedUser",
     "RefreshResponse",
     "TokenResponse",
     "MessageResponse",
+    "LogoutAllResponse",
 ]
\ No newline at end of file
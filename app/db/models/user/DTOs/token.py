@@ -1,16 +1,32 @@
 # app/backend/models/user/DTOs/token.py
 from pydantic import BaseModel
+from typing import Optional
+
+class AuthenticatedUser(BaseModel):
+    # Profile of the logged in user, as returned by /me-cookie
+    is_authenticated: bool = True
+    id: int
+    nickname: str
+
 
 class TokenResponse(BaseModel):
-    access_token: str
-    refresh_token: str
+    # Tokens are not issued when the "session" auth backend is enabled (the session ID cookie is used instead)
+    access_token: Optional[str] = None
+    refresh_token: Optional[str] = None
     token_type: str
+    # Profile of the logged in user, so the frontend does not need to call /me-cookie after the login
+    user: Optional[AuthenticatedUser] = None
 
 
 class MessageResponse(BaseModel):
     message: str
     
 
+class LogoutAllResponse(BaseModel):
+    message: str
+    sessions_closed: int
+
+
 class RefreshResponse(BaseModel):
     message: str
     user_id: int
@@ -7,15 +7,24 @@ from .pages.main_page import MainPage          # Imports the main page of the fr
 # Se importan los modelos para que las migraciones los tengan en cuenta.
 from .db.models.event.model import Event
 from .db.models.user.model import User
+from .db.models.session.model import UserSession
+from .db.models.tombstone.model import EventTombstone
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 
 # Import CORS middleware to handle cross-origin requests
 from .api.utils.cors import setup_cors, is_origin_allowed
 
+# Import compression middleware to compress large responses (event lists)
+from .api.utils.compression import setup_compression
+
+# Import metrics middleware to record the requests (exposed at /metrics)
+from .api.utils.metrics import setup_metrics
+
 # Import APIs endopints
-from .api.routes import events, events_admin, users_admin, auth
+from .api.routes import events, events_admin, users_admin, auth, cache_admin, state_admin, metrics
 
 # Import routes (pages)
 #from frontend.routes import home, login, register, diary
@@ -23,6 +32,29 @@ from .api.routes import events, events_admin, users_admin, auth
 # Import database initializer
 from .db.db_handler import close_db, init_db
 
+# Import the session service to sweep the expired server-side sessions
+from .api.services.session_service import SessionService
+from .config import auth_settings, metrics_settings
+
+# Import the event service to compact the old event tombstones
+from .api.services.event_service import EventService
+
+# Import the cookie authentication and the WebSocket connections of the real-time notifications
+from .api.dependencies.auth_cookies import auth_cookies_handler
+from .api.utils.realtime import connection_manager
+
+# Import the change broker to receive the changes committed by the other workers
+from .api.utils.change_broker import change_broker
+
+# Import the API client shared by the Reflex states
+from .state.api_client import api_client
+
+# Import the memory monitor of the Reflex states to offload the idle sessions
+from .state.session_memory import session_memory_monitor
+
+# Import the static utility stylesheet of the design system
+from .utils.styles import STYLESHEET_URL, is_stylesheet_outdated
+
 # Import modules to load and access environment variables
 from dotenv import load_dotenv                                
 import os                                                     
@@ -34,9 +66,11 @@ load_dotenv()
 #                                                Database initialization                                                        #
 # ============================================================================================================================= #
 
-# Inicialize database when FastAPI instance starts
+# Inicialize database when the app starts
+# NOTE: Reflex mounts app_fastapi inside its own Starlette app, which does not forward the lifespan events to the mounted apps,
+        # so this lifespan is registered as a Reflex lifespan task (see the Reflex entrypoint) instead of the FastAPI lifespan.
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan():
     # Before starting the app (startup)
     try:
         await init_db()  # Initialize the database connection or any other resources
@@ -44,7 +78,36 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Error initializing DB: {e}")
         # Here you could decide to stop the app or continue as needed
+    
+    # Sweeps the expired server-side sessions periodically (only with the "session" auth backend)
+    sessions_sweeper = asyncio.create_task(SessionService.run_expiry_sweeper()) if auth_settings.sessions_enabled else None
+    
+    # Compacts the event tombstones older than the delta sync retention periodically
+    tombstone_compactor = asyncio.create_task(EventService.run_tombstone_compactor())
+    
+    # Pings the real-time WebSocket connections and closes the idle ones
+    realtime_heartbeat = asyncio.create_task(connection_manager.run_heartbeat())
+    
+    # Listens to the changes of the other workers (WebSocket notifications, response cache and sessions cache invalidations)
+    change_listener = asyncio.create_task(change_broker.run())
+    
+    # Opens the API client of the Reflex states, with requests straight into the FastAPI app (or pooled to a remote API)
+    api_client.open(app_fastapi)
+    
+    # Offloads the heavy state variables of the idle Reflex sessions periodically
+    state_sweeper = asyncio.create_task(session_memory_monitor.run_sweeper())
+    
     yield
+    
+    await api_client.close()
+    
+    if sessions_sweeper:
+        sessions_sweeper.cancel()
+    tombstone_compactor.cancel()
+    realtime_heartbeat.cancel()
+    change_listener.cancel()
+    state_sweeper.cancel()
+    connection_manager.close_all()
     # When the app stops (shutdown)
     try:
         await close_db()  # Release resources, DB connections, etc. (if you have any)
@@ -58,11 +121,17 @@ async def lifespan(app: FastAPI):
 # ============================================================================================================================= #
 
 # Create FastAPI instance
-app_fastapi = FastAPI(title="Integra", lifespan=lifespan)
+app_fastapi = FastAPI(title="Integra")
 
 # Injects CORS middleware into the FastApi instance
 setup_cors(app_fastapi)
 
+# Injects compression middleware into the FastApi instance
+setup_compression(app_fastapi)
+
+# Injects metrics middleware into the FastApi instance (the outermost one, so it measures the whole request and the bytes sent)
+setup_metrics(app_fastapi)
+
 # This is a WebSocket endpoint for handling real-time events
 @app_fastapi.websocket("/api/_event/")
 async def websocket_endpoint(websocket: WebSocket):
@@ -78,27 +147,40 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket.close(code=403)
         return
 
-    # Accept the WebSocket connection (handshake success)
+    # Authenticate the user from the cookies of the handshake (access token, or session ID with the "session" auth backend)
+    user_id = await auth_cookies_handler.get_user_id_from_websocket(websocket)
+    if user_id is None:
+        print("WebSocket connection not authenticated")
+        await websocket.close(code=1008)
+        return
+
+    # Accept the WebSocket connection (handshake success) and subscribe it to the changes of the user's events
     await websocket.accept()
+    connection = connection_manager.connect(user_id, websocket)
 
     try:
-        # Keep the connection open to receive and send messages
+        # Keep the connection open, the notifications are pushed by the connection manager when the event writes are committed.
+        # Every message from the client (the "pong" replies to the heartbeats) keeps the connection alive.
         while True:
-            # Wait to receive a text message from the client
-            data = await websocket.receive_text()
-
-            # Echo the received message back to the client with a prefix
-            await websocket.send_text(f"Received: {data}")
+            await websocket.receive_text()
+            connection_manager.touch(connection)
 
     # Handle client disconnect event gracefully
     except WebSocketDisconnect:
         pass
 
+    finally:
+        connection_manager.disconnect(connection)
+
 # Include all the needed routes to FastAPI
 app_fastapi.include_router(users_admin.user_admin_router)       # Administration of users API
 app_fastapi.include_router(auth.auth_router)                    # Authentication API
 app_fastapi.include_router(events.event_router)                 # Events API
 app_fastapi.include_router(events_admin.event_admin_router)     # Administration of events API
+app_fastapi.include_router(cache_admin.cache_admin_router)      # Administration of the response cache API
+app_fastapi.include_router(state_admin.state_admin_router)      # Administration of the Reflex states memory API
+if metrics_settings.METRICS_ENABLED:
+    app_fastapi.include_router(metrics.metrics_router)          # Metrics API (Prometheus)
 
 # ============================================================================================================================= #
 #                                                Routes configuration                                                           #
@@ -110,5 +192,13 @@ async def root():
 
 
 # --- Reflex Entrypoint --- #
-app = rx.App(api_transformer=app_fastapi)       # Integrates FastAPI with Reflex
+
+# NOTE: The utility stylesheet is generated from the design tokens by a build step (python -m app.utils.styles.stylesheet) and
+        # committed with the assets, importing the app never writes it. It only warns here if the tokens changed since it was built.
+if is_stylesheet_outdated():
+    print("The design system stylesheet is outdated, run: python -m app.utils.styles.stylesheet")
+
+app = rx.App(api_transformer=app_fastapi, stylesheets=[STYLESHEET_URL])       # Integrates FastAPI with Reflex
 app.add_page(MainPage, route="/")               # Add main_page
+app.register_lifespan_task(lifespan)            # Starts the database, the background tasks and the API client with the app
+session_memory_monitor.install(app)             # Tracks the memory and the activity of the Reflex sessions
@@ -14,8 +14,8 @@ from ..utils.styles import (
     colors, 
     spacing, 
     typography,
-    get_card_styles,
-    get_text_styles
+    get_text_styles,
+    card_class
 )
 
 def _form_container() -> rx.Component:
@@ -80,7 +80,7 @@ def _dashboard_content() -> rx.Component:
                         align="start",
                         width="100%"
                     ),
-                    style=get_card_styles(),
+                    class_name=card_class(),
                     padding="24px",
                     width="100%"
                 ),
@@ -105,7 +105,7 @@ def _dashboard_content() -> rx.Component:
                         align="start",
                         width="100%"
                     ),
-                    style=get_card_styles(),
+                    class_name=card_class(),
                     padding="24px",
                     width="100%"
                 ),
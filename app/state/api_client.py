@@ -0,0 +1,93 @@
+# app/state/api_client.py
+
+# Import necessary modules
+from http.cookiejar import CookieJar, DefaultCookiePolicy           # Importing the cookie jar to reject the cookies of the shared client
+from typing import TYPE_CHECKING, Any, Optional                     # Importing Any and Optional for type hints
+from ..config import api_client_settings as acs                     # Importing the API client settings
+from ..config import app_settings as aps                            # Importing the API URL for the remote transport
+
+# Base URL of the in-process requests (they never leave the process, the host is only used to build the URLs)
+ASGI_BASE_URL = "http://integra.internal"
+
+# httpx is imported when the client is opened, so importing the states does not load it
+if TYPE_CHECKING:
+    import httpx
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the API client shared by every rx.State, instead of opening an httpx.AsyncClient per event.
+        # It is opened and closed by the app lifespan. With the "asgi" transport the requests go straight into the FastAPI app
+        # of this process (no TCP, no connection setup), and with the "http" transport (or before the lifespan runs) it is a pooled
+        # keep-alive client to the API URL.
+        # The client is shared by every user, so it never stores cookies: each request must carry its own credentials.
+class ApiClient:
+
+    def __init__(self):
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    # Opens the client, with the in-process transport when the app is given and the "asgi" transport is selected
+    def open(self, app: Any = None, transport: Optional[str] = None) -> None:
+        import httpx
+
+        transport = transport or acs.API_CLIENT_TRANSPORT
+
+        if app is not None and transport == "asgi":
+            self._client = httpx.AsyncClient(
+                                                transport=httpx.ASGITransport(app=app),
+                                                base_url=ASGI_BASE_URL,
+                                                cookies=self._no_cookies(),
+                                                follow_redirects=True,
+                                                timeout=acs.API_CLIENT_TIMEOUT_SECONDS,
+                                            )
+        else:
+            self._client = httpx.AsyncClient(
+                                                base_url=aps.API_URL,
+                                                cookies=self._no_cookies(),
+                                                follow_redirects=True,
+                                                timeout=acs.API_CLIENT_TIMEOUT_SECONDS,
+                                                limits=httpx.Limits(
+                                                                        max_connections=acs.API_CLIENT_MAX_CONNECTIONS,
+                                                                        max_keepalive_connections=acs.API_CLIENT_MAX_KEEPALIVE,
+                                                                        keepalive_expiry=acs.API_CLIENT_KEEPALIVE_SECONDS,
+                                                                    ),
+                                            )
+
+    # Closes the client and its pooled connections
+    async def close(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    # Returns the open client, opening the pooled HTTP one if the lifespan did not open it (e.g. the API runs in another process)
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            self.open()
+        return self._client
+
+    # A cookie jar which rejects every cookie, so the responses to a user never leak into the requests of another one
+    @staticmethod
+    def _no_cookies() -> CookieJar:
+        return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    async def request(self, method: str, path: str, **kwargs) -> "httpx.Response":
+        return await self.client.request(method, path, **kwargs)
+
+    async def get(self, path: str, **kwargs) -> "httpx.Response":
+        return await self.client.get(path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> "httpx.Response":
+        return await self.client.post(path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> "httpx.Response":
+        return await self.client.put(path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> "httpx.Response":
+        return await self.client.delete(path, **kwargs)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Creates a single instance of ApiClient to use throughout the states
+api_client = ApiClient()
@@ -1,10 +1,37 @@
 # app/state/app_state.py
 import reflex as rx
-from typing import Literal, Dict, List, Optional, Any
+from typing import Literal, Dict, List, Optional, Any, Tuple, ClassVar
 from datetime import datetime
+import asyncio
+import bisect
+import unicodedata
+from collections import Counter
+from .records import ClientRecord, OrderRecord
 
 ViewType = Literal["dashboard", "clients", "orders", "analytics"]
 
+
+def normalize_search_text(text: Any) -> str:
+    """Normalize a value for searching: case-folded and without accents ("Pérez" -> "perez")."""
+    decomposed = unicodedata.normalize("NFKD", str(text or "")).casefold()
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+# Time without keystrokes before the browser sends the search query (the search inputs are debounced on the client)
+SEARCH_DEBOUNCE_MS = 300
+
+# Records appended per state update by the loaders (the state lock is released between chunks, so other events run meanwhile)
+LOAD_CHUNK_SIZE = 250
+
+# Maximum amount of items in a rendered window (the browser sends the window, so it is bounded here)
+MAX_WINDOW_ITEMS = 200
+
+
+def clamp_window(window: List[int], total: int) -> Tuple[int, int]:
+    """Clamp a [start, end) window of items sent by a virtualized list to the matching items."""
+    start = min(max(0, int(window[0])), total)
+    return start, min(max(start, int(window[1])), start + MAX_WINDOW_ITEMS)
+
 class AppState(rx.State):
     """
     Main application state for SPA navigation and data management.
@@ -24,35 +51,63 @@ class AppState(rx.State):
     # CLIENT DATA STATE                                                                                                                  #
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     
-    # Client data (you will populate this from your FastAPI)
-    clients: List[Dict[str, Any]] = []
-    selected_client: Optional[Dict[str, Any]] = None
+    # Client data (you will populate this from your FastAPI). Backend only: the browser only receives the rendered window (filtered_clients)
+    _clients: List[ClientRecord] = []
+    selected_client: Optional[ClientRecord] = None
     clients_loading: bool = False
+    clients_load_progress: int = 0      # Percentage of the clients loaded by the running load
     clients_error: str = ""
     
-    # Client filters and pagination
+    # Client filters and rendered window (items of the matching clients rendered by the virtualized grid)
     clients_search_query: str = ""
-    clients_page: int = 1
-    clients_per_page: int = 10
+    clients_results_query: str = ""     # Query of the shown results (the search query once its search ran)
+    clients_window_start: int = 0
+    clients_window_end: int = 30
     clients_total: int = 0
+    clients_filtered_total: int = 0
+    
+    # Client search index (backend only, never sent to the browser)
+    _clients_index: List[str] = []          # Normalized "name\nemail\nphone" of each client, aligned with _clients
+    _clients_matches: List[int] = []        # Positions of the clients matching the search query
+    _clients_by_id: Dict[str, int] = {}     # Position of each client by ID
+    _clients_search_generation: int = 0     # Increased on every query sent, a search only applies its results if it is still the latest
+    _clients_status_counts: Dict[str, int] = {}     # Amount of clients by status, kept up to date by the client events
+    _clients_load_generation: int = 0       # Increased on every load, a load stops streaming if a newer one started
     
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     # ORDERS DATA STATE                                                                                                                  #
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     
-    # Orders data (you will populate this from your FastAPI)
-    orders: List[Dict[str, Any]] = []
-    selected_order: Optional[Dict[str, Any]] = None
+    # Orders data (you will populate this from your FastAPI). Backend only: the browser only receives the rendered window (filtered_orders)
+    _orders: List[OrderRecord] = []
+    selected_order: Optional[OrderRecord] = None
     orders_loading: bool = False
+    orders_load_progress: int = 0       # Percentage of the orders loaded by the running load
     orders_error: str = ""
     
-    # Orders filters and pagination
+    # Orders filters and rendered window (items of the matching orders rendered by the virtualized table)
     orders_search_query: str = ""
-    orders_page: int = 1
-    orders_per_page: int = 10
+    orders_results_query: str = ""      # Query of the shown results (the search query once its search ran)
+    orders_window_start: int = 0
+    orders_window_end: int = 30
     orders_total: int = 0
+    orders_filtered_total: int = 0
     orders_status_filter: str = "all"  # "all", "pending", "completed", "cancelled"
     
+    # Orders search index (backend only, never sent to the browser)
+    _orders_index: List[Tuple[str, str]] = []   # (normalized status, normalized "id\nclient_name\ndescription") of each order
+    _orders_matches: List[int] = []             # Positions of the orders matching the search query and the status filter
+    _orders_by_id: Dict[str, int] = {}          # Position of each order by ID
+    _orders_search_generation: int = 0          # Increased on every query sent, a search only applies its results if it is still the latest
+    _orders_status_counts: Dict[str, int] = {}  # Amount of orders by status, kept up to date by the order events
+    _orders_load_generation: int = 0            # Increased on every load, a load stops streaming if a newer one started
+    
+    # Heavy variables written to disk when the session is idle, see SessionMemoryMonitor
+    _offload_vars: ClassVar[Tuple[str, ...]] = (
+        "_clients", "_clients_index", "_clients_matches", "_clients_by_id", "_clients_status_counts", "clients_total", "clients_filtered_total",
+        "_orders", "_orders_index", "_orders_matches", "_orders_by_id", "_orders_status_counts", "orders_total", "orders_filtered_total",
+    )
+    
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     # UI STATE                                                                                                                           #
     # ---------------------------------------------------------------------------------------------------------------------------------- #
@@ -76,69 +131,46 @@ class AppState(rx.State):
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     
     @rx.var
-    def filtered_clients(self) -> List[Dict[str, Any]]:
-        """Return filtered clients based on search query."""
-        if not self.clients_search_query:
-            return self.clients
-        
-        query = self.clients_search_query.lower()
-        return [
-            client for client in self.clients
-            if query in client.get("name", "").lower() or 
-               query in client.get("email", "").lower() or
-               query in client.get("phone", "").lower()
-        ]
+    def filtered_clients(self) -> List[ClientRecord]:
+        """Return the rendered window of the clients matching the search query."""
+        clients = self._clients  # Read outside the comprehension, so Reflex tracks it as a dependency
+        return [clients[position] for position in self._clients_matches[self.clients_window_start:self.clients_window_end]]
     
     @rx.var
-    def filtered_orders(self) -> List[Dict[str, Any]]:
-        """Return filtered orders based on search query and status."""
-        filtered = self.orders
-        
-        # Filter by status
-        if self.orders_status_filter != "all":
-            filtered = [
-                order for order in filtered
-                if order.get("status", "").lower() == self.orders_status_filter
-            ]
-        
-        # Filter by search query
-        if self.orders_search_query:
-            query = self.orders_search_query.lower()
-            filtered = [
-                order for order in filtered
-                if query in str(order.get("id", "")).lower() or
-                   query in order.get("client_name", "").lower() or
-                   query in order.get("description", "").lower()
-            ]
-        
-        return filtered
+    def clients_after_window(self) -> int:
+        """Return the amount of matching clients below the rendered window."""
+        return max(0, self.clients_filtered_total - self.clients_window_end)
+    
+    @rx.var
+    def filtered_orders(self) -> List[OrderRecord]:
+        """Return the rendered window of the orders matching the search query and status."""
+        orders = self._orders  # Read outside the comprehension, so Reflex tracks it as a dependency
+        return [orders[position] for position in self._orders_matches[self.orders_window_start:self.orders_window_end]]
+    
+    @rx.var
+    def orders_after_window(self) -> int:
+        """Return the amount of matching orders below the rendered window."""
+        return max(0, self.orders_filtered_total - self.orders_window_end)
     
     @rx.var
     def clients_stats(self) -> Dict[str, int]:
-        """Calculate client statistics."""
-        total = len(self.clients)
-        active = len([c for c in self.clients if c.get("status") == "active"])
-        inactive = total - active
+        """Return client statistics from the maintained counters."""
+        active = self._clients_status_counts.get("active", 0)
         
         return {
-            "total": total,
+            "total": self.clients_total,
             "active": active,
-            "inactive": inactive
+            "inactive": self.clients_total - active
         }
     
     @rx.var
     def orders_stats(self) -> Dict[str, int]:
-        """Calculate order statistics."""
-        total = len(self.orders)
-        pending = len([o for o in self.orders if o.get("status") == "pending"])
-        completed = len([o for o in self.orders if o.get("status") == "completed"])
-        cancelled = len([o for o in self.orders if o.get("status") == "cancelled"])
-        
+        """Return order statistics from the maintained counters."""
         return {
-            "total": total,
-            "pending": pending,
-            "completed": completed,
-            "cancelled": cancelled
+            "total": self.orders_total,
+            "pending": self._orders_status_counts.get("pending", 0),
+            "completed": self._orders_status_counts.get("completed", 0),
+            "cancelled": self._orders_status_counts.get("cancelled", 0)
         }
     
     @rx.var
@@ -152,6 +184,95 @@ class AppState(rx.State):
         }
         return titles.get(self.current_view, "Dashboard")
     
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+    # SEARCH INDEX                                                                                                                       #
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+    
+    @staticmethod
+    def _client_search_text(client: ClientRecord) -> str:
+        """Build the normalized search text of a client (fields separated so a query never matches across them)."""
+        return "\n".join(normalize_search_text(value) for value in (client.name, client.email, client.phone))
+    
+    @staticmethod
+    def _order_search_entry(order: OrderRecord) -> Tuple[str, str]:
+        """Build the normalized status and search text of an order."""
+        text = "\n".join(normalize_search_text(value) for value in (order.id, order.client_name, order.description))
+        return normalize_search_text(order.status), text
+    
+    @staticmethod
+    def _order_matches(entry: Tuple[str, str], query: str, status: str) -> bool:
+        """Check if an order index entry matches a normalized search query and a status filter."""
+        order_status, text = entry
+        return (status == "all" or order_status == status) and (not query or query in text)
+    
+    def _rebuild_clients_index(self):
+        """Rebuild the clients search index, totals and status counters (bulk load, the only full recount)."""
+        self._clients_index = [self._client_search_text(client) for client in self._clients]
+        self._clients_by_id = {str(client.id): position for position, client in enumerate(self._clients)}
+        self._clients_status_counts = dict(Counter(client.status for client in self._clients))
+        self.clients_total = len(self._clients)
+        self._refilter_clients()
+    
+    def _rebuild_orders_index(self):
+        """Rebuild the orders search index, totals and status counters (bulk load, the only full recount)."""
+        self._orders_index = [self._order_search_entry(order) for order in self._orders]
+        self._orders_by_id = {str(order.id): position for position, order in enumerate(self._orders)}
+        self._orders_status_counts = dict(Counter(order.status for order in self._orders))
+        self.orders_total = len(self._orders)
+        self._refilter_orders()
+    
+    def _refilter_clients(self):
+        """Find the clients matching the search query in the index."""
+        query = normalize_search_text(self.clients_results_query)
+        if query:
+            self._clients_matches = [position for position, text in enumerate(self._clients_index) if query in text]
+        else:
+            self._clients_matches = list(range(len(self._clients_index)))
+        
+        self._update_clients_filtered_total()
+    
+    def _refilter_orders(self):
+        """Find the orders matching the search query and the status filter in the index."""
+        query = normalize_search_text(self.orders_results_query)
+        status = self.orders_status_filter
+        self._orders_matches = [position for position, entry in enumerate(self._orders_index) if self._order_matches(entry, query, status)]
+        
+        self._update_orders_filtered_total()
+    
+    def _update_clients_filtered_total(self):
+        """Update the amount of matching clients."""
+        self.clients_filtered_total = len(self._clients_matches)
+    
+    def _update_orders_filtered_total(self):
+        """Update the amount of matching orders."""
+        self.orders_filtered_total = len(self._orders_matches)
+    
+    @staticmethod
+    def _count_status(counts: Dict[str, int], status: Any, delta: int):
+        """Add a delta to the counter of a status."""
+        counts[status] = counts.get(status, 0) + delta
+    
+    @staticmethod
+    def _set_match(matches: List[int], position: int, is_match: bool):
+        """Add or remove a position in a sorted list of matches."""
+        index = bisect.bisect_left(matches, position)
+        was_match = index < len(matches) and matches[index] == position
+        if is_match and not was_match:
+            matches.insert(index, position)
+        elif was_match and not is_match:
+            del matches[index]
+    
+    @staticmethod
+    def _remove_position(matches: List[int], by_id: Dict[str, int], rows: List[Any], position: int):
+        """Shift the matches and the ID positions after a row is removed."""
+        index = bisect.bisect_left(matches, position)
+        if index < len(matches) and matches[index] == position:
+            del matches[index]
+        matches[index:] = [match - 1 for match in matches[index:]]
+        
+        for shifted in range(position, len(rows)):
+            by_id[str(rows[shifted].id)] = shifted
+    
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     # NAVIGATION EVENTS                                                                                                                  #
     # ---------------------------------------------------------------------------------------------------------------------------------- #
@@ -193,21 +314,38 @@ class AppState(rx.State):
     
     @rx.event
     def set_clients_search_query(self, query: str):
-        """Set client search query."""
+        """Set client search query (sent by the debounced search input once the typing pauses) and start its search."""
         self.clients_search_query = query
-        self.clients_page = 1  # Reset to first page when searching
+        self._clients_search_generation += 1
+        return AppState.search_clients(self._clients_search_generation)
+    
+    @rx.event(background=True)
+    async def search_clients(self, generation: int):
+        """Client search: only applies the results if no newer query came after the one that started it."""
+        async with self:
+            if generation != self._clients_search_generation:
+                return
+            
+            self.clients_results_query = self.clients_search_query
+            self._reset_clients_window()  # The list scrolls back to the top when searching
+            self._refilter_clients()
     
     @rx.event
-    def set_clients_page(self, page: int):
-        """Set current clients page."""
-        self.clients_page = max(1, page)
+    def set_clients_window(self, window: List[int]):
+        """Set the [start, end) window of matching clients rendered by the virtualized grid (sent on scroll)."""
+        self.clients_window_start, self.clients_window_end = clamp_window(window, self.clients_filtered_total)
+    
+    def _reset_clients_window(self):
+        """Move the rendered window of clients back to the top, keeping its size."""
+        self.clients_window_end -= self.clients_window_start
+        self.clients_window_start = 0
     
     @rx.event
     def select_client(self, client_id: str):
         """Select a client by ID."""
-        client = next((c for c in self.clients if str(c.get("id")) == str(client_id)), None)
-        if client:
-            self.selected_client = client
+        position = self._clients_by_id.get(str(client_id))
+        if position is not None:
+            self.selected_client = self._clients[position]
     
     @rx.event
     def open_client_modal(self, client_id: str = ""):
@@ -217,11 +355,11 @@ class AppState(rx.State):
             # Populate form with client data
             if self.selected_client:
                 self.client_form_data = {
-                    "name": self.selected_client.get("name", ""),
-                    "email": self.selected_client.get("email", ""),
-                    "phone": self.selected_client.get("phone", ""),
-                    "address": self.selected_client.get("address", ""),
-                    "company": self.selected_client.get("company", ""),
+                    "name": self.selected_client.name,
+                    "email": self.selected_client.email,
+                    "phone": self.selected_client.phone,
+                    "address": self.selected_client.address,
+                    "company": self.selected_client.company,
                 }
         else:
             # Clear form for new client
@@ -248,33 +386,109 @@ class AppState(rx.State):
         """Update client form field."""
         self.client_form_data[field] = value
     
+    @rx.event
+    def add_client(self, data: Dict[str, Any]):
+        """Add a client, updating the search index, totals and counters without rescanning."""
+        self._append_clients([ClientRecord.from_dict(data)])
+    
+    def _append_clients(self, clients: List[ClientRecord]):
+        """Append clients, updating the search index, totals, counters and matches without rescanning."""
+        query = normalize_search_text(self.clients_results_query)
+        
+        for client in clients:
+            position = len(self._clients)
+            text = self._client_search_text(client)
+            
+            self._clients.append(client)
+            self._clients_index.append(text)
+            self._clients_by_id[str(client.id)] = position
+            self._count_status(self._clients_status_counts, client.status, 1)
+            if not query or query in text:
+                self._clients_matches.append(position)
+        
+        self.clients_total = len(self._clients)
+        self._update_clients_filtered_total()
+    
+    @rx.event
+    def update_client(self, client_id: str, changes: Dict[str, Any]):
+        """Update a client, updating its index entry, match and counters."""
+        position = self._clients_by_id.get(str(client_id))
+        if position is None:
+            return
+        
+        client = self._clients[position].with_changes(changes)
+        text = self._client_search_text(client)
+        
+        self._count_status(self._clients_status_counts, self._clients[position].status, -1)
+        self._count_status(self._clients_status_counts, client.status, 1)
+        self._clients[position] = client
+        self._clients_index[position] = text
+        
+        query = normalize_search_text(self.clients_results_query)
+        self._set_match(self._clients_matches, position, not query or query in text)
+        self._update_clients_filtered_total()
+    
+    @rx.event
+    def remove_client(self, client_id: str):
+        """Remove a client, updating the search index, totals and counters."""
+        position = self._clients_by_id.pop(str(client_id), None)
+        if position is None:
+            return
+        
+        self._count_status(self._clients_status_counts, self._clients[position].status, -1)
+        del self._clients[position]
+        del self._clients_index[position]
+        self._remove_position(self._clients_matches, self._clients_by_id, self._clients, position)
+        self.clients_total -= 1
+        self._update_clients_filtered_total()
+    
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     # ORDER MANAGEMENT EVENTS                                                                                                            #
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     
     @rx.event
     def set_orders_search_query(self, query: str):
-        """Set order search query."""
+        """Set order search query (sent by the debounced search input once the typing pauses) and start its search."""
         self.orders_search_query = query
-        self.orders_page = 1  # Reset to first page when searching
+        self._orders_search_generation += 1
+        return AppState.search_orders(self._orders_search_generation)
+    
+    @rx.event(background=True)
+    async def search_orders(self, generation: int):
+        """Order search: only applies the results if no newer query or status filter came after the one that started it."""
+        async with self:
+            if generation != self._orders_search_generation:
+                return
+            
+            self.orders_results_query = self.orders_search_query
+            self._reset_orders_window()  # The list scrolls back to the top when searching
+            self._refilter_orders()
     
     @rx.event
     def set_orders_status_filter(self, status: str):
-        """Set order status filter."""
+        """Set order status filter (applied at once, with the typed query, so a pending search is not needed anymore)."""
         self.orders_status_filter = status
-        self.orders_page = 1  # Reset to first page when filtering
+        self._orders_search_generation += 1
+        self.orders_results_query = self.orders_search_query
+        self._reset_orders_window()  # The list scrolls back to the top when filtering
+        self._refilter_orders()
     
     @rx.event
-    def set_orders_page(self, page: int):
-        """Set current orders page."""
-        self.orders_page = max(1, page)
+    def set_orders_window(self, window: List[int]):
+        """Set the [start, end) window of matching orders rendered by the virtualized table (sent on scroll)."""
+        self.orders_window_start, self.orders_window_end = clamp_window(window, self.orders_filtered_total)
+    
+    def _reset_orders_window(self):
+        """Move the rendered window of orders back to the top, keeping its size."""
+        self.orders_window_end -= self.orders_window_start
+        self.orders_window_start = 0
     
     @rx.event
     def select_order(self, order_id: str):
         """Select an order by ID."""
-        order = next((o for o in self.orders if str(o.get("id")) == str(order_id)), None)
-        if order:
-            self.selected_order = order
+        position = self._orders_by_id.get(str(order_id))
+        if position is not None:
+            self.selected_order = self._orders[position]
     
     @rx.event
     def open_order_modal(self, order_id: str = ""):
@@ -284,10 +498,10 @@ class AppState(rx.State):
             # Populate form with order data
             if self.selected_order:
                 self.order_form_data = {
-                    "client_id": str(self.selected_order.get("client_id", "")),
-                    "description": self.selected_order.get("description", ""),
-                    "amount": str(self.selected_order.get("amount", "")),
-                    "status": self.selected_order.get("status", "pending"),
+                    "client_id": str(self.selected_order.client_id),
+                    "description": self.selected_order.description,
+                    "amount": str(self.selected_order.amount),
+                    "status": self.selected_order.status,
                 }
         else:
             # Clear form for new order
@@ -313,6 +527,63 @@ class AppState(rx.State):
         """Update order form field."""
         self.order_form_data[field] = value
     
+    @rx.event
+    def add_order(self, data: Dict[str, Any]):
+        """Add an order, updating the search index, totals and counters without rescanning."""
+        self._append_orders([OrderRecord.from_dict(data)])
+    
+    def _append_orders(self, orders: List[OrderRecord]):
+        """Append orders, updating the search index, totals, counters and matches without rescanning."""
+        query = normalize_search_text(self.orders_results_query)
+        status = self.orders_status_filter
+        
+        for order in orders:
+            position = len(self._orders)
+            entry = self._order_search_entry(order)
+            
+            self._orders.append(order)
+            self._orders_index.append(entry)
+            self._orders_by_id[str(order.id)] = position
+            self._count_status(self._orders_status_counts, order.status, 1)
+            if self._order_matches(entry, query, status):
+                self._orders_matches.append(position)
+        
+        self.orders_total = len(self._orders)
+        self._update_orders_filtered_total()
+    
+    @rx.event
+    def update_order(self, order_id: str, changes: Dict[str, Any]):
+        """Update an order, updating its index entry, match and counters."""
+        position = self._orders_by_id.get(str(order_id))
+        if position is None:
+            return
+        
+        order = self._orders[position].with_changes(changes)
+        entry = self._order_search_entry(order)
+        
+        self._count_status(self._orders_status_counts, self._orders[position].status, -1)
+        self._count_status(self._orders_status_counts, order.status, 1)
+        self._orders[position] = order
+        self._orders_index[position] = entry
+        
+        is_match = self._order_matches(entry, normalize_search_text(self.orders_results_query), self.orders_status_filter)
+        self._set_match(self._orders_matches, position, is_match)
+        self._update_orders_filtered_total()
+    
+    @rx.event
+    def remove_order(self, order_id: str):
+        """Remove an order, updating the search index, totals and counters."""
+        position = self._orders_by_id.pop(str(order_id), None)
+        if position is None:
+            return
+        
+        self._count_status(self._orders_status_counts, self._orders[position].status, -1)
+        del self._orders[position]
+        del self._orders_index[position]
+        self._remove_position(self._orders_matches, self._orders_by_id, self._orders, position)
+        self.orders_total -= 1
+        self._update_orders_filtered_total()
+    
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     # NOTIFICATION SYSTEM                                                                                                                #
     # ---------------------------------------------------------------------------------------------------------------------------------- #
@@ -334,11 +605,71 @@ class AppState(rx.State):
     # PLACEHOLDER DATA LOADING (YOU WILL REPLACE WITH FastAPI CALLS)                                                                    #
     # ---------------------------------------------------------------------------------------------------------------------------------- #
     
-    @rx.event
-    def load_sample_data(self):
-        """Load sample data for demonstration purposes."""
-        # Sample clients data
-        self.clients = [
+    def _start_clients_load(self) -> int:
+        """Clear the clients and their index for a new load, returning its generation."""
+        self._clients_load_generation += 1
+        self._clients = []
+        self._rebuild_clients_index()
+        self._reset_clients_window()
+        self.clients_loading = True
+        self.clients_load_progress = 0
+        self.clients_error = ""
+        return self._clients_load_generation
+    
+    def _start_orders_load(self) -> int:
+        """Clear the orders and their index for a new load, returning its generation."""
+        self._orders_load_generation += 1
+        self._orders = []
+        self._rebuild_orders_index()
+        self._reset_orders_window()
+        self.orders_loading = True
+        self.orders_load_progress = 0
+        self.orders_error = ""
+        return self._orders_load_generation
+    
+    async def _stream_clients(self, clients: List[ClientRecord], generation: int, total: Optional[int] = None) -> bool:
+        """
+        Append clients to the state in chunks from a background event, releasing the state lock between chunks so the
+        other events of the tab (navigation, sidebar, search) are not queued behind the load. Each chunk is sent to the
+        browser as it is appended. Returns False if a newer load started meanwhile (the remaining clients are dropped).
+        """
+        total = total or len(clients)
+        
+        for start in range(0, len(clients), LOAD_CHUNK_SIZE):
+            async with self:
+                if generation != self._clients_load_generation:
+                    return False
+                
+                self._append_clients(clients[start:start + LOAD_CHUNK_SIZE])
+                self.clients_load_progress = min(100, self.clients_total * 100 // max(1, total))
+            await asyncio.sleep(0)  # Lets the queued events of the tab take the lock
+        
+        return True
+    
+    async def _stream_orders(self, orders: List[OrderRecord], generation: int, total: Optional[int] = None) -> bool:
+        """Append orders to the state in chunks from a background event (see _stream_clients)."""
+        total = total or len(orders)
+        
+        for start in range(0, len(orders), LOAD_CHUNK_SIZE):
+            async with self:
+                if generation != self._orders_load_generation:
+                    return False
+                
+                self._append_orders(orders[start:start + LOAD_CHUNK_SIZE])
+                self.orders_load_progress = min(100, self.orders_total * 100 // max(1, total))
+            await asyncio.sleep(0)
+        
+        return True
+    
+    @rx.event(background=True)
+    async def load_sample_data(self):
+        """Load sample data for demonstration purposes, streamed in chunks without holding the state lock."""
+        async with self:
+            clients_generation = self._start_clients_load()
+            orders_generation = self._start_orders_load()
+        
+        # Sample clients data (built without the lock, like the responses of the API)
+        clients = [ClientRecord.from_dict(client) for client in [
             {
                 "id": 1,
                 "name": "Juan Pérez",
@@ -369,10 +700,10 @@ class AppState(rx.State):
                 "status": "inactive",
                 "created_at": "2024-01-28T09:15:00Z"
             }
-        ]
+        ]]
         
         # Sample orders data
-        self.orders = [
+        orders = [OrderRecord.from_dict(order) for order in [
             {
                 "id": 1001,
                 "client_id": 1,
@@ -413,9 +744,15 @@ class AppState(rx.State):
                 "created_at": "2024-03-05T16:20:00Z",
                 "due_date": "2024-04-05T16:20:00Z"
             }
-        ]
+        ]]
         
-        self.clients_total = len(self.clients)
-        self.orders_total = len(self.orders)
+        clients_done = await self._stream_clients(clients, clients_generation)
+        orders_done = await self._stream_orders(orders, orders_generation)
         
-        self.show_toast("Sample data loaded successfully!", "success")
+        async with self:
+            if clients_done:
+                self.clients_loading = False
+            if orders_done:
+                self.orders_loading = False
+            if clients_done and orders_done:
+                self.show_toast("Sample data loaded successfully!", "success")
@@ -1,7 +1,8 @@
 # app/frontend/state/auth_state.py
 import reflex as rx
-import httpx, json
+import json, time
 from ..config import app_settings as aps
+from .api_client import api_client
 
 class AuthState(rx.State):
     
@@ -23,6 +24,7 @@ class AuthState(rx.State):
     _debug_mode: bool = aps.DEBUG_MODE
     _access_token: str | None = None
     _refresh_token: str | None = None
+    _login_started_at: float = 0.0
     
     # Reactive variables
     # ----------------------------------------------------------------------------------------- #
@@ -69,33 +71,27 @@ class AuthState(rx.State):
         self.loading = True
         self.message = ""
         
-        # Send request to backend to register
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            try:
-                print(self.nickname, self.password)
-                print(f"{aps.API_URL}/register")
-                response = await client.post(
-                    f"{aps.API_URL}/register",
-                    json={"nickname": self.nickname, "password": self.password},
-                    timeout=10
-                )
-                
-                # Check response status
-                response.raise_for_status()
-    
-                # Auto-login after successful registration
-                return await self.login()
-
+        # Send request to backend to register (through the shared API client)
+        try:
+            response = await api_client.post(
+                "/register",
+                json={"nickname": self.nickname, "password": self.password}
+            )
+            
             # Handle HTTP errors and show them into the UI
-            except httpx.HTTPStatusError as e:
+            if response.is_error:
                 try:
-                    self.message = e.response.json().get("detail")
+                    self.message = response.json().get("detail")
                 except Exception:
-                    self.message = {f"Server error: {e}"}
-            
-            # Reset loading state
-            finally:
-                self.loading = False
+                    self.message = f"Server error: {response.status_code}"
+                return
+
+            # Auto-login after successful registration
+            return await self.login()
+        
+        # Reset loading state
+        finally:
+            self.loading = False
 
 
     # LOGIN                 
@@ -112,6 +108,7 @@ class AuthState(rx.State):
         # Start loading and clear errors
         self.loading = True
         self.message = ""
+        self._login_started_at = time.perf_counter()
         
         # Debug control and header to see console logs in browser.
         debug_header = await self._get_debug_script_header()
@@ -184,7 +181,9 @@ class AuthState(rx.State):
 
     @rx.event
     async def login_callback(self, result: dict):
-        """Callback which processes the login JS fetch response and interacts with the state variables."""
+        """Callback which processes the login JS fetch response and interacts with the state variables.
+        
+        The login response includes the user profile, so the user is authenticated here without calling /me-cookie."""
         
         # Check if result has a key "ok"
         if result.get("ok"):
@@ -193,11 +192,19 @@ class AuthState(rx.State):
             self._access_token = result["data"].get("access_token")
             self._refresh_token = result["data"].get("refresh_token")
             
-            # self._access_token = result.get("data", {}).get("access_token")
-            # self._refresh_token = result.get("data", {}).get("refresh_token")
+            # If the API did not return the profile, checks if user is authenticated
+            user = result["data"].get("user")
+            if not user:
+                return await self.check_auth()
             
-            # Checks if user is authenticated
-            return await self.check_auth()
+            self.is_authenticated = True
+            self.current_user = user
+            self.loading = False
+            self.message = ""
+            
+            # Login-to-authenticated time, from the login event to this callback
+            if self._debug_mode:
+                print(f"Login completed in {(time.perf_counter() - self._login_started_at) * 1000:.1f} ms")
             
         # If result does not have a key "ok"
         else:
@@ -0,0 +1,408 @@
+# app/state/events_state.py
+import reflex as rx
+import asyncio
+import calendar
+from datetime import date, datetime, timedelta
+from typing import ClassVar, Dict, List, Literal, Optional, Tuple
+from ..config import calendar_settings as cs
+from .api_client import api_client
+from .auth_state import AuthState
+from .records import EventRecord
+
+WindowMode = Literal["week", "month"]
+
+
+def window_bounds(mode: str, day: date) -> Tuple[date, date]:
+    """First day and first day after the window (week from Monday, or month) containing a day."""
+    if mode == "week":
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+
+    start = day.replace(day=1)
+    return start, start + timedelta(days=calendar.monthrange(start.year, start.month)[1])
+
+
+def shift_window(mode: str, start: date, steps: int) -> date:
+    """First day of the window some steps before (negative) or after a window."""
+    if mode == "week":
+        return start + timedelta(weeks=steps)
+
+    month = start.month - 1 + steps
+    return date(start.year + month // 12, month % 12 + 1, 1)
+
+
+def event_timestamp(value: str) -> datetime:
+    """Timestamp of an ISO date of an event, naive as the window bounds sent to the API."""
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+def window_key(mode: str, start: date) -> str:
+    """Key of a window in the loaded windows cache."""
+    return f"{mode}:{start.isoformat()}"
+
+
+class EventsState(rx.State):
+    """
+    Calendar events state.
+    Loads the events of the visible window (week or month) from the API, prefetches the previous and next windows
+    in the background, and keeps the last loaded windows in a bounded LRU, so flipping between them is instant.
+    """
+
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+    # WINDOW STATE                                                                                                                       #
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+
+    view_mode: WindowMode = "month"
+    window_start: str = ""      # ISO date of the first day of the visible window
+    window_end: str = ""        # ISO date of the first day after the visible window
+
+    # Events of the visible window
+    events: List[EventRecord] = []
+    events_loading: bool = False
+    events_error: str = ""
+
+    # Loaded windows (backend only, never sent to the browser): {window key: events}, in least recently used order
+    _windows: Dict[str, List[EventRecord]] = {}
+    
+    # Heavy variables written to disk when the session is idle, see SessionMemoryMonitor
+    _offload_vars: ClassVar[Tuple[str, ...]] = ("events", "_windows")
+    
+    # Temporary (negative) ID of the next event created locally, replaced by the ID assigned by the API
+    _next_temp_id: int = -1
+    
+    # Events created or updated locally and not confirmed by the API yet (they may be out of the visible window): {event ID: event}
+    _unsaved: Dict[int, EventRecord] = {}
+    
+    # Last values confirmed by the API of the events with an update or deletion in flight: {event ID: event}
+    _rollbacks: Dict[int, EventRecord] = {}
+
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+    # COMPUTED PROPERTIES                                                                                                                #
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+
+    @rx.var
+    def window_label(self) -> str:
+        """Return the title of the visible window ("March 2024", or the first and last day of the week)."""
+        if not self.window_start:
+            return ""
+
+        start = date.fromisoformat(self.window_start)
+        if self.view_mode == "month":
+            return start.strftime("%B %Y")
+
+        last = date.fromisoformat(self.window_end) - timedelta(days=1)
+        return f"{start.strftime('%d %b')} - {last.strftime('%d %b %Y')}"
+
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+    # HELPER METHODS                                                                                                                     #
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+
+    def _current_key(self) -> str:
+        """Key of the visible window."""
+        return window_key(self.view_mode, date.fromisoformat(self.window_start))
+
+    def _cached_window(self, key: str) -> Optional[List[EventRecord]]:
+        """Return the events of a loaded window, marking it as the most recently used."""
+        events = self._windows.pop(key, None)
+        if events is not None:
+            self._windows[key] = events
+        return events
+
+    def _store_window(self, key: str, events: List[EventRecord]):
+        """Store the events of a loaded window, evicting the least recently used windows over the limit."""
+        self._windows.pop(key, None)
+        self._windows[key] = events
+        while len(self._windows) > cs.CALENDAR_WINDOW_CACHE_SIZE:
+            del self._windows[next(iter(self._windows))]
+
+    def _invalidate_windows(self, start_date: str, end_date: str):
+        """Drop the loaded windows overlapping the dates of an event written locally (they are loaded again when shown)."""
+        first, last = start_date[:10], end_date[:10]
+        for key in list(self._windows):
+            mode, start = key.split(":")
+            _, end = window_bounds(mode, date.fromisoformat(start))
+            if start <= last and first < end.isoformat():
+                del self._windows[key]
+
+    def _go_to_window(self, start: date):
+        """Show a window: at once if it is loaded, otherwise it is loaded in the background. Then prefetches the adjacent ones."""
+        start, end = window_bounds(self.view_mode, start)
+        self.window_start = start.isoformat()
+        self.window_end = end.isoformat()
+        self.events_error = ""
+
+        events = self._cached_window(self._current_key())
+        if events is not None:
+            self.events = events
+            self.events_loading = False
+            return EventsState.prefetch_adjacent_windows
+
+        self.events = []
+        self.events_loading = True
+        return EventsState.load_window
+
+    async def _api_headers(self) -> Dict[str, str]:
+        """Credentials of the user for the API requests: the cookies of the browser, with the access token of the last login."""
+        cookies = [self.router.headers.cookie] if self.router.headers.cookie else []
+
+        # The cookies set by a login after the WebSocket connected are not in its headers
+        auth_state = await self.get_state(AuthState)
+        if auth_state._access_token:
+            cookies.append(f"access_token={auth_state._access_token}")
+
+        return {"Cookie": "; ".join(cookies)} if cookies else {}
+
+    def _in_window(self, event: EventRecord) -> bool:
+        """Whether an event overlaps the visible window, with the same strict bounds as the API filter (an event ending
+           at the window's first midnight is not in it)."""
+        window_start = datetime.fromisoformat(f"{self.window_start}T00:00:00")
+        window_end = datetime.fromisoformat(f"{self.window_end}T00:00:00")
+        return event_timestamp(event.start_date) < window_end and event_timestamp(event.end_date) > window_start
+
+    def _position(self, event_id: int) -> Optional[int]:
+        """Position of an event in the visible window."""
+        return next((position for position, event in enumerate(self.events) if event.id == event_id), None)
+
+    def _apply_local(self, old: Optional[EventRecord], new: Optional[EventRecord]):
+        """Replace (or add, or remove) an event in the visible window, and keep the loaded windows consistent:
+           the other windows with its old or new dates are dropped, and the visible one is stored again."""
+        events = [event for event in self.events if old is None or event.id != old.id]
+        if new is not None and self._in_window(new):
+            events.append(new)
+            events.sort(key=lambda event: event.start_date)
+        self.events = events
+
+        for event in (old, new):
+            if event is not None:
+                self._invalidate_windows(event.start_date, event.end_date)
+        self._store_window(self._current_key(), events)
+
+    @staticmethod
+    def _event_payload(event: EventRecord) -> Dict[str, Optional[str]]:
+        """Body of the create and update requests (EventCreate / EventUpdate)."""
+        return {"title": event.title, "description": event.description or None, "start_date": event.start_date, "end_date": event.end_date}
+
+    @staticmethod
+    def _error_detail(response) -> str:
+        """Error message of a failed API response."""
+        try:
+            return str(response.json().get("detail", response.status_code))
+        except Exception:
+            return str(response.status_code)
+
+    @staticmethod
+    async def _fetch_window(mode: str, start: date, headers: Dict[str, str]) -> List[EventRecord]:
+        """Load the events overlapping a window from the API."""
+        start, end = window_bounds(mode, start)
+        response = await api_client.get(
+            "/events",
+            params={"start": f"{start.isoformat()}T00:00:00", "end": f"{end.isoformat()}T00:00:00"},
+            headers=headers
+        )
+
+        # The API answers 404 when there are no events
+        if response.status_code == 404:
+            return []
+
+        response.raise_for_status()
+        return [EventRecord.from_dict(event) for event in response.json()]
+
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+    # WINDOW EVENTS                                                                                                                      #
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+
+    @rx.event
+    def load_events(self):
+        """Show the window of the current date (on page load)."""
+        return self._go_to_window(date.fromisoformat(self.window_start) if self.window_start else date.today())
+
+    @rx.event
+    def next_window(self):
+        """Show the next week or month."""
+        return self._go_to_window(shift_window(self.view_mode, date.fromisoformat(self.window_start), 1))
+
+    @rx.event
+    def previous_window(self):
+        """Show the previous week or month."""
+        return self._go_to_window(shift_window(self.view_mode, date.fromisoformat(self.window_start), -1))
+
+    @rx.event
+    def go_to_today(self):
+        """Show the window of the current date."""
+        return self._go_to_window(date.today())
+
+    @rx.event
+    def set_view_mode(self, mode: WindowMode):
+        """Switch between the week and the month view, keeping the first day of the visible window in view."""
+        self.view_mode = mode
+        return self._go_to_window(date.fromisoformat(self.window_start) if self.window_start else date.today())
+
+    @rx.event(background=True)
+    async def load_window(self):
+        """Load the visible window from the API. The events are only shown if that window is still the visible one."""
+        async with self:
+            mode, start, key = self.view_mode, date.fromisoformat(self.window_start), self._current_key()
+            headers = await self._api_headers()
+
+        try:
+            events = await self._fetch_window(mode, start, headers)
+        except Exception as e:
+            async with self:
+                if self._current_key() == key:
+                    self.events_loading = False
+                    self.events_error = f"Error loading events: {e}"
+            return
+
+        async with self:
+            self._store_window(key, events)
+            if self._current_key() == key:
+                self.events = events
+                self.events_loading = False
+
+        return EventsState.prefetch_adjacent_windows
+
+    @rx.event(background=True)
+    async def prefetch_adjacent_windows(self):
+        """Load the previous and next windows of the visible one in the background, if they are not loaded yet."""
+        async with self:
+            mode, start = self.view_mode, date.fromisoformat(self.window_start)
+            starts = [shift_window(mode, start, step) for step in (-1, 1)]
+            starts = [adjacent for adjacent in starts if window_key(mode, adjacent) not in self._windows]
+            headers = await self._api_headers() if starts else {}
+
+        if not starts:
+            return
+
+        # A failed prefetch is not shown, the window is loaded again when it becomes visible
+        results = await asyncio.gather(*(self._fetch_window(mode, adjacent, headers) for adjacent in starts), return_exceptions=True)
+
+        async with self:
+            for adjacent, events in zip(starts, results):
+                if not isinstance(events, BaseException):
+                    self._store_window(window_key(mode, adjacent), events)
+
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+    # EVENT MUTATIONS (OPTIMISTIC)                                                                                                       #
+    # ---------------------------------------------------------------------------------------------------------------------------------- #
+
+    @rx.event
+    def create_event(self, data: Dict[str, str]):
+        """Create an event: it is shown at once with a temporary ID, and sent to the API in the background."""
+        event = EventRecord.from_dict({**data, "id": self._next_temp_id})
+        self._next_temp_id -= 1
+        self.events_error = ""
+
+        self._unsaved[event.id] = event
+        self._apply_local(None, event)
+        return EventsState.send_create_event(event.id)
+
+    @rx.event
+    def update_event(self, event_id: int, changes: Dict[str, str]):
+        """Update an event: the changes are shown at once, and sent to the API in the background."""
+        position = self._position(event_id)
+        if position is None:
+            return
+        if event_id < 0:
+            self.events_error = "The event is still being saved, try again in a moment."
+            return
+
+        old = self.events[position]
+        self.events_error = ""
+
+        # Keeps the last values confirmed by the API to roll back to (not the ones of a previous update still in flight)
+        new = old.with_changes(changes)
+        self._rollbacks.setdefault(event_id, old)
+        self._unsaved[event_id] = new
+        self._apply_local(old, new)
+        return EventsState.send_update_event(event_id)
+
+    @rx.event
+    def delete_event(self, event_id: int):
+        """Delete an event: it is removed at once, and the deletion is sent to the API in the background."""
+        position = self._position(event_id)
+        if position is None:
+            return
+        if event_id < 0:
+            self.events_error = "The event is still being saved, try again in a moment."
+            return
+
+        old = self.events[position]
+        self.events_error = ""
+
+        # A pending update response must not show the event again
+        self._unsaved.pop(event_id, None)
+        self._rollbacks.setdefault(event_id, old)
+        self._apply_local(old, None)
+        return EventsState.send_delete_event(event_id)
+
+    @rx.event(background=True)
+    async def send_create_event(self, temp_id: int):
+        """Send a created event to the API. On success the server ID and timestamps replace the temporary ones, on failure it is removed."""
+        async with self:
+            sent = self._unsaved.get(temp_id)
+            if sent is None:
+                return
+            headers = await self._api_headers()
+
+        try:
+            response = await api_client.post("/events", json=self._event_payload(sent), headers=headers)
+            error = None if response.is_success else f"The event could not be created: {self._error_detail(response)}"
+        except Exception as e:
+            response, error = None, f"The event could not be created: {e}"
+
+        async with self:
+            self._unsaved.pop(temp_id, None)
+            if error:
+                self._apply_local(sent, None)
+                self.events_error = error
+            else:
+                self._apply_local(sent, EventRecord.from_dict(response.json()))
+
+    @rx.event(background=True)
+    async def send_update_event(self, event_id: int):
+        """Send an updated event to the API. On success the server timestamps are applied, on failure the confirmed values are restored."""
+        async with self:
+            sent = self._unsaved.get(event_id)
+            if sent is None:
+                return
+            headers = await self._api_headers()
+
+        try:
+            response = await api_client.put(f"/events/{event_id}", json=self._event_payload(sent), headers=headers)
+            error = None if response.is_success else f"The event could not be updated: {self._error_detail(response)}"
+        except Exception as e:
+            response, error = None, f"The event could not be updated: {e}"
+
+        async with self:
+            # A newer local change of the same event is in flight, its response settles the event. The values confirmed by this
+            # response are the ones to roll back to if that change fails (the server already overwrote the previous ones)
+            if self._unsaved.get(event_id) != sent:
+                if not error and event_id in self._rollbacks:
+                    self._rollbacks[event_id] = EventRecord.from_dict(response.json())
+                return
+
+            self._unsaved.pop(event_id, None)
+            rollback = self._rollbacks.pop(event_id, None)
+            if error:
+                self._apply_local(sent, rollback)
+                self.events_error = error
+            else:
+                self._apply_local(sent, EventRecord.from_dict(response.json()))
+
+    @rx.event(background=True)
+    async def send_delete_event(self, event_id: int):
+        """Send a deleted event to the API. On failure it is shown again."""
+        async with self:
+            headers = await self._api_headers()
+
+        try:
+            response = await api_client.delete(f"/events/{event_id}", headers=headers)
+            error = None if response.is_success else f"The event could not be deleted: {self._error_detail(response)}"
+        except Exception as e:
+            error = f"The event could not be deleted: {e}"
+
+        async with self:
+            rollback = self._rollbacks.pop(event_id, None)
+            if error:
+                self._apply_local(None, rollback)
+                self.events_error = error
@@ -0,0 +1,73 @@
+# app/state/records.py
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict
+
+
+# NOTE: Typed records for the rows held in AppState. They are slots-backed (no per-instance __dict__) and only keep
+#       the fields the views and forms use, so the per-session state and the deltas sent to the browser stay small.
+
+@dataclass(slots=True)
+class ClientRecord:
+    """A client row, as shown by ClientsView and the client form."""
+    id: int
+    name: str = ""
+    email: str = ""
+    phone: str = ""
+    company: str = ""
+    address: str = ""
+    status: str = "inactive"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClientRecord":
+        """Build a record from an API/form dict, ignoring the fields the views do not use."""
+        return cls(**{name: data[name] for name in _CLIENT_FIELDS if data.get(name) is not None})
+
+    def with_changes(self, changes: Dict[str, Any]) -> "ClientRecord":
+        """Return a copy with some fields changed (the ID never changes)."""
+        return replace(self, **{name: value for name, value in changes.items() if name in _CLIENT_FIELDS and name != "id"})
+
+
+@dataclass(slots=True)
+class OrderRecord:
+    """An order row, as shown by OrdersView and the order form."""
+    id: int
+    client_id: int = 0
+    client_name: str = ""
+    description: str = ""
+    amount: float = 0.0
+    status: str = "pending"
+    created_at: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OrderRecord":
+        """Build a record from an API/form dict, ignoring the fields the views do not use."""
+        return cls(**{name: data[name] for name in _ORDER_FIELDS if data.get(name) is not None})
+
+    def with_changes(self, changes: Dict[str, Any]) -> "OrderRecord":
+        """Return a copy with some fields changed (the ID never changes)."""
+        return replace(self, **{name: value for name, value in changes.items() if name in _ORDER_FIELDS and name != "id"})
+
+
+@dataclass(slots=True)
+class EventRecord:
+    """An event of the calendar, as returned by the API (EventRead) without the fields the calendar does not use."""
+    id: int
+    title: str = ""
+    description: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    record_modification: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EventRecord":
+        """Build a record from an API dict, ignoring the fields the calendar does not use."""
+        return cls(**{name: data[name] for name in _EVENT_FIELDS if data.get(name) is not None})
+
+    def with_changes(self, changes: Dict[str, Any]) -> "EventRecord":
+        """Return a copy with some fields changed (the ID never changes)."""
+        return replace(self, **{name: value for name, value in changes.items() if name in _EVENT_FIELDS and name != "id"})
+
+
+_CLIENT_FIELDS = frozenset(field.name for field in fields(ClientRecord))
+_ORDER_FIELDS = frozenset(field.name for field in fields(OrderRecord))
+_EVENT_FIELDS = frozenset(field.name for field in fields(EventRecord))
@@ -0,0 +1,217 @@
+# app/state/session_memory.py
+
+# Import necessary modules
+import asyncio                                                      # Importing asyncio for the periodic sweep
+import hashlib                                                      # Importing hashlib to identify the sessions without their tokens
+import os                                                           # Importing os for the offload files
+import pickle                                                       # Importing pickle to measure and offload the state values
+import sys                                                          # Importing sys for the size of the values pickle cannot handle
+import tempfile                                                     # Importing tempfile for the default offload directory
+import time                                                         # Importing time for the idle times
+import zlib                                                         # Importing zlib to compress the offloaded values
+from typing import Any, Iterator, Optional                          # Importing type hints
+import reflex as rx                                                 # Importing reflex for the states and the app
+from reflex.middleware import Middleware                            # Importing the Reflex middleware base class to see every event
+from ..config import state_memory_settings as sms                   # Importing the state memory settings
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# NOTE: This class handles the memory of the Reflex states kept in the backend for every session (browser tab).
+        # It is a Reflex middleware, so it sees every event and records the last activity of each session. It reports the approximate
+        # size (pickled bytes) of every state class of every session, and periodically offloads the sessions without events for
+        # STATE_IDLE_SECONDS: the heavy variables declared by the state classes in their '_offload_vars' class variable are written to
+        # disk and restored before the next event of that session. Only the in-memory state manager keeps the states in this process,
+        # with Redis there is nothing to report.
+        # The client tokens are enough to send events into a session, so they never leave the monitor: the report and the offload files
+        # use a hash of the token, and the files are only written to (and read from) a private directory of the app user.
+class SessionMemoryMonitor(Middleware):
+
+    def __init__(self, policy: str, idle_seconds: float, sweep_interval: float, offload_dir: str):
+        self.policy = policy
+        self.idle_seconds = idle_seconds
+        self.sweep_interval = sweep_interval
+        self.offload_dir = offload_dir
+        self.app: Optional[rx.App] = None
+        self._offload_dir_ready = False
+
+        # {client token: monotonic time of its last event}
+        self._last_seen: dict[str, float] = {}
+
+        # {client token: names of the state classes with offloaded variables}
+        self._idle: dict[str, set[str]] = {}
+
+    # Registers the monitor as a middleware of the Reflex app
+    def install(self, app: rx.App) -> None:
+        self.app = app
+        app.add_middleware(self)
+
+    # Returns the states of the sessions kept in memory ({client token: root state}), empty with other state managers
+    def _states(self) -> dict[str, Any]:
+        return getattr(self.app.state_manager, "states", {}) if self.app else {}
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Records the activity of the session, and restores its offloaded variables before the event is processed
+    async def preprocess(self, app, state, event):
+        token = event.token
+        self._last_seen[token] = time.monotonic()
+
+        if token in self._idle:
+            self._restore(token, state)
+
+        return None
+
+    # Iterates over a state and all its substates
+    @staticmethod
+    def _walk(state) -> Iterator[Any]:
+        yield state
+        for substate in state.substates.values():
+            yield from SessionMemoryMonitor._walk(substate)
+
+    # Returns the names and values of the variables of a state (frontend and backend, not the computed ones)
+    @staticmethod
+    def _vars(state) -> Iterator[tuple[str, Any]]:
+        for name in state.base_vars:
+            yield name, getattr(state, name, None)
+        yield from state._backend_vars.items()
+
+    # Returns the approximate size of a value in bytes
+    @staticmethod
+    def _size(value: Any) -> int:
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return sys.getsizeof(value)
+
+    # Returns the identifier of a session in the report and the offload files (a hash, the token itself gives access to the session)
+    @staticmethod
+    def session_id(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+    # Returns the offload directory, created private (0700) on first use: a new temporary directory of this process if none is set
+    def _private_offload_dir(self) -> str:
+        if not self._offload_dir_ready:
+            if self.offload_dir:
+                os.makedirs(self.offload_dir, mode=0o700, exist_ok=True)
+                os.chmod(self.offload_dir, 0o700)
+            else:
+                self.offload_dir = tempfile.mkdtemp(prefix="integra_state_")
+            self._offload_dir_ready = True
+        return self.offload_dir
+
+    # Returns the path of the offload file of a state class of a session
+    def _offload_path(self, token: str, state_name: str) -> str:
+        return os.path.join(self._private_offload_dir(), f"{self.session_id(token)}-{state_name}.pkl.z")
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Returns the approximate size in bytes of every state class of a session
+    def session_sizes(self, root) -> dict[str, int]:
+        return {state.get_full_name(): sum(self._size(value) for _, value in self._vars(state)) for state in self._walk(root)}
+
+    # Returns the memory report: totals by state class and the largest sessions
+    def stats(self, limit: int = 20) -> dict[str, Any]:
+        now = time.monotonic()
+        sessions, by_class = [], {}
+
+        for token, root in list(self._states().items()):
+            sizes = self.session_sizes(root)
+            for name, size in sizes.items():
+                by_class[name] = by_class.get(name, 0) + size
+
+            last_seen = self._last_seen.get(token)
+            sessions.append({
+                                "session": self.session_id(token),
+                                "bytes": sum(sizes.values()),
+                                "by_class": sizes,
+                                "idle_seconds": round(now - last_seen, 1) if last_seen is not None else None,
+                                "offloaded": sorted(self._idle.get(token, ())),
+                            })
+
+        sessions.sort(key=lambda session: session["bytes"], reverse=True)
+        return {
+                    "policy": self.policy,
+                    "sessions": len(sessions),
+                    "bytes": sum(by_class.values()),
+                    "by_class": dict(sorted(by_class.items(), key=lambda item: item[1], reverse=True)),
+                    "largest": sessions[:limit],
+                }
+
+    # ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+    # Offloads the heavy variables of every state class of a session which declares them
+    def _offload(self, token: str, root) -> None:
+        names = set()
+
+        for state in self._walk(root):
+            offload_vars = getattr(type(state), "_offload_vars", ())
+            if not offload_vars:
+                continue
+
+            values = {name: getattr(state, name) for name in offload_vars}
+            descriptor = os.open(self._offload_path(token, state.get_full_name()), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(zlib.compress(pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL), 1))
+
+            # The variables are left empty (of the same type), the computed vars which use them keep working
+            for name, value in values.items():
+                setattr(state, name, type(value)())
+            names.add(state.get_full_name())
+
+        if names:
+            self._idle[token] = names
+
+    # Restores the offloaded variables of a session
+    def _restore(self, token: str, root) -> None:
+        names = self._idle.pop(token)
+
+        for state in self._walk(root):
+            path = self._offload_path(token, state.get_full_name())
+            if state.get_full_name() not in names or not os.path.exists(path):
+                continue
+
+            with open(path, "rb") as file:
+                values = pickle.loads(zlib.decompress(file.read()))
+            os.remove(path)
+
+            for name, value in values.items():
+                setattr(state, name, value)
+
+    # Offloads the sessions without events for longer than the idle time
+    async def sweep(self) -> int:
+        now = time.monotonic()
+        swept = 0
+
+        for token in list(self._states()):
+            last_seen = self._last_seen.setdefault(token, now)
+            if token in self._idle or now - last_seen < self.idle_seconds:
+                continue
+
+            # The state lock of the session, so no event of that session runs meanwhile
+            async with self.app.state_manager.modify_state(token) as root:
+                if time.monotonic() - self._last_seen[token] >= self.idle_seconds:
+                    self._offload(token, root)
+                    swept += 1
+
+        return swept
+
+    # Background task which sweeps the idle sessions periodically (started by the app lifespan)
+    async def run_sweeper(self) -> None:
+        if self.policy != "offload" or self.idle_seconds <= 0:
+            if self.policy != "none":
+                print(f"Unknown STATE_IDLE_POLICY '{self.policy}' (expected 'offload' or 'none'), idle sessions are kept in memory")
+            return
+
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                swept = await self.sweep()
+                if swept:
+                    print(f"Idle sessions offloaded: {swept}")
+            except Exception as e:
+                print(f"Error sweeping idle sessions: {e}")
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Creates a single instance of SessionMemoryMonitor to use throughout the app
+session_memory_monitor = SessionMemoryMonitor(sms.STATE_IDLE_POLICY, sms.STATE_IDLE_SECONDS, sms.STATE_SWEEP_INTERVAL_SECONDS, sms.STATE_OFFLOAD_DIR)
@@ -6,6 +6,7 @@ This module provides a comprehensive design system with:
 - Theme configuration
 - Component-specific style utilities
 - Layout helpers and responsive utilities
+- Static utility classes (and their stylesheet) for the component variants
 
 Usage Examples:
     from app.utils.styles import colors, spacing, get_button_styles
@@ -63,6 +64,19 @@ from .components import (
     get_loading_spinner_styles
 )
 
+# Import the static utility classes of the component variants
+from .stylesheet import (
+    STYLESHEET_URL,
+    button_class,
+    card_class,
+    badge_class,
+    table_cell_class,
+    class_names,
+    build_stylesheet,
+    is_stylesheet_outdated,
+    write_stylesheet
+)
+
 # Export commonly used items for convenience
 __all__ = [
     # Theme and tokens
@@ -109,7 +123,18 @@ __all__ = [
     "get_badge_styles",
     "get_nav_link_styles",
     "get_divider_styles",
-    "get_loading_spinner_styles"
+    "get_loading_spinner_styles",
+    
+    # Static utility classes
+    "STYLESHEET_URL",
+    "button_class",
+    "card_class",
+    "badge_class",
+    "table_cell_class",
+    "class_names",
+    "build_stylesheet",
+    "is_stylesheet_outdated",
+    "write_stylesheet"
 ]
 
 # Version info
@@ -0,0 +1,323 @@
+"""
+Static Utility Stylesheet
+
+This module turns the token-derived variants of the style factories (button sizes
+and variants, card kinds, badge colors, table cells) into one static CSS file of
+class names, so the shared components reference classes instead of repeating the
+same inline styles (compiled into the page and sent on hydration) on every instance.
+
+The classes are derived from the style factories themselves, so the factories stay
+the single source of truth. For every factory:
+- The declarations shared by all the variants go to the base class (ds-btn).
+- The arguments which only add declarations, whatever the other arguments are, get
+  one class per value (ds-btn-full-width, ds-card-padding-lg).
+- The arguments which interact (e.g. the disabled button removes the hover of its
+  variant) get one class per combination (ds-btn--ghost-disabled).
+Building a stylesheet checks that the classes reproduce every variant exactly.
+
+Usage (build step, run after changing the tokens or the style factories and commit the file;
+the app only warns at import if it is outdated, --check fails instead, e.g. in CI):
+    python -m app.utils.styles.stylesheet [--check]
+"""
+
+import inspect
+import itertools
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .components import get_badge_styles, get_button_styles, get_card_styles, get_table_cell_styles
+from .theme import spacing
+
+# Set to False to render the inline styles again (e.g. to compare the page sizes)
+USE_STYLE_CLASSES = True
+
+# Stylesheet file (in the Reflex assets) and its URL in the app
+STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "assets", "styles", "design_system.css")
+STYLESHEET_URL = "/styles/design_system.css"
+
+# Style keys which Reflex expands to several CSS properties (same as reflex.style)
+_SHORTHANDS = {
+    "padding_x": ("padding-inline-start", "padding-inline-end"),
+    "padding_y": ("padding-top", "padding-bottom"),
+    "margin_x": ("margin-inline-start", "margin-inline-end"),
+    "margin_y": ("margin-top", "margin-bottom"),
+    "bg": ("background",),
+    "bg_color": ("background-color",),
+    "font_family": ("font-family", "--default-font-family"),
+}
+
+# Argument types which can have classes (anything else, such as a reflex Var, uses the inline style)
+_PLAIN_TYPES = (str, int, bool, type(None))
+
+# Flattened style: {(pseudo selector, css property): value}
+FlatStyle = Dict[Tuple[str, str], str]
+
+
+# ===========================
+# STYLE FLATTENING
+# ===========================
+def _css_properties(key: str) -> Tuple[str, ...]:
+    """Convert a style key to its CSS properties."""
+    if key.startswith("--"):
+        return (key,)
+    return _SHORTHANDS.get(key, (key.replace("_", "-"),))
+
+
+def _pseudo_selector(key: str) -> str:
+    """Convert a nested style key (_hover, :focus-visible) to its pseudo selector."""
+    if key.startswith("_"):
+        return ":" + key[1:].replace("_", "-")
+    if key.startswith(":"):
+        return key
+    raise ValueError(f"The nested style '{key}' can not be a static class (only pseudo selectors are supported)")
+
+
+def flatten_style(style: Dict[str, Any], selector: str = "") -> FlatStyle:
+    """
+    Flatten a style dict to its CSS declarations by pseudo selector.
+
+    Args:
+        style: Style dict as returned by the style factories
+        selector: Pseudo selector of the nested styles
+
+    Returns:
+        Dict of {(pseudo selector, css property): value}
+    """
+    flat = {}
+    for key, value in style.items():
+        if isinstance(value, dict):
+            flat.update(flatten_style(value, selector + _pseudo_selector(key)))
+        else:
+            for prop in _css_properties(key):
+                flat[(selector, prop)] = str(value)
+    return flat
+
+
+# ===========================
+# STYLE CLASSES
+# ===========================
+class StyleClasses:
+    """
+    Static classes of a style factory for the given argument values.
+
+    Args:
+        prefix: Class name prefix (ds-btn)
+        factory: Style factory
+        **axes: Values of each argument to turn into classes (the factory default must be one of them)
+    """
+
+    def __init__(self, prefix: str, factory: Callable[..., Dict[str, Any]], **axes: List[Any]):
+        self.prefix = prefix
+        self.factory = factory
+        self.axes = axes
+        parameters = inspect.signature(factory).parameters
+        self.defaults = {axis: parameters[axis].default for axis in axes}
+
+        # Split the arguments: the independent ones first, moving to the combined ones the ones the classes can not reproduce
+        independent = list(axes)
+        while True:
+            failing = self._build(independent)
+            if failing is None:
+                break
+            independent.remove(failing)
+
+    def _flat(self, **values) -> FlatStyle:
+        return flatten_style(self.factory(**{**self.defaults, **values}))
+
+    def _token(self, axis: str, value: Any, named: bool) -> Optional[str]:
+        """Class name part of an argument value (None for False and None)."""
+        if value is None or value is False:
+            return None
+        if value is True:
+            return axis.replace("_", "-")
+        return f"{axis.replace('_', '-')}-{value}" if named else str(value)
+
+    def _build(self, independent: List[str]) -> Optional[str]:
+        """Build the rules with the given independent arguments, returning the first argument which breaks a variant (or None)."""
+        combined = [axis for axis in self.axes if axis not in independent]
+        combos = [dict(zip(combined, values)) for values in itertools.product(*(self.axes[axis] for axis in combined))]
+
+        # Base and combined rules
+        flats = {self._combo_key(combo): self._flat(**combo) for combo in combos}
+        first = next(iter(flats.values()))
+        base = {prop: value for prop, value in first.items() if all(flat.get(prop) == value for flat in flats.values())}
+        combined_rules = {key: {prop: value for prop, value in flat.items() if base.get(prop) != value} for key, flat in flats.items()}
+
+        # Independent rules, the difference of each value with the default (a value which removes declarations can not be a class)
+        default_flat = self._flat()
+        independent_rules = {}
+        for axis in independent:
+            for value in self.axes[axis]:
+                if value == self.defaults[axis]:
+                    continue
+                flat = self._flat(**{axis: value})
+                if not set(default_flat) <= set(flat):
+                    return axis
+                independent_rules[(axis, value)] = {prop: v for prop, v in flat.items() if default_flat.get(prop) != v}
+
+        # Every variant must be reproduced by its classes, applied in the order of the stylesheet
+        for values in itertools.product(*self.axes.values()):
+            variant = dict(zip(self.axes, values))
+            cascade = {**base, **combined_rules[self._combo_key({axis: variant[axis] for axis in combined})]}
+            for axis in independent:
+                cascade.update(independent_rules.get((axis, variant[axis]), {}))
+
+            if cascade != flatten_style(self.factory(**variant)):
+                return next(axis for axis in independent if variant[axis] != self.defaults[axis])
+
+        self.independent = independent
+        self.combined = combined
+        self.rules = [(self.prefix, base)]
+        self.rules += [(self._combined_class(dict(key)), rules) for key, rules in combined_rules.items() if combined]
+        self.rules += [(f"{self.prefix}-{self._token(axis, value, True)}", rules) for (axis, value), rules in independent_rules.items()]
+        return None
+
+    @staticmethod
+    def _combo_key(combo: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+        return tuple(combo.items())
+
+    def _combined_class(self, combo: Dict[str, Any]) -> str:
+        tokens = [token for axis, value in combo.items() if (token := self._token(axis, value, False))]
+        return f"{self.prefix}--{'-'.join(tokens) or 'default'}"
+
+    def class_name(self, **values) -> Optional[str]:
+        """
+        Get the class names of a variant.
+
+        Returns:
+            Class names, or None if a value has no class (the component then uses the inline style)
+        """
+        values = {**self.defaults, **values}
+        if not USE_STYLE_CLASSES or any(type(values[axis]) not in _PLAIN_TYPES or values[axis] not in self.axes[axis] for axis in self.axes):
+            return None
+
+        names = [self.prefix]
+        if self.combined:
+            names.append(self._combined_class({axis: values[axis] for axis in self.combined}))
+        for axis in self.independent:
+            if values[axis] != self.defaults[axis]:
+                names.append(f"{self.prefix}-{self._token(axis, values[axis], True)}")
+        return " ".join(names)
+
+    def css(self) -> str:
+        """Get the CSS rules of the classes."""
+        blocks = []
+        for class_name, rules in self.rules:
+            by_selector: Dict[str, List[str]] = {}
+            for (selector, prop), value in rules.items():
+                by_selector.setdefault(selector, []).append(f"  {prop}: {value};")
+            for selector, declarations in by_selector.items():
+                blocks.append(f".{class_name}{selector} {{\n" + "\n".join(declarations) + "\n}")
+        return "\n".join(blocks)
+
+
+# ===========================
+# DESIGN SYSTEM CLASSES
+# ===========================
+BUTTON_CLASSES = StyleClasses(
+    "ds-btn", get_button_styles,
+    variant=["primary", "secondary", "outline", "ghost", "danger"],
+    size=["sm", "md", "lg"],
+    full_width=[False, True],
+    disabled=[False, True],
+)
+
+CARD_CLASSES = StyleClasses(
+    "ds-card", get_card_styles,
+    variant=["default", "outline", "filled"],
+    padding=list(spacing),
+    hoverable=[False, True],
+    elevated=[False, True],
+)
+
+BADGE_CLASSES = StyleClasses(
+    "ds-badge", get_badge_styles,
+    variant=["default", "success", "warning", "error", "info"],
+    size=["sm", "md"],
+)
+
+TABLE_CELL_CLASSES = StyleClasses(
+    "ds-cell", get_table_cell_styles,
+    striped=[False, True],
+    row_index=[None, 0, 1],
+)
+
+
+def button_class(variant: str = "primary", size: str = "md", full_width: bool = False, disabled: bool = False) -> Optional[str]:
+    """Get the classes of a button variant (see get_button_styles)."""
+    return BUTTON_CLASSES.class_name(variant=variant, size=size, full_width=full_width, disabled=disabled)
+
+
+def card_class(variant: str = "default", padding: str = "md", hoverable: bool = False, elevated: bool = False) -> Optional[str]:
+    """Get the classes of a card variant (see get_card_styles)."""
+    return CARD_CLASSES.class_name(variant=variant, padding=padding, hoverable=hoverable, elevated=elevated)
+
+
+def badge_class(variant: str = "default", size: str = "md") -> Optional[str]:
+    """Get the classes of a badge variant (see get_badge_styles)."""
+    return BADGE_CLASSES.class_name(variant=variant, size=size)
+
+
+def table_cell_class(striped: bool = False, row_index: Optional[int] = None) -> Optional[str]:
+    """Get the classes of a table cell (see get_table_cell_styles), only the parity of the row matters."""
+    return TABLE_CELL_CLASSES.class_name(striped=striped, row_index=None if row_index is None else row_index % 2)
+
+
+def class_names(*names: Optional[str]) -> Optional[str]:
+    """Join class names, skipping the empty ones."""
+    return " ".join(name for name in names if name) or None
+
+
+# ===========================
+# BUILD STEP
+# ===========================
+def build_stylesheet() -> str:
+    """Build the CSS of every design system class."""
+    sections = [
+        "/* Generated by app/utils/styles/stylesheet.py from the design tokens, do not edit. */",
+        BUTTON_CLASSES.css(),
+        CARD_CLASSES.css(),
+        BADGE_CLASSES.css(),
+        TABLE_CELL_CLASSES.css(),
+    ]
+    return "\n\n".join(sections) + "\n"
+
+
+def is_stylesheet_outdated(path: str = STYLESHEET_PATH, css: Optional[str] = None) -> bool:
+    """Check if the stylesheet file is missing or differs from the one built from the current tokens."""
+    css = build_stylesheet() if css is None else css
+    path = os.path.normpath(path)
+    if not os.path.exists(path):
+        return True
+    with open(path, encoding="utf-8") as file:
+        return file.read() != css
+
+
+def write_stylesheet(path: str = STYLESHEET_PATH) -> bool:
+    """
+    Write the stylesheet if it is missing or outdated.
+
+    Returns:
+        Whether the file was written
+    """
+    css = build_stylesheet()
+    if not is_stylesheet_outdated(path, css):
+        return False
+
+    path = os.path.normpath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(css)
+    return True
+
+
+if __name__ == "__main__":
+    path = os.path.normpath(STYLESHEET_PATH)
+    if "--check" in sys.argv[1:]:
+        outdated = is_stylesheet_outdated()
+        print(f"{path} {'outdated, run: python -m app.utils.styles.stylesheet' if outdated else 'up to date'}")
+        sys.exit(1 if outdated else 0)
+
+    written = write_stylesheet()
+    print(f"{path} {'written' if written else 'up to date'}")
@@ -0,0 +1,120 @@
+# benchmarks/api_client_benchmark.py
+
+# NOTE: Benchmark of the per-call overhead of the API requests made by the Reflex states.
+        # It serves a minimal app with uvicorn and calls a tiny endpoint with: a new httpx.AsyncClient per call (the previous pattern),
+        # the shared ApiClient with the pooled keep-alive "http" transport, and the shared ApiClient with the in-process "asgi" transport.
+        # Usage: python -m benchmarks.api_client_benchmark [--calls 2000] [--concurrency 1]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import asyncio                                                                  # Importing asyncio to run the server and the clients
+import socket                                                                   # Importing socket to find a free port
+import time                                                                     # Importing time for measuring the latencies
+import httpx                                                                    # Importing httpx for the per-call client
+import uvicorn                                                                  # Importing uvicorn to serve the endpoint
+from fastapi import FastAPI                                                     # Importing FastAPI for the endpoint
+from app.config import app_settings as aps                                      # Importing the app settings to point the pooled client to the server
+from app.state.api_client import ApiClient                                      # Importing the shared client under test
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def build_app() -> FastAPI:
+    """ Builds an app with a tiny JSON endpoint, so the client overhead dominates """
+
+    app = FastAPI()
+
+    @app.post("/ping")
+    async def ping(data: dict):
+        return {"pong": data.get("n")}
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+async def call_new_client(base_url: str, n: int) -> None:
+    async with httpx.AsyncClient(follow_redirects=True) as client:
+        response = await client.post(f"{base_url}/ping", json={"n": n}, timeout=10)
+        response.raise_for_status()
+
+
+async def call_shared_client(client: ApiClient, n: int) -> None:
+    response = await client.post("/ping", json={"n": n})
+    response.raise_for_status()
+
+
+async def measure(call, calls: int, concurrency: int) -> tuple[list[float], float]:
+    """ Runs the calls with a concurrency limit and returns the latency of each one (ms) and the total time (s) """
+
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(n: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call(n)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(n) for n in range(calls)))
+    return latencies, time.perf_counter() - start
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+async def run(args: argparse.Namespace) -> None:
+    app = build_app()
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    base_url = f"http://127.0.0.1:{port}"
+    aps.API_URL = base_url
+
+    pooled = ApiClient()
+    pooled.open(transport="http")
+    in_process = ApiClient()
+    in_process.open(app, transport="asgi")
+
+    modes = {
+                "new client per call": lambda n: call_new_client(base_url, n),
+                "shared pooled http": lambda n: call_shared_client(pooled, n),
+                "shared asgi": lambda n: call_shared_client(in_process, n),
+            }
+
+    print(f"{'mode':<22} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'calls/s':>9}")
+    for name, call in modes.items():
+        await measure(call, min(50, args.calls), args.concurrency)     # Warm-up
+        latencies, seconds = await measure(call, args.calls, args.concurrency)
+        print(f"{name:<22} {percentile(latencies, 0.50):>8.3f} {percentile(latencies, 0.95):>8.3f} "
+              f"{percentile(latencies, 0.99):>8.3f} {args.calls / seconds:>9.0f}")
+
+    # Cleanup
+    await pooled.close()
+    await in_process.close()
+    server.should_exit = True
+    await server_task
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the per-call overhead of the API client of the Reflex states.")
+    parser.add_argument("--calls", type=int, default=2000, help="Calls per mode (default: 2000)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent calls (default: 1)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
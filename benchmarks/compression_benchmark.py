@@ -0,0 +1,74 @@
+# benchmarks/compression_benchmark.py
+
+# NOTE: Benchmark of the response compression for typical event list payloads (/events and /admin/events/).
+        # It reports the bytes sent and the CPU time per request of every available encoding, for a month and a year of events.
+        # Usage: python -m benchmarks.compression_benchmark [--iterations 200]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import json                                                                     # Importing json to build the payloads as FastAPI does
+import random                                                                   # Importing random to generate the sample events
+import time                                                                     # Importing time for measuring the CPU time
+from datetime import datetime, timedelta                                        # Importing datetime for the sample timestamps
+from app.api.utils.compression import available_encodings, new_encoder          # Importing the encoders used by the middleware
+
+# Events per payload: a busy month and a busy year of a single calendar
+PAYLOADS = {"month": 90, "year": 1100}
+
+TITLES = ["Reunión de equipo", "Llamada con cliente", "Revisión de presupuesto", "Dentista", "Entrega de proyecto", "Formación", "Comida"]
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def build_payload(amount: int) -> bytes:
+    """ Builds a JSON list of EventRead-like objects, serialized as the API responses """
+
+    rng = random.Random(amount)
+    start = datetime(2025, 1, 1, 8, 0)
+    events = []
+
+    for event_id in range(1, amount + 1):
+        start_date = start + timedelta(hours=rng.randint(0, 24 * 365))
+        events.append({
+                        "title": rng.choice(TITLES),
+                        "description": rng.choice([None, "Preparar la documentación y revisar los puntos pendientes de la semana anterior."]),
+                        "start_date": start_date.isoformat(),
+                        "end_date": (start_date + timedelta(minutes=rng.choice([30, 60, 90]))).isoformat(),
+                        "id": event_id,
+                        "record_creation": (start_date - timedelta(days=7, microseconds=rng.randint(0, 999999))).isoformat(),
+                        "record_modification": (start_date - timedelta(days=1, microseconds=rng.randint(0, 999999))).isoformat(),
+                        "user_id": 1,
+                    })
+
+    return json.dumps(events, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def measure(encoding: str, payload: bytes, iterations: int) -> tuple[int, float]:
+    """ Returns the compressed size and the CPU time per request in milliseconds """
+
+    start = time.process_time()
+    for _ in range(iterations):
+        encoder = new_encoder(encoding)
+        compressed = encoder.compress(payload) + encoder.flush()
+    elapsed = time.process_time() - start
+
+    return len(compressed), elapsed * 1000 / iterations
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the response compression of event list payloads.")
+    parser.add_argument("--iterations", type=int, default=200, help="Compressions per encoding and payload (default: 200)")
+    args = parser.parse_args()
+
+    print(f"{'payload':<8} {'encoding':<9} {'bytes':>10} {'ratio':>7} {'cpu ms/req':>11}")
+    for name, amount in PAYLOADS.items():
+        payload = build_payload(amount)
+        print(f"{name:<8} {'identity':<9} {len(payload):>10} {1.0:>7.2f} {0.0:>11.3f}")
+
+        for encoding in available_encodings():
+            size, cpu_ms = measure(encoding, payload, args.iterations)
+            print(f"{name:<8} {encoding:<9} {size:>10} {len(payload) / size:>7.2f} {cpu_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/login_benchmark.py
+
+# NOTE: Benchmark of the login-to-authenticated time of AuthState against a running API, before and after /loginJSON returned the profile.
+        # Before: POST /loginJSON, then GET /me-cookie, and four WebSocket hops (two call_script events and their callbacks).
+        # After: POST /loginJSON only, and two WebSocket hops. The hops are not measured here (no browser), so their cost is given with --hop-ms.
+        # Usage: python -m benchmarks.login_benchmark --nickname USER --password PASS [--api-url URL] [--logins 50] [--hop-ms 2]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import asyncio                                                                  # Importing asyncio to run the HTTP client
+import time                                                                     # Importing time for measuring the latencies
+import httpx                                                                    # Importing httpx as the browser fetch requests
+from app.config import app_settings as aps                                      # Importing the API URL used by the frontend
+
+# WebSocket hops between the login event and the authenticated state of each flow
+HOPS = {"before": 4, "after": 2}
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def login(client: httpx.AsyncClient, args: argparse.Namespace, flow: str) -> float:
+    """ Logs in with one of the flows and returns the HTTP time in milliseconds until the profile is known """
+
+    client.cookies.clear()
+    start = time.perf_counter()
+
+    response = await client.post("/loginJSON", json={"nickname": args.nickname, "password": args.password})
+    response.raise_for_status()
+
+    # The previous flow ignored the profile and asked for it with the cookies just set
+    if flow == "before":
+        response = await client.get("/me-cookie")
+        response.raise_for_status()
+    elif not response.json().get("user"):
+        raise RuntimeError("The API does not return the user profile on /loginJSON")
+
+    return (time.perf_counter() - start) * 1000
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+async def run(args: argparse.Namespace) -> None:
+    async with httpx.AsyncClient(base_url=args.api_url, timeout=10) as client:
+        print(f"{'flow':<8} {'http p50 ms':>12} {'http p95 ms':>12} {'hops':>5} {'total p50 ms':>13}")
+
+        for flow in ("before", "after"):
+            latencies = [await login(client, args, flow) for _ in range(args.logins)]
+            p50 = percentile(latencies, 0.50)
+            print(f"{flow:<8} {p50:>12.2f} {percentile(latencies, 0.95):>12.2f} {HOPS[flow]:>5} {p50 + HOPS[flow] * args.hop_ms:>13.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the login-to-authenticated time of the frontend login flow.")
+    parser.add_argument("--nickname", required=True, help="Nickname of an existing user")
+    parser.add_argument("--password", required=True, help="Password of the user")
+    parser.add_argument("--api-url", default=aps.API_URL, help=f"URL of the running API (default: {aps.API_URL})")
+    parser.add_argument("--logins", type=int, default=50, help="Logins per flow (default: 50)")
+    parser.add_argument("--hop-ms", type=float, default=2.0, help="Estimated time of a WebSocket hop browser <-> state (default: 2)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/metrics_benchmark.py
+
+# NOTE: Benchmark of the overhead of the metrics middleware per request, and of the rendering of /metrics.
+        # It calls a no-op ASGI app (start and body messages, like a small JSON response) many times directly, with and without
+        # the MetricsMiddleware, so the difference is only the cost of the instrumentation (no server, network or routing).
+        # The requests are spread over several routes and statuses, so the counters and histograms are not all the same key.
+        # Usage: python -m benchmarks.metrics_benchmark [--requests 200000] [--repeats 5] [--routes 20]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import asyncio                                                                  # Importing asyncio to run the ASGI calls
+import time                                                                     # Importing time for measuring the requests
+from app.api.utils.metrics import MetricsMiddleware, RequestMetrics             # Importing the middleware and its metrics
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+# Response sent by the no-op app
+BODY = b'{"id": 1, "title": "Benchmark"}'
+START = {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]}
+
+
+# Route matched by the router, as FastAPI stores it in the scope
+class FakeRoute:
+    def __init__(self, path_format: str):
+        self.path_format = path_format
+
+
+async def noop_app(scope, receive, send):
+    await send({**START, "status": scope["status"]})
+    await send({"type": "http.response.body", "body": BODY})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def make_scopes(routes: int) -> list[dict]:
+    """ Builds the scopes of the requests: GET and POST over the routes, a few with error statuses """
+
+    scopes = []
+    for index in range(routes):
+        route = FakeRoute(f"/bench/{index}/{{item_id}}")
+        for method, status in (("GET", 200), ("GET", 200), ("POST", 201), ("GET", 404)):
+            scopes.append({"type": "http", "method": method, "path": f"/bench/{index}/1", "route": route, "status": status})
+    return scopes
+
+
+async def run(app, scopes: list[dict], requests: int) -> float:
+    """ Sends the requests to the ASGI app and returns the time per request in microseconds """
+
+    count = len(scopes)
+    start = time.perf_counter()
+    for index in range(requests):
+        await app(scopes[index % count], receive, send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+async def benchmark(args) -> None:
+    scopes = make_scopes(args.routes)
+    metrics = RequestMetrics()
+    instrumented = MetricsMiddleware(noop_app, metrics=metrics)
+
+    # Warm-up, so every series already exists (the steady state of a running app)
+    await run(noop_app, scopes, len(scopes))
+    await run(instrumented, scopes, len(scopes))
+
+    bare, measured = [], []
+    for _ in range(args.repeats):
+        bare.append(await run(noop_app, scopes, args.requests))
+        measured.append(await run(instrumented, scopes, args.requests))
+
+    overheads = [with_metrics - without for with_metrics, without in zip(measured, bare)]
+    print(f"{args.requests} requests x {args.repeats} repeats over {len(scopes)} series")
+    print(f"{'mode':<22} {'p50 us/req':>11} {'max us/req':>11}")
+    print(f"{'without metrics':<22} {percentile(bare, 0.50):>11.2f} {max(bare):>11.2f}")
+    print(f"{'with metrics':<22} {percentile(measured, 0.50):>11.2f} {max(measured):>11.2f}")
+    print(f"{'overhead':<22} {percentile(overheads, 0.50):>11.2f} {max(overheads):>11.2f}")
+
+    # Rendering of /metrics with every series recorded
+    times = []
+    for _ in range(args.repeats * 20):
+        start = time.perf_counter()
+        text = metrics.render()
+        times.append((time.perf_counter() - start) * 1000)
+    print(f"\nRender of /metrics: {len(text.splitlines())} lines, {len(text.encode())} bytes, p50 {percentile(times, 0.50):.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the overhead of the metrics middleware per request and the rendering of /metrics.")
+    parser.add_argument("--requests", type=int, default=200_000, help="Requests per run (default: 200000)")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per mode (default: 5)")
+    parser.add_argument("--routes", type=int, default=20, help="Routes of the requests (default: 20)")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
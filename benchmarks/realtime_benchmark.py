@@ -0,0 +1,165 @@
+# benchmarks/realtime_benchmark.py
+
+# NOTE: Benchmark of the real-time notifications hub (ConnectionManager) with real local WebSockets.
+        # It serves a minimal app with uvicorn, opens the sockets with the 'websockets' client (several per user), and publishes rounds of
+        # notifications to every user. It reports the fan-out latency (publish -> received by the client) of the sockets that read normally,
+        # while some slow sockets never read, to check they do not delay the rest.
+        # Usage: python -m benchmarks.realtime_benchmark [--sockets 10000] [--sockets-per-user 2] [--slow 100] [--rounds 20]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import asyncio                                                                  # Importing asyncio to run the server and the clients
+import json                                                                     # Importing json to parse the notifications
+import resource                                                                 # Importing resource to raise the open files limit
+import socket                                                                   # Importing socket to find a free port
+import statistics                                                               # Importing statistics for the latency percentiles
+import time                                                                     # Importing time for measuring the latencies
+import uvicorn                                                                  # Importing uvicorn to serve the WebSocket endpoint
+import websockets                                                               # Importing websockets for the client sockets
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect                     # Importing FastAPI components for the endpoint
+from app.api.utils.realtime import ConnectionManager                            # Importing the hub under test
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def build_app(manager: ConnectionManager) -> FastAPI:
+    """ Builds an app with the same subscription loop as /api/_event/, but the user ID comes from the path (no authentication) """
+
+    app = FastAPI()
+
+    @app.websocket("/ws/{user_id}")
+    async def subscribe(websocket: WebSocket, user_id: int):
+        await websocket.accept()
+        connection = manager.connect(user_id, websocket)
+        try:
+            while True:
+                await websocket.receive_text()
+                manager.touch(connection)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            manager.disconnect(connection)
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def raise_open_files_limit(sockets: int) -> None:
+    """ Every socket uses two file descriptors (client and server side) """
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    needed = sockets * 2 + 1024
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+class Client:
+    """ A client socket which records the latency of every benchmark notification it reads """
+
+    def __init__(self, websocket, latencies: list[float], received: dict[int, int]):
+        self.websocket = websocket
+        self.latencies = latencies
+        self.received = received
+
+    async def read(self) -> None:
+        try:
+            async for raw in self.websocket:
+                message = json.loads(raw)
+                if message["op"] == "bench":
+                    self.latencies.append(time.perf_counter() - message["t"])
+                    self.received[message["id"]] = self.received.get(message["id"], 0) + 1
+        except websockets.ConnectionClosed:
+            pass
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+async def run(args: argparse.Namespace) -> None:
+    manager = ConnectionManager(args.queue_size, args.policy, send_timeout=10, heartbeat_interval=3600, idle_timeout=3600)
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(build_app(manager), host="127.0.0.1", port=port, log_level="warning", backlog=4096))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    users = max(1, args.sockets // args.sockets_per_user)
+    latencies: list[float] = []
+    received: dict[int, int] = {}
+    clients: list[Client] = []
+    readers: list[asyncio.Task] = []
+
+    # Opens the sockets in batches, the last ones are the slow consumers (they never read)
+    start = time.perf_counter()
+    for first in range(0, args.sockets, args.connect_batch):
+        batch = range(first, min(first + args.connect_batch, args.sockets))
+        websockets_batch = await asyncio.gather(*(
+                                                    websockets.connect(f"ws://127.0.0.1:{port}/ws/{index % users}", max_queue=None, open_timeout=60)
+                                                    for index in batch
+                                                ))
+        for index, websocket in zip(batch, websockets_batch):
+            client = Client(websocket, latencies, received)
+            clients.append(client)
+            if index < args.sockets - args.slow:
+                readers.append(asyncio.create_task(client.read()))
+
+    connect_seconds = time.perf_counter() - start
+    fast_sockets = args.sockets - args.slow
+    print(f"connected {args.sockets} sockets ({users} users, {args.slow} slow) in {connect_seconds:.2f} s")
+
+    # Publishes the rounds, grouped by user, and waits until every fast socket got each one
+    round_seconds = []
+    for round_id in range(args.rounds):
+        sent_at = time.perf_counter()
+        manager.publish_grouped((user_id, {"op": "bench", "id": round_id, "t": sent_at}) for user_id in range(users))
+        publish_seconds = time.perf_counter() - sent_at
+
+        deadline = sent_at + 30
+        while received.get(round_id, 0) < fast_sockets and time.perf_counter() < deadline:
+            await asyncio.sleep(0.001)
+
+        round_seconds.append(time.perf_counter() - sent_at)
+        if round_id == 0:
+            print(f"publish call (enqueue only): {publish_seconds * 1000:.2f} ms")
+
+    stats = manager.stats()
+    print(f"notifications received: {len(latencies)} / {fast_sockets * args.rounds} expected from the fast sockets")
+    print(f"latency ms  p50 {statistics.median(latencies) * 1000:.2f}  p95 {percentile(latencies, 0.95) * 1000:.2f}  "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f}  max {max(latencies) * 1000:.2f}")
+    print(f"full fan-out per round ms  mean {statistics.mean(round_seconds) * 1000:.2f}  max {max(round_seconds) * 1000:.2f}")
+    print(f"hub: {stats['connections']} connections, {stats['dropped']} notifications dropped ({stats['policy']} policy)")
+
+    # Cleanup
+    for task in readers:
+        task.cancel()
+    await asyncio.gather(*(client.websocket.close() for client in clients), return_exceptions=True)
+    server.should_exit = True
+    await server_task
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the fan-out latency of the real-time notifications hub.")
+    parser.add_argument("--sockets", type=int, default=10000, help="Concurrent local sockets (default: 10000)")
+    parser.add_argument("--sockets-per-user", type=int, default=2, help="Sockets subscribed to each user (default: 2)")
+    parser.add_argument("--slow", type=int, default=100, help="Sockets that never read their notifications (default: 100)")
+    parser.add_argument("--rounds", type=int, default=20, help="Notifications published to every user (default: 20)")
+    parser.add_argument("--queue-size", type=int, default=100, help="Send queue size per connection (default: 100)")
+    parser.add_argument("--policy", choices=["coalesce", "drop"], default="coalesce", help="Slow consumer policy (default: coalesce)")
+    parser.add_argument("--connect-batch", type=int, default=500, help="Sockets opened concurrently (default: 500)")
+    args = parser.parse_args()
+
+    raise_open_files_limit(args.sockets)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
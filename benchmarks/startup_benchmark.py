@@ -0,0 +1,125 @@
+# benchmarks/startup_benchmark.py
+
+# NOTE: Benchmark of the cold start of the app (what a restarted worker or a new autoscaled instance pays before serving).
+        # Every run is a fresh interpreter, so nothing is cached in memory between runs. It reports:
+        # - The import time of each module and of each top-level package, from "python -X importtime" (the slowest ones first).
+        # - The time to import the app module, and the time to the first response of the FastAPI app after it (in-process,
+        #   without the lifespan, so it does not depend on the database).
+        # Usage: python -m benchmarks.startup_benchmark [--runs 5] [--module app.main] [--path /] [--top 25]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import json                                                                     # Importing json to read the measures of the child process
+import os                                                                       # Importing os for the environment of the child process
+import subprocess                                                               # Importing subprocess to start a fresh interpreter per run
+import sys                                                                      # Importing sys for the current interpreter
+import time                                                                     # Importing time for measuring the process start
+
+# Code run by the child interpreter: imports the app and sends a first request to its FastAPI app in-process
+FIRST_REQUEST_CODE = """
+import asyncio, importlib, json, sys, time
+start = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+
+async def first_request():
+    import httpx
+    app = getattr(module, "app_fastapi", None) or getattr(module, "app")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://startup.benchmark") as client:
+        return (await client.get(sys.argv[2])).status_code
+
+status = asyncio.run(first_request())
+print(json.dumps({"import": imported - start, "first_request": time.perf_counter() - imported, "status": status}))
+"""
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def child_env() -> dict[str, str]:
+    """ Environment of the child interpreters (no bytecode writes, so every run reads the same cache) """
+
+    env = dict(os.environ)
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def import_times(module: str) -> dict[str, int]:
+    """ Returns the cumulative import time of each module in microseconds, from the "-X importtime" report of a fresh interpreter """
+
+    result = subprocess.run(
+                                [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                capture_output=True, text=True, env=child_env(),
+                            )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    # Lines like "import time:       123 |       4567 |     app.config"
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = max(times.get(name.strip(), 0), int(cumulative))
+    return times
+
+
+def top_level_times(times: dict[str, int]) -> dict[str, int]:
+    """ Returns the import time of each top-level package (the cumulative time of the package itself, which includes its submodules) """
+
+    return {name: cumulative for name, cumulative in times.items() if "." not in name}
+
+
+def first_request(module: str, path: str) -> dict:
+    """ Returns the process start, import and first request times (seconds) of a fresh interpreter """
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", FIRST_REQUEST_CODE, module, path], capture_output=True, text=True, env=child_env())
+    total = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"First request to {module} failed:\n{result.stderr[-2000:]}")
+
+    measures = json.loads(result.stdout.strip().splitlines()[-1])
+    measures["total"] = total
+    return measures
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def print_ranking(title: str, times: dict[str, int], top: int) -> None:
+    print(f"\n{title}")
+    print(f"{'module':<60} {'ms':>9}")
+    for name, cumulative in sorted(times.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"{name:<60} {cumulative / 1000:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the cold start (imports and first request) of the app.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measure (default: 5)")
+    parser.add_argument("--module", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--path", default="/", help="Path of the first request (default: /)")
+    parser.add_argument("--top", type=int, default=25, help="Modules shown in the rankings (default: 25)")
+    args = parser.parse_args()
+
+    # Import times, the median run of each module (the first run warms the OS file cache)
+    import_times(args.module)
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    times = {name: int(percentile([run.get(name, 0) for run in runs], 0.50)) for name in runs[0]}
+
+    print_ranking("Slowest top-level packages (cumulative import time, median)", top_level_times(times), args.top)
+    print_ranking(f"Slowest modules of {args.module.split('.')[0]} (cumulative import time, median)",
+                  {name: cumulative for name, cumulative in times.items() if name.split(".")[0] == args.module.split(".")[0]}, args.top)
+
+    # Time to the first request
+    samples = [first_request(args.module, args.path) for _ in range(args.runs)]
+    print(f"\nCold start of {args.module} ({args.runs} runs, first response status {samples[-1]['status']})")
+    print(f"{'measure':<22} {'p50 ms':>9} {'max ms':>9}")
+    for measure in ("import", "first_request", "total"):
+        values = [sample[measure] * 1000 for sample in samples]
+        print(f"{measure:<22} {percentile(values, 0.50):>9.1f} {max(values):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
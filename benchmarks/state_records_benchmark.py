@@ -0,0 +1,130 @@
+# benchmarks/state_records_benchmark.py
+
+# NOTE: Benchmark of the rows held in AppState: plain dicts (as the API returns them) against the slots-backed records.
+        # It reports the per-session memory of the clients and orders lists, and the size of the JSON deltas a real AppState
+        # sends to the browser after each kind of mutation (as Reflex serializes them in its state updates).
+        # Usage: python -m benchmarks.state_records_benchmark [--rows 5000]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import random                                                                   # Importing random to generate the sample rows
+import tracemalloc                                                              # Importing tracemalloc for measuring the allocated memory
+from datetime import datetime, timedelta                                        # Importing datetime for the sample timestamps
+from reflex.utils.format import json_dumps                                      # Importing json_dumps to serialize the deltas as Reflex does
+from app.state.app_state import AppState, LOAD_CHUNK_SIZE                       # Importing the state under test
+from app.state.records import ClientRecord, OrderRecord                         # Importing the records held by AppState
+
+NAMES = ["Juan Pérez", "María García", "Carlos López", "Lucía Martín", "Javier Sánchez", "Elena Romero"]
+STATUSES = {"clients": ["active", "inactive"], "orders": ["pending", "completed", "cancelled"]}
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def build_rows(amount: int) -> tuple[list[dict], list[dict]]:
+    """ Builds the client and order dicts as the API returns them (with the fields the views do not use) """
+
+    rng = random.Random(amount)
+    start = datetime(2024, 1, 1, 9, 0)
+    clients, orders = [], []
+
+    for row_id in range(1, amount + 1):
+        created_at = (start + timedelta(minutes=rng.randint(0, 60 * 24 * 365))).isoformat() + "Z"
+        name = f"{rng.choice(NAMES)} {row_id}"
+        clients.append({
+                        "id": row_id,
+                        "name": name,
+                        "email": f"cliente{row_id}@example.com",
+                        "phone": f"+34 {rng.randint(600000000, 699999999)}",
+                        "company": f"Empresa {row_id} S.L.",
+                        "address": f"Calle Mayor {row_id}, Madrid",
+                        "status": rng.choice(STATUSES["clients"]),
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                        "notes": None,
+                    })
+        orders.append({
+                        "id": 1000 + row_id,
+                        "client_id": row_id,
+                        "client_name": name,
+                        "description": "Desarrollo de aplicación web",
+                        "amount": round(rng.uniform(100, 20000), 2),
+                        "status": rng.choice(STATUSES["orders"]),
+                        "created_at": created_at,
+                        "due_date": created_at,
+                        "updated_at": created_at,
+                    })
+
+    return clients, orders
+
+
+def measure_memory(build) -> int:
+    """ Returns the bytes allocated by a builder and still alive, i.e. what a session keeps in memory """
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+
+    return after - before
+
+
+def build_state(clients: list[dict], orders: list[dict]) -> AppState:
+    """ Builds an AppState (without a running app) holding the rows, with its pending delta already sent """
+
+    root = AppState.get_root_state()(_reflex_internal_init=True)
+    state = root.get_substate(AppState.get_full_name().split(".")[1:])
+    state._append_clients([ClientRecord.from_dict(row) for row in clients])
+    state._append_orders([OrderRecord.from_dict(row) for row in orders])
+    root._clean()
+
+    return state
+
+
+def delta_size(state: AppState, mutate) -> int:
+    """ Returns the size of the JSON delta sent to the browser after a mutation of the state """
+
+    mutate(state)
+    root = state.parent_state
+    size = len(json_dumps(root.get_delta()).encode("utf-8"))
+    root._clean()
+
+    return size
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the memory and delta size of the AppState rows.")
+    parser.add_argument("--rows", type=int, default=5000, help="Clients and orders per session (default: 5000)")
+    args = parser.parse_args()
+
+    clients, orders = build_rows(args.rows)
+    samples = {"clients": (clients, ClientRecord), "orders": (orders, OrderRecord)}
+
+    print(f"{'rows':<8} {'shape':<8} {'memory KiB':>11}")
+    for name, (rows, record) in samples.items():
+        # The builders copy the rows, so the memory is measured as a session holding its own list
+        dict_memory = measure_memory(lambda: [dict(row) for row in rows])
+        record_memory = measure_memory(lambda: [record.from_dict(row) for row in rows])
+
+        print(f"{name:<8} {'dict':<8} {dict_memory / 1024:>11.1f}")
+        print(f"{name:<8} {'record':<8} {record_memory / 1024:>11.1f}")
+
+    state = build_state(clients, orders)
+    extra_clients, extra_orders = build_rows(args.rows + LOAD_CHUNK_SIZE)
+    mutations = {
+                    "add client": lambda state: state.add_client(extra_clients[-1]),
+                    "update client": lambda state: state.update_client("1", {"status": "inactive"}),
+                    "remove client": lambda state: state.remove_client("2"),
+                    "scroll clients": lambda state: state.set_clients_window([100, 130]),
+                    "update order": lambda state: state.update_order("1001", {"status": "completed"}),
+                    "load orders chunk": lambda state: state._append_orders([OrderRecord.from_dict(row) for row in extra_orders[-LOAD_CHUNK_SIZE:]]),
+                }
+
+    print(f"\n{'mutation':<18} {'delta B':>9}")
+    for name, mutate in mutations.items():
+        print(f"{name:<18} {delta_size(state, mutate):>9}")
+
+
+if __name__ == "__main__":
+    main()
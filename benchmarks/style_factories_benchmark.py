@@ -0,0 +1,122 @@
+# benchmarks/style_factories_benchmark.py
+
+# NOTE: Benchmark of the page build time and memory with memoized style factories against the plain style functions the app uses.
+        # It builds the component trees of MainPage and SPALayout (what Reflex does for every page when compiling, and for the
+        # stateful pages in every backend worker) and reports the time per build, the memory held by a built tree and the peak.
+        # The memoized run swaps every get_*_styles function, in every imported app module, for a cached wrapper returning a shallow
+        # copy of the cached style (the callers extend the styles they get, so a shared style must be copied before it is changed).
+        # This is the evidence the style functions are not memoized (user-048): building the Reflex components dominates the page
+        # build, and the memoized factories build the pages in the same time with the same memory held.
+        # Usage: python -m benchmarks.style_factories_benchmark [--builds 20]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import functools                                                                # Importing functools to memoize the style functions
+import gc                                                                       # Importing gc to measure every build from a clean heap
+import sys                                                                      # Importing sys to find the imported app modules
+import time                                                                     # Importing time for measuring the builds
+import tracemalloc                                                              # Importing tracemalloc for measuring the allocated memory
+from app.components.layout.spa_layout import SPALayout                          # Importing the layout under test
+from app.pages.main_page import MainPage                                        # Importing the page under test
+from app.utils.styles import components, theme                                  # Importing the modules of the style functions
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def memoize(function):
+    """ Caches a style function by its arguments, returning a shallow copy of the cached style (arguments such as Vars are not cached) """
+
+    cached = functools.lru_cache(maxsize=None)(function)
+
+    @functools.wraps(function)
+    def factory(*args, **kwargs):
+        try:
+            return dict(cached(*args, **kwargs))
+        except TypeError:
+            return function(*args, **kwargs)
+
+    factory.cache_info = cached.cache_info
+    return factory
+
+
+# The plain style functions and their memoized factories
+PLAIN = {
+            id(function): function
+            for module in (components, theme)
+            for name, function in vars(module).items()
+            if name.startswith("get_") and name.endswith("_styles") and callable(function)
+        }
+MEMOIZED = {key: memoize(function) for key, function in PLAIN.items()}
+
+
+def swap_factories(memoized: bool) -> int:
+    """ Points every reference to a style function in the app modules to its memoized factory (or back), returning the references swapped """
+
+    swaps = {id(factory): PLAIN[key] for key, factory in MEMOIZED.items()} if not memoized else MEMOIZED
+    swapped = 0
+
+    for name, module in list(sys.modules.items()):
+        if not (name == "app" or name.startswith("app.")) or module is None:
+            continue
+        for attr, value in list(vars(module).items()):
+            if id(value) in swaps:
+                setattr(module, attr, swaps[id(value)])
+                swapped += 1
+
+    return swapped
+
+
+def measure(build, builds: int) -> dict[str, float]:
+    """ Builds the component tree repeatedly and returns the median time (ms), the memory held by a tree and the peak (KiB) """
+
+    times, held, peaks = [], [], []
+    for _ in range(builds):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        tree = build()
+        times.append((time.perf_counter() - start) * 1000)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        held.append(current / 1024)
+        peaks.append(peak / 1024)
+        del tree
+
+    return {"ms": percentile(times, 0.50), "held_kib": percentile(held, 0.50), "peak_kib": percentile(peaks, 0.50)}
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the page build time and memory with and without memoized style factories.")
+    parser.add_argument("--builds", type=int, default=20, help="Builds per page and mode (default: 20)")
+    args = parser.parse_args()
+
+    pages = {"MainPage": MainPage, "SPALayout": SPALayout}
+
+    # Warm-up, so the first build does not pay the imports and the Reflex internals
+    for build in pages.values():
+        build()
+
+    print(f"{'page':<12} {'styles':<10} {'p50 ms':>9} {'held KiB':>10} {'peak KiB':>10}")
+    for name, build in pages.items():
+        plain = measure(build, args.builds)
+
+        swap_factories(memoized=True)
+        memoized = measure(build, args.builds)
+        swap_factories(memoized=False)
+
+        for mode, result in (("plain", plain), ("memoized", memoized)):
+            print(f"{name:<12} {mode:<10} {result['ms']:>9.2f} {result['held_kib']:>10.1f} {result['peak_kib']:>10.1f}")
+
+    # Hit ratio of the factories (the misses are the distinct argument combinations used by the pages)
+    infos = [factory.cache_info() for factory in MEMOIZED.values()]
+    hits, misses = sum(info.hits for info in infos), sum(info.misses for info in infos)
+    print(f"\nStyle factory calls: {hits + misses}, hit ratio {hits / max(1, hits + misses):.1%}, cached styles {misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# benchmarks/stylesheet_benchmark.py
+
+# NOTE: Benchmark of the compiled page size with the static utility classes against the previous inline styles.
+        # It compiles MainPage (which includes SPALayout and the views) to its page module, as "reflex export" does, once with the
+        # design system classes and once with USE_STYLE_CLASSES disabled (every button, card and badge with its inline styles),
+        # and reports the raw and gzipped size of the page and of the static stylesheet (downloaded once and cached).
+        # Usage: python -m benchmarks.stylesheet_benchmark [--route index]
+
+# Import necessary modules
+import argparse                                                                 # Importing argparse to parse the command line arguments
+import gzip                                                                     # Importing gzip to measure the transferred sizes
+from reflex.compiler.compiler import compile_page                               # Importing the Reflex page compiler
+from app.pages.main_page import MainPage                                        # Importing the page under test
+from app.utils.styles import stylesheet                                         # Importing the static utility classes
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def compiled_page(route: str, use_classes: bool) -> str:
+    """ Compiles the page with or without the static classes and returns its code """
+
+    stylesheet.USE_STYLE_CLASSES = use_classes
+    try:
+        return compile_page(route, MainPage())[1]
+    finally:
+        stylesheet.USE_STYLE_CLASSES = True
+
+
+def sizes(text: str) -> tuple[int, int]:
+    data = text.encode()
+    return len(data), len(gzip.compress(data, 9))
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the compiled page size with the static utility classes and with inline styles.")
+    parser.add_argument("--route", default="index", help="Route of the compiled page (default: index)")
+    args = parser.parse_args()
+
+    inline = compiled_page(args.route, use_classes=False)
+    classes = compiled_page(args.route, use_classes=True)
+    css = stylesheet.build_stylesheet()
+
+    print(f"{'output':<28} {'bytes':>10} {'gzip':>10}")
+    for name, text in (("page (inline styles)", inline), ("page (utility classes)", classes), ("design_system.css", css)):
+        raw, compressed = sizes(text)
+        print(f"{name:<28} {raw:>10} {compressed:>10}")
+
+    saved, saved_gzip = sizes(inline)[0] - sizes(classes)[0], sizes(inline)[1] - sizes(classes)[1]
+    print(f"\nPage reduction: {saved} bytes ({saved / sizes(inline)[0]:.1%}), {saved_gzip} bytes gzipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# tests/conftest.py
+
+# NOTE: The settings are read from the environment when app.config is imported, so the variables without a default
+        # (table and column names, JWT secret) are set here, before any test imports the app. Values already set (.env, CI) win.
+
+# Import necessary modules
+import os                                                                       # Importing os to set the environment variables
+
+TEST_ENVIRONMENT = {
+    "JWT_SECRET_KEY": "test-secret-key",
+    "DB_USERS_TABLE": "USERS_NUE",
+    "DB_USERS_TABLE_ID": "nue_id",
+    "DB_USERS_TABLE_NICKNAME": "nue_nickname",
+    "DB_USERS_TABLE_HASHEDPASSWORD": "nue_hashedpassword",
+    "DB_USERS_TABLE_RECORDCREATION": "nue_recordcreation",
+    "DB_USERS_TABLE_RECORDMODIFICATION": "nue_recordmodification",
+    "DB_EVENTS_TABLE": "EVENTS_NEV",
+    "DB_EVENTS_TABLE_ID": "nev_id",
+    "DB_EVENTS_TABLE_TITLE": "nev_title",
+    "DB_EVENTS_TABLE_DESCRIPTION": "nev_description",
+    "DB_EVENTS_TABLE_STARTTIME": "nev_starttime",
+    "DB_EVENTS_TABLE_ENDTIME": "nev_endtime",
+    "DB_EVENTS_TABLE_RECORDCREATION": "nev_recordcreation",
+    "DB_EVENTS_TABLE_RECORDMODIFICATION": "nev_recordmodification",
+    "DB_EVENTS_TABLE_USER_ID": "nue_nev_n_fk",
+    "HASH_PROFILE": "low",
+}
+
+for name, value in TEST_ENVIRONMENT.items():
+    os.environ.setdefault(name, value)
+
+# NOTE: reflex must be imported before sqlmodel (as app.main and rxconfig do), its lazily loaded model module fails to subclass
+        # SQLModel otherwise. The tests import single app modules in any order, so it is imported here once.
+import reflex                                                                   # noqa: E402,F401
@@ -0,0 +1,22 @@
+# tests/test_app_import.py
+
+# NOTE: Smoke test of the app module: FastAPI validates every route (path, cookie and query parameters) when it is
+        # included, and Reflex builds the app, so a broken route or page fails here instead of when the server starts.
+
+# Import necessary modules
+import importlib                                                                # Importing importlib to import the app module
+from fastapi import FastAPI                                                     # Importing FastAPI to check the app type
+
+
+def test_app_main_imports():
+    main = importlib.import_module("app.main")
+
+    assert isinstance(main.app_fastapi, FastAPI)
+    assert main.app is not None
+
+
+def test_session_revocation_route_does_not_shadow_the_session_cookie():
+    main = importlib.import_module("app.main")
+
+    paths = {route.path for route in main.app_fastapi.routes}
+    assert "/sessions/{session_digest}" in paths
@@ -0,0 +1,60 @@
+# tests/test_app_state_delta.py
+
+# NOTE: Tests of the deltas AppState sends to the browser: the clients and orders are backend variables, so adding a row or
+        # appending a load chunk only sends the rendered window and the counters, never the whole lists.
+
+# Import necessary modules
+import json                                                                     # Importing json to measure the deltas
+from app.state.app_state import AppState, LOAD_CHUNK_SIZE                       # Importing the state and the load chunk size
+from app.state.records import ClientRecord, OrderRecord                         # Importing the records of the rows
+
+ROWS = 500
+
+
+def _state() -> AppState:
+    """Build an AppState with ROWS clients and orders already loaded and sent."""
+    root = AppState.get_root_state()(_reflex_internal_init=True)
+    state = root.get_substate(AppState.get_full_name().split(".")[1:])
+    state._append_clients([ClientRecord(id=index, name=f"Client {index}", status="active") for index in range(ROWS)])
+    state._append_orders([OrderRecord(id=index, client_name=f"Client {index}", amount=10.0) for index in range(ROWS)])
+    root._clean()
+    return state
+
+
+def _delta(state: AppState) -> dict:
+    """Return the delta of AppState, keyed by the variable names without their suffix."""
+    delta = state.parent_state.get_delta()[state.get_full_name()]
+    return {name.removesuffix("_rx_state_"): value for name, value in delta.items()}
+
+
+def test_rows_are_backend_vars():
+    assert "_clients" in AppState.backend_vars and "clients" not in AppState.base_vars
+    assert "_orders" in AppState.backend_vars and "orders" not in AppState.base_vars
+
+
+def test_add_client_sends_the_window_not_the_list():
+    state = _state()
+    state.add_client({"id": ROWS, "name": "Nuevo Cliente", "status": "active"})
+    delta = _delta(state)
+
+    assert not {"clients", "_clients"} & delta.keys()
+    assert delta["clients_total"] == ROWS + 1
+    assert len(delta["filtered_clients"]) == state.clients_window_end
+    assert len(json.dumps(delta, default=str)) < ROWS * 20
+
+
+def test_update_client_refreshes_the_window():
+    state = _state()
+    state.update_client("0", {"name": "Renamed"})
+
+    assert _delta(state)["filtered_clients"][0].name == "Renamed"
+
+
+def test_load_chunk_sends_the_window_not_the_list():
+    state = _state()
+    state._append_orders([OrderRecord(id=ROWS + index) for index in range(LOAD_CHUNK_SIZE)])
+    delta = _delta(state)
+
+    assert not {"orders", "_orders"} & delta.keys()
+    assert delta["orders_total"] == ROWS + LOAD_CHUNK_SIZE
+    assert "filtered_orders" not in delta or len(delta["filtered_orders"]) == state.orders_window_end
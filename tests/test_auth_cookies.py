@@ -0,0 +1,100 @@
+# tests/test_auth_cookies.py
+
+# NOTE: Tests of the sliding refresh of the auth cookies: the tokens are only reissued when the access token is about to expire,
+        # and concurrent refreshes with the same refresh token mint the tokens once. The user query is replaced by a fake.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the dependency
+from datetime import timedelta                                                  # Importing timedelta for the token lifetimes
+from types import SimpleNamespace                                               # Importing SimpleNamespace for the fake user and clock
+import pytest                                                                   # Importing pytest for the tests
+from fastapi import Response                                                    # Importing Response to collect the cookies
+from app.api.dependencies import auth_cookies                                   # Importing the module of the cookie handler
+from app.api.dependencies.auth_cookies import AuthCookiesHandler, ACCESS_TOKEN_REFRESH_WINDOW_SECONDS, REFRESH_SINGLE_FLIGHT_SECONDS
+from app.api.utils.jwt import jwt_handler as jwt                                # Importing the JWT handler to build the tokens
+
+TOKEN_DATA = {"sub": "1", "nickname": "ana"}
+
+
+def access_token(expires_in: float) -> str:
+    return jwt.create_jwt(TOKEN_DATA, timedelta(seconds=expires_in))
+
+
+@pytest.fixture
+def minted(monkeypatch) -> list[str]:
+    """ Records every access token minted, and serves the user of the tokens """
+
+    calls = []
+    create_access_token = jwt.create_access_token
+
+    def recorded(data):
+        calls.append(data["sub"])
+        return create_access_token(data)
+
+    async def read_user_by_id(user_id, session):
+        return SimpleNamespace(id=user_id)
+
+    monkeypatch.setattr(auth_cookies.jwt, "create_access_token", recorded)
+    monkeypatch.setattr(auth_cookies.us, "read_user_by_id", read_user_by_id)
+    monkeypatch.setattr(auth_cookies.auths, "AUTH_BACKEND", "jwt")
+    return calls
+
+
+def authenticate(handler: AuthCookiesHandler, access: str | None, refresh: str) -> Response:
+    """ Runs the cookie dependency and returns the response with the cookies it set """
+
+    response = Response()
+    user = asyncio.run(handler.get_current_user_from_cookie(None, response, access, refresh, None, None))
+    assert user.id == 1
+    return response
+
+
+def set_cookies(response: Response) -> list[str]:
+    return [value.decode() for key, value in response.raw_headers if key == b"set-cookie"]
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_access_token_outside_the_window_is_not_reissued(minted):
+    response = authenticate(AuthCookiesHandler(), access_token(ACCESS_TOKEN_REFRESH_WINDOW_SECONDS + 300), jwt.create_refresh_token(TOKEN_DATA))
+
+    assert minted == []
+    assert set_cookies(response) == []
+
+
+def test_access_token_inside_the_window_is_reissued(minted):
+    response = authenticate(AuthCookiesHandler(), access_token(ACCESS_TOKEN_REFRESH_WINDOW_SECONDS / 2), jwt.create_refresh_token(TOKEN_DATA))
+
+    assert minted == ["1"]
+    cookies = set_cookies(response)
+    assert any(cookie.startswith("access_token=") for cookie in cookies)
+    assert any(cookie.startswith("refresh_token=") for cookie in cookies)
+
+
+def test_concurrent_refreshes_mint_once_and_share_the_cookies(minted):
+    handler, refresh = AuthCookiesHandler(), jwt.create_refresh_token(TOKEN_DATA)
+    responses = [Response() for _ in range(8)]
+
+    async def refresh_concurrently():
+        return await asyncio.gather(*(handler.refresh_tokens(refresh, response) for response in responses))
+
+    assert asyncio.run(refresh_concurrently()) == [1] * len(responses)
+    assert minted == ["1"]
+    assert all(set_cookies(response) == set_cookies(responses[0]) for response in responses)
+
+
+def test_single_flight_entries_expire(minted, monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(auth_cookies, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    handler, refresh = AuthCookiesHandler(), jwt.create_refresh_token(TOKEN_DATA)
+
+    asyncio.run(handler.refresh_tokens(refresh, Response()))
+    clock.now += REFRESH_SINGLE_FLIGHT_SECONDS
+    asyncio.run(handler.refresh_tokens(refresh, Response()))
+
+    assert minted == ["1"]
+
+    clock.now += 1
+    asyncio.run(handler.refresh_tokens(refresh, Response()))
+
+    assert minted == ["1", "1"]
+    assert list(handler._recent_refreshes) == [refresh]
@@ -0,0 +1,65 @@
+# tests/test_auth_routes.py
+
+# NOTE: Tests of the logout everywhere endpoint with both auth backends: only the server-side sessions can be revoked, so the
+        # "jwt" backend refuses it instead of claiming a revocation. The user, the database session and the sessions are fakes.
+
+# Import necessary modules
+from types import SimpleNamespace                                               # Importing SimpleNamespace for the fake user
+from fastapi import FastAPI                                                     # Importing FastAPI to serve the auth router
+from fastapi.testclient import TestClient                                       # Importing TestClient to call the endpoint
+from app.api.routes import auth                                                 # Importing the auth routes
+
+
+class FakeSession:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+def make_client(monkeypatch, backend: str) -> tuple[TestClient, FakeSession, list[int]]:
+    """ Serves the auth router with the given backend, a logged in user and two server-side sessions to close """
+
+    session, deleted = FakeSession(), []
+
+    async def current_user():
+        return SimpleNamespace(id=1)
+
+    async def get_session():
+        yield session
+
+    async def delete_user_sessions(user_id, db_session):
+        deleted.append(user_id)
+        return 2
+
+    monkeypatch.setattr(auth.auths, "AUTH_BACKEND", backend)
+    monkeypatch.setattr(auth.ss, "delete_user_sessions", delete_user_sessions)
+
+    app = FastAPI()
+    app.include_router(auth.auth_router)
+    app.dependency_overrides[auth.ach.get_current_user_from_cookie] = current_user
+    app.dependency_overrides[auth.get_session] = get_session
+    return TestClient(app), session, deleted
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_logout_everywhere_closes_the_server_side_sessions(monkeypatch):
+    client, session, deleted = make_client(monkeypatch, "session")
+
+    response = client.post("/logout-all")
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "Logged out everywhere", "sessions_closed": 2}
+    assert deleted == [1] and session.commits == 1
+
+
+def test_logout_everywhere_is_refused_with_the_jwt_backend(monkeypatch):
+    client, session, deleted = make_client(monkeypatch, "jwt")
+
+    response = client.post("/logout-all")
+
+    assert response.status_code == 409
+    assert "session auth backend" in response.json()["detail"]
+    assert deleted == [] and session.commits == 0
+    assert "set-cookie" not in response.headers
@@ -0,0 +1,45 @@
+# tests/test_calendar_window.py
+
+# NOTE: Tests of the calendar windows (week from Monday, or month) loaded, prefetched and cached by EventsState.
+
+# Import necessary modules
+from datetime import date                                                       # Importing date for the windows
+import pytest                                                                   # Importing pytest for the tests
+from app.state.events_state import window_bounds, shift_window, window_key      # Importing the window helpers
+
+
+@pytest.mark.parametrize("mode, day, expected", [
+                                                    ("week", date(2025, 3, 5), (date(2025, 3, 3), date(2025, 3, 10))),       # Wednesday
+                                                    ("week", date(2025, 3, 3), (date(2025, 3, 3), date(2025, 3, 10))),       # Monday
+                                                    ("week", date(2025, 3, 9), (date(2025, 3, 3), date(2025, 3, 10))),       # Sunday
+                                                    ("week", date(2024, 12, 31), (date(2024, 12, 30), date(2025, 1, 6))),    # Across the year
+                                                    ("month", date(2025, 3, 31), (date(2025, 3, 1), date(2025, 4, 1))),
+                                                    ("month", date(2024, 2, 10), (date(2024, 2, 1), date(2024, 3, 1))),      # Leap year
+                                                    ("month", date(2025, 12, 15), (date(2025, 12, 1), date(2026, 1, 1))),
+                                                ])
+def test_window_bounds(mode, day, expected):
+    assert window_bounds(mode, day) == expected
+
+
+@pytest.mark.parametrize("mode, start, steps, expected", [
+                                                            ("week", date(2025, 3, 3), 1, date(2025, 3, 10)),
+                                                            ("week", date(2025, 3, 3), -1, date(2025, 2, 24)),
+                                                            ("month", date(2025, 3, 1), 1, date(2025, 4, 1)),
+                                                            ("month", date(2025, 1, 1), -1, date(2024, 12, 1)),
+                                                            ("month", date(2025, 12, 1), 1, date(2026, 1, 1)),
+                                                            ("month", date(2025, 3, 1), -15, date(2023, 12, 1)),
+                                                        ])
+def test_shift_window(mode, start, steps, expected):
+    assert shift_window(mode, start, steps) == expected
+
+
+def test_shifted_windows_are_contiguous():
+    for mode in ("week", "month"):
+        start, end = window_bounds(mode, date(2025, 1, 15))
+        for _ in range(14):
+            following = shift_window(mode, start, 1)
+            assert following == end
+            start, end = window_bounds(mode, following)
+            assert start == following
+
+    assert window_key("month", date(2025, 3, 1)) == "month:2025-03-01"
@@ -0,0 +1,147 @@
+# tests/test_change_broker.py
+
+# NOTE: Tests of the changes fan-out with the in-memory broker: every MemoryChangeBroker running in the process acts as a worker.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the brokers
+import pytest                                                                   # Importing pytest for the tests
+from sqlalchemy import create_engine                                            # Importing create_engine for a real ORM session
+from sqlalchemy.orm import Session                                              # Importing Session to commit the changes
+from app.api.utils import change_broker as change_broker_module                 # Importing the module of the global broker
+from app.api.utils.change_broker import ChangeBroker, MemoryChangeBroker, MAX_PAYLOAD_BYTES
+
+
+class Consumer:
+    """ In-process consumer which records the changes it receives """
+
+    def __init__(self, broker: ChangeBroker, key: str = "stale_cache"):
+        self.applied = []
+        self.resets = 0
+        broker.register(key, self.applied.append, self.reset)
+
+    def reset(self):
+        self.resets += 1
+
+
+class FakeSession:
+    def __init__(self, **info):
+        self.info = info
+
+
+async def run_workers(*brokers: MemoryChangeBroker):
+    """ Starts the brokers and waits until they joined the in-process bus, returning their tasks """
+
+    tasks = [asyncio.create_task(broker.run()) for broker in brokers]
+    await asyncio.sleep(0)
+    return tasks
+
+
+async def stop_workers(tasks):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_change_broker_is_abstract():
+    with pytest.raises(TypeError):
+        ChangeBroker()
+
+
+def test_payloads_are_dispatched_to_the_other_workers_and_skipped_by_the_sender():
+    sender, receiver = MemoryChangeBroker(), MemoryChangeBroker()
+    sender_consumer, receiver_consumer = Consumer(sender), Consumer(receiver)
+
+    async def scenario():
+        tasks = await run_workers(sender, receiver)
+        try:
+            MemoryChangeBroker.deliver(sender.build_payloads(FakeSession(stale_cache={"events", "users"})))
+        finally:
+            await stop_workers(tasks)
+
+    asyncio.run(scenario())
+
+    assert [sorted(values) for values in receiver_consumer.applied] == [["events", "users"]]
+    assert sender_consumer.applied == []
+    assert MemoryChangeBroker._bus == []
+
+
+def test_only_registered_keys_with_changes_are_sent():
+    broker = MemoryChangeBroker()
+    Consumer(broker, "stale_cache")
+
+    assert broker.build_payloads(FakeSession(stale_cache=set(), other_key=["ignored"])) == []
+
+
+def test_oversized_changes_reset_the_other_workers():
+    sender, receiver = MemoryChangeBroker(), MemoryChangeBroker()
+    Consumer(sender)
+    receiver_consumer = Consumer(receiver)
+
+    payloads = sender.build_payloads(FakeSession(stale_cache=[f"key-{index}" for index in range(MAX_PAYLOAD_BYTES)]))
+    for payload in payloads:
+        receiver.dispatch(payload)
+
+    assert len(payloads) == 1
+    assert receiver_consumer.applied == []
+    assert receiver_consumer.resets == 1
+
+
+def test_invalid_payloads_are_ignored():
+    broker = MemoryChangeBroker()
+    consumer = Consumer(broker)
+
+    broker.dispatch("not json")
+
+    assert consumer.applied == [] and consumer.resets == 0
+
+
+def test_committed_session_changes_reach_the_other_workers_after_the_commit(monkeypatch):
+    sender, receiver = MemoryChangeBroker(), MemoryChangeBroker()
+    Consumer(sender)
+    receiver_consumer = Consumer(receiver)
+    monkeypatch.setattr(change_broker_module, "change_broker", sender)
+
+    async def scenario():
+        tasks = await run_workers(sender, receiver)
+        try:
+            with Session(create_engine("sqlite://")) as session:
+                session.info["stale_cache"] = ["events"]
+                session.commit()
+
+                session.info["stale_cache"] = ["users"]
+                session.rollback()
+        finally:
+            await stop_workers(tasks)
+
+    asyncio.run(scenario())
+
+    assert receiver_consumer.applied == [["events"]]
+
+
+def test_revoked_sessions_are_sent_once_and_never_after_a_rollback(monkeypatch):
+    from app.api.services import session_service                                # noqa: F401 (registers the hooks of the revoked sessions)
+
+    sender, receiver = MemoryChangeBroker(), MemoryChangeBroker()
+    Consumer(sender, "stale_sessions")
+    receiver_consumer = Consumer(receiver, "stale_sessions")
+    monkeypatch.setattr(change_broker_module, "change_broker", sender)
+
+    async def scenario():
+        tasks = await run_workers(sender, receiver)
+        try:
+            with Session(create_engine("sqlite://")) as session:
+                session.connection()                                    # A transaction to roll back
+                session.info["stale_sessions"] = {1}
+                session.rollback()
+                session.commit()
+
+                session.info["stale_sessions"] = {2}
+                session.commit()
+                session.commit()
+        finally:
+            await stop_workers(tasks)
+
+    asyncio.run(scenario())
+
+    assert receiver_consumer.applied == [[2]]
@@ -0,0 +1,63 @@
+# tests/test_compression.py
+
+# NOTE: Tests of the compression middleware with gzip (always available): a streamed body is compressed and flushed chunk by chunk,
+        # so the client decodes every chunk as it arrives, and the server-sent events are never compressed.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the middleware
+import zlib                                                                     # Importing zlib to decode the gzip chunks
+from app.api.utils.compression import CompressionMiddleware                    # Importing the middleware under test
+
+SCOPE = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+
+
+def streaming_app(content_type: bytes, chunks: list[bytes]):
+    """ Builds an ASGI app which streams the chunks, one message each """
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type)]})
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < len(chunks) - 1})
+
+    return app
+
+
+def run(app, minimum_size: int = 1024) -> list[dict]:
+    """ Runs an app behind the middleware, returning the messages it sends """
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(CompressionMiddleware(app, minimum_size=minimum_size)(SCOPE, None, send))
+    return messages
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_streamed_chunks_are_decodable_as_they_arrive():
+    chunks = [b'{"id": 1, "title": "Reunion"}\n', b'{"id": 2, "title": "Llamada"}\n', b'{"id": 3, "title": "Visita"}\n']
+    start, *bodies = run(streaming_app(b"application/json", chunks))
+
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    assert not any(key == b"content-length" for key, _ in start["headers"])
+
+    decoder = zlib.decompressobj(31)
+    for chunk, body in zip(chunks, bodies):
+        assert decoder.decompress(body["body"]) == chunk
+    assert decoder.eof and not bodies[-1]["more_body"]
+
+
+def test_small_single_bodies_are_sent_uncompressed():
+    start, body = run(streaming_app(b"application/json", [b'{"ok": true}']))
+
+    assert not any(key == b"content-encoding" for key, _ in start["headers"])
+    assert body["body"] == b'{"ok": true}'
+
+
+def test_server_sent_events_are_never_compressed():
+    chunks = [b"data: " + b"x" * 2048 + b"\n\n", b"data: ping\n\n"]
+    start, *bodies = run(streaming_app(b"text/event-stream", chunks))
+
+    assert not any(key == b"content-encoding" for key, _ in start["headers"])
+    assert [body["body"] for body in bodies] == chunks
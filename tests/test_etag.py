@@ -0,0 +1,90 @@
+# tests/test_etag.py
+
+# NOTE: Tests of the conditional GET helpers and of the 304 responses of the events endpoints, which must keep the auth cookies
+        # refreshed by the cookie dependency. The user, the session and the version queries are replaced by fakes.
+
+# Import necessary modules
+from datetime import datetime                                                   # Importing datetime for the modification timestamps
+from types import SimpleNamespace                                               # Importing SimpleNamespace for the fake user
+from fastapi import FastAPI, Response                                           # Importing FastAPI to serve the events router
+from fastapi.testclient import TestClient                                       # Importing TestClient to call the endpoints
+from starlette.requests import Request                                          # Importing Request to build the conditional requests
+from app.api.routes import events                                               # Importing the events routes
+from app.api.utils.etag import make_weak_etag, is_not_modified                  # Importing the ETag helpers
+
+MODIFIED = datetime(2025, 3, 1, 12, 30, 15, 250000)
+
+
+def make_request(if_none_match: str | None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_weak_etag_changes_with_the_modification_and_the_parts():
+    etag = make_weak_etag(MODIFIED, 3, 10)
+
+    assert etag == f'W/"{int(MODIFIED.timestamp() * 1_000_000)}-3-10"'
+    assert make_weak_etag(MODIFIED, 4, 10) != etag
+    assert make_weak_etag(datetime(2025, 3, 1, 12, 30, 15, 250001), 3, 10) != etag
+    assert make_weak_etag(None, 3) == 'W/"0-3"'
+
+
+def test_is_not_modified_uses_the_weak_comparison():
+    etag = make_weak_etag(MODIFIED, 3)
+    opaque_tag = etag.removeprefix("W/")
+
+    assert is_not_modified(make_request(etag), etag)
+    assert is_not_modified(make_request(opaque_tag), etag)
+    assert is_not_modified(make_request(f'W/"other", {opaque_tag}'), etag)
+    assert is_not_modified(make_request("*"), etag)
+    assert not is_not_modified(make_request('W/"other"'), etag)
+    assert not is_not_modified(make_request(None), etag)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def make_client(monkeypatch) -> TestClient:
+    """ Serves the events router with a user whose access token was just refreshed by the cookie dependency """
+
+    async def refreshed_user(response: Response):
+        response.set_cookie("access_token", "refreshed-token", httponly=True)
+        return SimpleNamespace(id=1)
+
+    async def no_session():
+        yield None
+
+    async def events_version(current_user, session):
+        return MODIFIED, 3
+
+    async def event_modification(event_id, current_user, session):
+        return MODIFIED
+
+    monkeypatch.setattr(events.es, "read_user_events_version", events_version)
+    monkeypatch.setattr(events.es, "read_user_event_modification", event_modification)
+
+    app = FastAPI()
+    app.include_router(events.event_router)
+    app.dependency_overrides[events.ach.get_current_user_from_cookie] = refreshed_user
+    app.dependency_overrides[events.get_session] = no_session
+    return TestClient(app)
+
+
+def test_not_modified_events_keep_the_refreshed_cookies(monkeypatch):
+    client = make_client(monkeypatch)
+
+    response = client.get("/events", headers={"If-None-Match": make_weak_etag(MODIFIED, 3, 0, "", "")})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == make_weak_etag(MODIFIED, 3, 0, "", "")
+    assert "access_token=refreshed-token" in response.headers["set-cookie"]
+    assert response.content == b""
+
+
+def test_not_modified_event_keeps_the_refreshed_cookies(monkeypatch):
+    client = make_client(monkeypatch)
+
+    response = client.get("/events/7", headers={"If-None-Match": make_weak_etag(MODIFIED, 7)})
+
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert "access_token=refreshed-token" in response.headers["set-cookie"]
@@ -0,0 +1,80 @@
+# tests/test_events_state.py
+
+# NOTE: Tests of the optimistic event mutations of EventsState. The background events run on a plain state instance (its lock is
+        # not needed here) and the API requests are answered by fakes.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the background events
+from types import SimpleNamespace                                               # Importing SimpleNamespace for the fake responses
+from app.state import events_state                                              # Importing the module of the state (its API client)
+from app.state.events_state import EventsState                                  # Importing the state under test
+from app.state.records import EventRecord                                       # Importing the records of the events
+
+CONFIRMED = EventRecord(id=7, title="Reunión", start_date="2025-03-05T10:00:00", end_date="2025-03-05T11:00:00", record_modification="v1")
+
+
+def make_state(monkeypatch) -> EventsState:
+    """ Builds an EventsState showing March 2025 with a confirmed event, runnable without an app """
+
+    async def enter(self):
+        return self
+
+    async def api_headers(self):
+        return {}
+
+    monkeypatch.setattr(EventsState, "__aenter__", enter)
+    monkeypatch.setattr(EventsState, "_api_headers", api_headers)
+
+    root = EventsState.get_root_state()(_reflex_internal_init=True)
+    state = root.get_substate(EventsState.get_full_name().split(".")[1:])
+    state.window_start, state.window_end = "2025-03-01", "2025-04-01"
+    state.events = [CONFIRMED]
+    return state
+
+
+def response(status_code: int, body: dict | None = None):
+    return SimpleNamespace(status_code=status_code, is_success=status_code < 400, json=lambda: body or {})
+
+
+def test_failed_delete_after_a_superseded_update_restores_the_values_the_server_confirmed(monkeypatch):
+    state = make_state(monkeypatch)
+    saved = {"id": 7, "title": "Reunión movida", "start_date": "2025-03-05T10:00:00", "end_date": "2025-03-05T11:00:00", "record_modification": "v2"}
+
+    deleted = asyncio.Event()
+
+    async def put(url, json, headers):
+        await deleted.wait()
+        return response(200, saved)
+
+    async def delete(url, headers):
+        return response(500, {"detail": "database unavailable"})
+
+    monkeypatch.setattr(events_state.api_client, "put", put)
+    monkeypatch.setattr(events_state.api_client, "delete", delete)
+
+    async def scenario():
+        state.update_event(7, {"title": "Reunión movida"})
+        update = asyncio.create_task(EventsState.send_update_event.fn(state, 7))
+        await asyncio.sleep(0)                                  # The update is in flight when the event is deleted
+        state.delete_event(7)
+        deleted.set()
+        await update
+        await EventsState.send_delete_event.fn(state, 7)
+
+    asyncio.run(scenario())
+
+    assert state.events == [EventRecord.from_dict(saved)]
+    assert state.events_error.startswith("The event could not be deleted")
+    assert state._rollbacks == {} and state._unsaved == {}
+
+
+def test_events_touching_the_window_bounds_are_kept_out_as_the_api_does(monkeypatch):
+    state = make_state(monkeypatch)
+    state.events = []
+
+    state.create_event({"title": "Ends at the first midnight", "start_date": "2025-02-28T22:00:00", "end_date": "2025-03-01T00:00:00"})
+    state.create_event({"title": "Starts at the last midnight", "start_date": "2025-04-01T00:00:00", "end_date": "2025-04-01T09:00:00"})
+    state.create_event({"title": "Ends a minute in", "start_date": "2025-02-28T22:00:00", "end_date": "2025-03-01T00:01:00"})
+    state.create_event({"title": "Starts a minute before the end", "start_date": "2025-03-31T23:59:00", "end_date": "2025-04-01T01:00:00"})
+
+    assert [event.title for event in state.events] == ["Ends a minute in", "Starts a minute before the end"]
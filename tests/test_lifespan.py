@@ -0,0 +1,49 @@
+# tests/test_lifespan.py
+
+# NOTE: Reflex serves app_fastapi mounted inside its own Starlette app, which does not forward the lifespan events to the mounted
+        # apps, so the app lifespan must be a Reflex lifespan task. These tests run it as Reflex does, with the database and the
+        # background loops replaced by idle tasks.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the lifespan
+import importlib                                                                # Importing importlib to import the app module
+import httpx                                                                    # Importing httpx to check the API client transport
+from starlette.applications import Starlette                                    # Importing Starlette, the top-level app of Reflex
+
+
+def test_lifespan_is_a_reflex_lifespan_task():
+    main = importlib.import_module("app.main")
+
+    assert main.lifespan in main.app.lifespan_tasks
+    assert main.app_fastapi.router.lifespan_context is not main.lifespan
+
+
+def test_reflex_lifespan_starts_the_background_tasks_and_the_in_process_api_client(monkeypatch):
+    main = importlib.import_module("app.main")
+    started = []
+
+    async def noop():
+        pass
+
+    def idle(name):
+        async def run(*args):
+            started.append(name)
+            await asyncio.Event().wait()
+        return run
+
+    monkeypatch.setattr(main, "init_db", noop)
+    monkeypatch.setattr(main, "close_db", noop)
+    monkeypatch.setattr(main.EventService, "run_tombstone_compactor", idle("tombstone_compactor"))
+    monkeypatch.setattr(main.connection_manager, "run_heartbeat", idle("realtime_heartbeat"))
+    monkeypatch.setattr(main.change_broker, "run", idle("change_listener"))
+    monkeypatch.setattr(main.session_memory_monitor, "run_sweeper", idle("state_sweeper"))
+
+    async def run_lifespan():
+        async with main.app._run_lifespan_tasks(Starlette()):
+            await asyncio.sleep(0)
+            assert sorted(started) == ["change_listener", "realtime_heartbeat", "state_sweeper", "tombstone_compactor"]
+            assert isinstance(main.api_client.client._transport, httpx.ASGITransport)
+
+        assert main.api_client._client is None
+
+    asyncio.run(run_lifespan())
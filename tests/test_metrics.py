@@ -0,0 +1,97 @@
+# tests/test_metrics.py
+
+# NOTE: Tests of the requests metrics middleware and of their Prometheus text exposition. A small FastAPI app is served through the
+        # httpx ASGI transport, with the metrics middleware outside the compression one, as app.main stacks them.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the client
+import httpx                                                                    # Importing httpx to call the app in-process
+from fastapi import FastAPI                                                     # Importing FastAPI for the app under test
+from app.api.utils.compression import CompressionMiddleware                     # Importing the compression middleware
+from app.api.utils.metrics import MetricsMiddleware, RequestMetrics, UNMATCHED_ROUTE    # Importing the metrics middleware
+
+EVENT = {"id": 7, "title": "Reunión de equipo", "description": "Planificación del sprint " * 40}
+
+
+def make_app(metrics: RequestMetrics) -> tuple[FastAPI, list[int]]:
+    """ Builds the app and returns it with the requests in progress seen by its handler """
+
+    app, seen_in_progress = FastAPI(), []
+
+    @app.get("/events/{event_id}")
+    async def read_event(event_id: int):
+        seen_in_progress.append(metrics.in_progress)
+        return {**EVENT, "id": event_id}
+
+    app.add_middleware(CompressionMiddleware, minimum_size=512)
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    return app, seen_in_progress
+
+
+def call(app: FastAPI, *paths: str) -> list[httpx.Response]:
+    async def requests():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", headers={"Accept-Encoding": "gzip"}) as client:
+            return [await client.get(path) for path in paths]
+
+    return asyncio.run(requests())
+
+
+def samples(rendered: str, name: str) -> list[str]:
+    return [line for line in rendered.splitlines() if line.startswith(name)]
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_requests_are_labelled_by_route_template_and_unmatched():
+    metrics = RequestMetrics(latency_buckets=[0.5, 5.0], size_buckets=[100, 10000])
+    app, _ = make_app(metrics)
+
+    call(app, "/events/7", "/events/8", "/unknown/path")
+    rendered = metrics.render()
+
+    assert 'http_requests_total{method="GET",route="/events/{event_id}",status="200"} 2' in rendered
+    assert f'http_requests_total{{method="GET",route="{UNMATCHED_ROUTE}",status="404"}} 1' in rendered
+    assert "/events/7" not in rendered and "/unknown/path" not in rendered
+
+
+def test_histograms_are_cumulative_and_end_in_inf():
+    metrics = RequestMetrics(latency_buckets=[0.5, 5.0], size_buckets=[100, 10000])
+    app, _ = make_app(metrics)
+
+    call(app, "/events/7", "/events/8", "/events/9")
+    rendered = metrics.render()
+
+    latency = samples(rendered, 'http_request_duration_seconds_bucket{method="GET",route="/events/{event_id}"')
+    assert [line.split('le="')[1].split('"')[0] for line in latency] == ["0.5", "5", "+Inf"]
+
+    counts = [int(line.rsplit(" ", 1)[1]) for line in latency]
+    assert counts == sorted(counts) and counts[-1] == 3
+    assert 'http_request_duration_seconds_count{method="GET",route="/events/{event_id}"} 3' in rendered
+
+    sizes = samples(rendered, 'http_response_size_bytes_bucket{method="GET",route="/events/{event_id}"')
+    assert sizes[-1].endswith('le="+Inf"} 3')
+
+
+def test_requests_in_progress_are_counted_while_served():
+    metrics = RequestMetrics()
+    app, seen_in_progress = make_app(metrics)
+
+    call(app, "/events/7", "/events/8")
+
+    assert seen_in_progress == [1, 1]
+    assert metrics.in_progress == 0
+    assert "http_requests_in_progress 0" in metrics.render().splitlines()
+
+
+def test_response_size_is_the_compressed_size_sent():
+    metrics = RequestMetrics(size_buckets=[100, 10000])
+    app, _ = make_app(metrics)
+
+    response, = call(app, "/events/7")
+    sent = response.num_bytes_downloaded
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["description"] == EVENT["description"]
+    assert sent < len(response.content)
+    assert metrics.sizes[("GET", "/events/{event_id}")].sum == sent
+    assert f'http_response_size_bytes_sum{{method="GET",route="/events/{{event_id}}"}} {sent}' in metrics.render()
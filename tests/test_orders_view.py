@@ -0,0 +1,15 @@
+# tests/test_orders_view.py
+
+# NOTE: Tests of the rendered order rows: the amount is formatted in the browser with the thousands separator and 2 decimals.
+
+# Import necessary modules
+import reflex as rx                                                             # Importing reflex to render the rows
+from app.state.app_state import AppState                                        # Importing the state of the orders
+from app.components.orders import orders_view                                   # Importing the orders view
+
+
+def test_order_amount_is_formatted_with_separator_and_two_decimals():
+    rendered = str(rx.foreach(AppState.filtered_orders, orders_view._order_row).render())
+
+    assert 'order_rx_state_["amount"].toLocaleString(' in rendered
+    assert "maximumFractionDigits: decimals}))(2))" in rendered
@@ -0,0 +1,115 @@
+# tests/test_password_hashing.py
+
+# NOTE: Tests that the user service hashes and verifies the passwords in worker threads, so argon2 never blocks the event loop,
+        # and that the hasher counts those operations for /metrics. The database reads are replaced by fakes.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the services
+import threading                                                                # Importing threading to check where the hashes run
+from types import SimpleNamespace                                               # Importing SimpleNamespace for the fake users and sessions
+from app.api.services.user_service import UserService                           # Importing the user service
+from app.api.utils.hashing import HashHandler, hash_handler                     # Importing the password hasher
+from app.db.models.user.DTOs import UserCreate, UserUpdate                      # Importing the user DTOs
+
+PASSWORD = "correct horse battery staple"
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+        self.sync_session = SimpleNamespace(info={})
+
+    def add(self, instance):
+        self.added.append(instance)
+
+
+def record_threads(monkeypatch) -> list[str]:
+    """ Records the thread of every hash and verify of the global hasher """
+
+    threads = []
+    hash_password, verify_password = hash_handler.hash_password, hash_handler.verify_password
+
+    def recorded(operation):
+        def run(*args):
+            threads.append(threading.current_thread() is threading.main_thread())
+            return operation(*args)
+        return run
+
+    monkeypatch.setattr(hash_handler, "hash_password", recorded(hash_password))
+    monkeypatch.setattr(hash_handler, "verify_password", recorded(verify_password))
+    return threads
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_login_verifies_the_password_in_a_worker_thread(monkeypatch):
+    threads = record_threads(monkeypatch)
+    user = SimpleNamespace(id=1, hashed_password=HashHandler().hash_password(PASSWORD))
+
+    async def read_user_by_nickname(nickname, session):
+        return user
+
+    monkeypatch.setattr(UserService, "read_user_by_nickname", read_user_by_nickname)
+
+    assert asyncio.run(UserService.authenticate_user("ana", PASSWORD, None)) is user
+    assert asyncio.run(UserService.authenticate_user("ana", "wrong", None)) is None
+    assert threads == [False, False]
+
+
+def test_register_and_password_update_hash_in_worker_threads(monkeypatch):
+    threads = record_threads(monkeypatch)
+    session = FakeSession()
+
+    async def get_next_user_id(session):
+        return 1
+
+    monkeypatch.setattr(UserService, "get_next_user_id", get_next_user_id)
+    user = asyncio.run(UserService.create_user(UserCreate(nickname="ana", password=PASSWORD), session))
+
+    async def read_user_by_id(user_id, session):
+        return user
+
+    monkeypatch.setattr(UserService, "read_user_by_id", read_user_by_id)
+    updated_user, updated = asyncio.run(UserService.update_user(1, UserUpdate(nickname="ana", password="new password"), session))
+
+    assert threads == [False, False, False]
+    assert updated and hash_handler.verify_password("new password", updated_user.hashed_password)
+
+
+def test_hasher_counts_the_operations_in_progress():
+    hasher = HashHandler()
+    stored_hash = hasher.hash_password(PASSWORD)
+
+    async def hash_concurrently():
+        return await asyncio.gather(asyncio.to_thread(hasher.hash_password, PASSWORD), asyncio.to_thread(hasher.verify_password, "wrong", stored_hash))
+
+    hashed, verified = asyncio.run(hash_concurrently())
+
+    assert hasher.verify_password(PASSWORD, hashed) and not verified
+    assert hasher.in_progress == 0
+    assert hasher.operations_total == {"hash": 2, "verify": 2}
+
+
+def test_rehash_only_replaces_the_hash_verified_at_login(monkeypatch):
+    from app.api.services import user_service
+
+    statements = []
+
+    class RecordingSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def execute(self, statement):
+            statements.append(statement.compile(compile_kwargs={"literal_binds": True}))
+
+        async def commit(self):
+            pass
+
+    monkeypatch.setattr(user_service, "async_session", RecordingSession)
+    asyncio.run(UserService.rehash_user_password(7, PASSWORD, "old-hash"))
+
+    sql = str(statements[0])
+    assert len(statements) == 1 and sql.startswith("UPDATE")
+    assert "= 7" in sql and "= 'old-hash'" in sql
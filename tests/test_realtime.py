@@ -0,0 +1,85 @@
+# tests/test_realtime.py
+
+# NOTE: Tests of the send queues of the real-time connections: coalescing of the notifications of the same event, namespaced keys
+        # (an event id never replaces an unrelated notification) and the resync of the slow consumers. The WebSocket is a fake one.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the sender
+import json                                                                     # Importing json to read the notifications
+from app.api.utils.realtime import Connection, ConnectionManager, PING_MESSAGE, RESYNC_MESSAGE    # Importing the real-time connections
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text: str):
+        self.sent.append(text)
+
+
+def notification(event_id, op="update", **fields) -> str:
+    return json.dumps({"op": op, "id": event_id, **fields}, separators=(",", ":"))
+
+
+def pending(connection: Connection) -> list[str]:
+    return list(connection._pending.values())
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_event_ids_do_not_collide_with_the_sequence_keys():
+    manager = ConnectionManager(queue_size=10, policy="coalesce", send_timeout=1, heartbeat_interval=60, idle_timeout=120)
+    connection = Connection(FakeWebSocket(), user_id=1, queue_size=10, policy="coalesce")
+    manager._connections[1] = {connection}
+
+    connection.enqueue("first uncoalesced")
+    manager.publish(1, [{"op": "update", "id": 1}])
+
+    assert pending(connection) == ["first uncoalesced", notification(1)]
+
+
+def test_notifications_of_the_same_event_are_coalesced():
+    manager = ConnectionManager(queue_size=10, policy="coalesce", send_timeout=1, heartbeat_interval=60, idle_timeout=120)
+    connection = Connection(FakeWebSocket(), user_id=1, queue_size=10, policy="coalesce")
+    manager._connections[1] = {connection}
+
+    manager.publish(1, [{"op": "update", "id": 1, "title": "a"}, {"op": "update", "id": 2, "title": "b"}])
+    manager.publish(1, [{"op": "update", "id": 1, "title": "c"}])
+    connection.enqueue(PING_MESSAGE, "ping")
+
+    assert pending(connection) == [notification(2, title="b"), notification(1, title="c"), PING_MESSAGE]
+
+
+def test_the_drop_policy_keeps_every_notification():
+    connection = Connection(FakeWebSocket(), user_id=1, queue_size=10, policy="drop")
+
+    connection.enqueue(notification(1, title="a"), ("event", 1))
+    connection.enqueue(notification(1, title="b"), ("event", 1))
+
+    assert pending(connection) == [notification(1, title="a"), notification(1, title="b")]
+
+
+def test_overflowing_queues_are_replaced_by_a_resync():
+    connection = Connection(FakeWebSocket(), user_id=1, queue_size=2, policy="coalesce")
+
+    for event_id in range(3):
+        connection.enqueue(notification(event_id), ("event", event_id))
+
+    assert pending(connection) == [RESYNC_MESSAGE]
+    assert connection.dropped == 3
+
+
+def test_sender_sends_the_queue_in_order():
+    websocket = FakeWebSocket()
+    connection = Connection(websocket, user_id=1, queue_size=10, policy="coalesce")
+
+    async def scenario():
+        sender = asyncio.create_task(connection.run_sender(send_timeout=1))
+        connection.enqueue("a")
+        connection.enqueue(notification(7), ("event", 7))
+        await asyncio.sleep(0.01)
+        connection.closed = True
+        sender.cancel()
+
+    asyncio.run(scenario())
+
+    assert websocket.sent == ["a", notification(7)]
@@ -0,0 +1,128 @@
+# tests/test_response_cache.py
+
+# NOTE: Tests of the invalidation of the in-process response cache (generations bumped by the committed sessions) and of the cached
+        # title search, which must keep the auth cookies refreshed by the cookie dependency.
+
+# Import necessary modules
+import json                                                                     # Importing json to read the cached bodies
+from types import SimpleNamespace                                               # Importing SimpleNamespace for the fake user and session
+from fastapi import FastAPI, Response                                           # Importing FastAPI to serve the events router
+from fastapi.testclient import TestClient                                       # Importing TestClient to call the endpoint
+from sqlalchemy import create_engine                                            # Importing create_engine for a real ORM session
+from sqlalchemy.orm import Session                                              # Importing Session to commit the changes
+from app.api.routes import cache_admin, events                                  # Importing the cache admin and events routes
+from app.config import auth_settings                                            # Importing the authentication settings (admin token)
+from app.api.utils import change_broker as change_broker_module                 # Importing the module of the global broker
+from app.api.utils.change_broker import MemoryChangeBroker                      # Importing the in-memory broker (no PostgreSQL here)
+from app.api.utils.response_cache import ResponseCache, mark_stale, response_cache    # Importing the response cache
+
+
+def body(response: Response):
+    return json.loads(response.body)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_cached_responses_are_served_until_their_data_changes():
+    cache = ResponseCache(max_entries=10, max_bytes=10_000)
+
+    cached, generations = cache.get("admin_events", {"amount": 5}, ("events",))
+    assert cached is None
+    cache.store("admin_events", {"amount": 5}, ("events",), generations, [{"id": 1}])
+
+    cached, _ = cache.get("admin_events", {"amount": 5}, ("events",))
+    assert body(cached) == [{"id": 1}]
+
+    cache.bump("users")
+    assert cache.get("admin_events", {"amount": 5}, ("events",))[0] is not None
+
+    cache.bump("events")
+    assert cache.get("admin_events", {"amount": 5}, ("events",))[0] is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["routes"]["admin_events"] == {"hits": 2, "misses": 2, "hit_ratio": 0.5, "entries": 0, "bytes": 0}
+
+
+def test_responses_read_before_a_change_are_not_stored():
+    cache = ResponseCache(max_entries=10, max_bytes=10_000)
+
+    _, generations = cache.get("admin_users", {}, ("users",))
+    cache.bump("users")
+    response = cache.store("admin_users", {}, ("users",), generations, [{"id": 1}])
+
+    assert body(response) == [{"id": 1}]
+    assert cache.get("admin_users", {}, ("users",))[0] is None
+
+
+def test_least_recently_used_responses_are_evicted():
+    cache = ResponseCache(max_entries=2, max_bytes=10_000)
+    for amount in (1, 2):
+        cache.store("admin_events", {"amount": amount}, ("events",), (0,), [amount])
+
+    cache.get("admin_events", {"amount": 1}, ("events",))
+    cache.store("admin_events", {"amount": 3}, ("events",), (0,), [3])
+
+    assert cache.get("admin_events", {"amount": 1}, ("events",))[0] is not None
+    assert cache.get("admin_events", {"amount": 2}, ("events",))[0] is None
+    assert cache.size_bytes == sum(len(entry[1]) for entry in cache._entries.values())
+
+
+def test_committed_sessions_bump_the_stale_data_and_rollbacks_do_not(monkeypatch):
+    monkeypatch.setattr(change_broker_module, "change_broker", MemoryChangeBroker())
+    before = response_cache.generations.get("events", 0)
+
+    with Session(create_engine("sqlite://")) as session:
+        mark_stale(SimpleNamespace(sync_session=session), "events")
+        session.rollback()
+        assert response_cache.generations.get("events", 0) == before
+
+        mark_stale(SimpleNamespace(sync_session=session), "events")
+        session.commit()
+
+    assert response_cache.generations["events"] == before + 1
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_cached_title_search_keeps_the_refreshed_cookies(monkeypatch):
+    reads = []
+
+    async def refreshed_user(response: Response):
+        response.set_cookie("access_token", "refreshed-token", httponly=True)
+        return SimpleNamespace(id=1)
+
+    async def no_session():
+        yield None
+
+    async def events_by_title(title, current_user, session):
+        reads.append(title)
+        return [{"id": 1, "title": "Meeting", "description": None, "start_date": "2025-03-01T10:00:00", "end_date": "2025-03-01T11:00:00",
+                 "record_creation": "2025-02-01T09:00:00", "record_modification": "2025-02-01T09:00:00", "user_id": 1}]
+
+    monkeypatch.setattr(events.es, "read_all_user_events_by_title", events_by_title)
+    monkeypatch.setattr(events, "response_cache", ResponseCache(max_entries=10, max_bytes=10_000))
+
+    app = FastAPI()
+    app.include_router(events.event_router)
+    app.dependency_overrides[events.ach.get_current_user_from_cookie] = refreshed_user
+    app.dependency_overrides[events.get_session] = no_session
+    client = TestClient(app)
+
+    responses = [client.get("/events/title/Meeting"), client.get("/events/title/meeting")]
+
+    assert reads == ["Meeting"]
+    for response in responses:
+        assert response.status_code == 200
+        assert response.json()[0]["title"] == "Meeting"
+        assert "access_token=refreshed-token" in response.headers["set-cookie"]
+
+
+def test_cache_stats_endpoint_requires_the_admin_token(monkeypatch):
+    monkeypatch.setattr(auth_settings, "ADMIN_API_TOKEN", "admin-secret")
+    app = FastAPI()
+    app.include_router(cache_admin.cache_admin_router)
+    client = TestClient(app)
+
+    assert client.get("/admin/cache/stats").status_code == 401
+    assert client.get("/admin/cache/stats", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get("/admin/cache/stats", headers={"Authorization": "Bearer admin-secret"})
+    assert response.status_code == 200
+    assert "routes" in response.json()
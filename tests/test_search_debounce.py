@@ -0,0 +1,22 @@
+# tests/test_search_debounce.py
+
+# NOTE: The client and order searches are debounced in the browser, so a burst of keystrokes sends a single query to the backend.
+        # These tests check the rendered search inputs.
+
+# Import necessary modules
+import pytest                                                                   # Importing pytest for the tests
+from app.state.app_state import SEARCH_DEBOUNCE_MS                              # Importing the debounce time of the searches
+from app.components.clients import clients_view                                 # Importing the clients view
+from app.components.orders import orders_view                                   # Importing the orders view
+
+
+@pytest.mark.parametrize("search_bar, handler", [
+                                                    (clients_view._search_bar, "set_clients_search_query"),
+                                                    (orders_view._search_and_filters, "set_orders_search_query"),
+                                                ])
+def test_search_inputs_are_debounced_in_the_browser(search_bar, handler):
+    rendered = str(search_bar().render())
+
+    assert f"debounceTimeout:{SEARCH_DEBOUNCE_MS}" in rendered
+    assert "element:RadixThemesTextField.Root" in rendered
+    assert handler in rendered
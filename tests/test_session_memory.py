@@ -0,0 +1,139 @@
+# tests/test_session_memory.py
+
+# NOTE: Tests of the memory monitor of the Reflex states (report, offload of the idle sessions) and of its admin endpoint. The
+        # states are small stand-ins with the attributes the monitor reads, kept by a fake in-memory state manager.
+
+# Import necessary modules
+import asyncio                                                                  # Importing asyncio to run the sweep
+import contextlib                                                               # Importing contextlib for the fake state lock
+import os                                                                       # Importing os to check the offload files
+import stat                                                                     # Importing stat to check the directory mode
+from types import SimpleNamespace                                               # Importing SimpleNamespace for the fake app and events
+from fastapi import FastAPI                                                     # Importing FastAPI to serve the admin router
+from fastapi.testclient import TestClient                                       # Importing TestClient to call the admin endpoint
+from app.config import auth_settings                                            # Importing the authentication settings (admin token)
+from app.api.routes import state_admin                                          # Importing the state admin routes
+from app.state.session_memory import SessionMemoryMonitor                       # Importing the memory monitor
+
+TOKEN = "3f1c2d4e-client-token"
+
+
+class FakeState:
+    """ Root state with a heavy list declared in '_offload_vars' and one substate without them """
+
+    _offload_vars = ("clients",)
+
+    def __init__(self):
+        self.clients = [{"id": index, "name": f"Client {index}"} for index in range(50)]
+        self.base_vars = {"clients": None}
+        self._backend_vars = {}
+        self.substates = {"child": FakeSubstate()}
+
+    @staticmethod
+    def get_full_name():
+        return "state"
+
+
+class FakeSubstate:
+    def __init__(self):
+        self.query = "abc"
+        self.base_vars = {"query": None}
+        self._backend_vars = {}
+        self.substates = {}
+
+    @staticmethod
+    def get_full_name():
+        return "state.child"
+
+
+class FakeStateManager:
+    def __init__(self, states):
+        self.states = states
+
+    @contextlib.asynccontextmanager
+    async def modify_state(self, token):
+        yield self.states[token]
+
+
+def make_monitor(offload_dir: str, state: FakeState) -> SessionMemoryMonitor:
+    monitor = SessionMemoryMonitor("offload", idle_seconds=0, sweep_interval=60, offload_dir=offload_dir)
+    monitor.app = SimpleNamespace(state_manager=FakeStateManager({TOKEN: state}))
+    return monitor
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def test_stats_identify_the_sessions_by_a_hash_of_the_token(tmp_path):
+    monitor = make_monitor(str(tmp_path / "offload"), FakeState())
+
+    report = monitor.stats()
+
+    assert report["sessions"] == 1
+    assert report["largest"][0]["session"] == SessionMemoryMonitor.session_id(TOKEN)
+    assert set(report["largest"][0]["by_class"]) == {"state", "state.child"}
+    assert TOKEN not in repr(report)
+
+
+def test_idle_sessions_are_offloaded_to_a_private_directory_and_restored_on_the_next_event(tmp_path):
+    offload_dir = str(tmp_path / "offload")
+    state = FakeState()
+    clients = list(state.clients)
+    monitor = make_monitor(offload_dir, state)
+
+    assert asyncio.run(monitor.sweep()) == 1
+
+    assert state.clients == []
+    assert stat.S_IMODE(os.stat(offload_dir).st_mode) == 0o700
+    files = os.listdir(offload_dir)
+    assert files == [f"{SessionMemoryMonitor.session_id(TOKEN)}-state.pkl.z"]
+    assert stat.S_IMODE(os.stat(os.path.join(offload_dir, files[0])).st_mode) == 0o600
+
+    asyncio.run(monitor.preprocess(monitor.app, state, SimpleNamespace(token=TOKEN)))
+
+    assert state.clients == clients
+    assert os.listdir(offload_dir) == []
+    assert monitor.stats()["largest"][0]["offloaded"] == []
+
+
+def test_an_existing_offload_directory_is_made_private(tmp_path):
+    offload_dir = tmp_path / "shared"
+    offload_dir.mkdir(mode=0o777)
+    os.chmod(offload_dir, 0o777)
+    monitor = make_monitor(str(offload_dir), FakeState())
+
+    asyncio.run(monitor.sweep())
+
+    assert stat.S_IMODE(os.stat(offload_dir).st_mode) == 0o700
+
+
+def test_a_new_temporary_directory_is_used_if_none_is_set():
+    monitor = make_monitor("", FakeState())
+
+    asyncio.run(monitor.sweep())
+
+    assert os.path.basename(monitor.offload_dir).startswith("integra_state_")
+    assert stat.S_IMODE(os.stat(monitor.offload_dir).st_mode) == 0o700
+
+# ---------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(state_admin.state_admin_router)
+    return TestClient(app)
+
+
+def test_state_sessions_endpoint_is_disabled_without_an_admin_token(monkeypatch):
+    monkeypatch.setattr(auth_settings, "ADMIN_API_TOKEN", "")
+
+    assert make_client().get("/admin/state/sessions").status_code == 403
+
+
+def test_state_sessions_endpoint_requires_the_admin_token(monkeypatch):
+    monkeypatch.setattr(auth_settings, "ADMIN_API_TOKEN", "admin-secret")
+    client = make_client()
+
+    assert client.get("/admin/state/sessions").status_code == 401
+    assert client.get("/admin/state/sessions", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get("/admin/state/sessions", headers={"Authorization": "Bearer admin-secret"})
+    assert response.status_code == 200
+    assert response.json()["policy"] == state_admin.session_memory_monitor.policy
@@ -0,0 +1,56 @@
+# tests/test_stylesheet.py
+
+# NOTE: Tests of the static utility classes of the design system: the classes of every variant, applied in the order of the
+        # stylesheet, must reproduce the inline styles of the style functions exactly, and the committed stylesheet must be the one
+        # built from the current tokens (python -m app.utils.styles.stylesheet regenerates it).
+
+# Import necessary modules
+import itertools                                                                # Importing itertools to enumerate the variants
+import pytest                                                                   # Importing pytest for the tests
+from app.utils.styles import stylesheet                                         # Importing the static utility classes
+from app.utils.styles.stylesheet import StyleClasses, flatten_style             # Importing the classes builder
+
+
+def cascade(classes: StyleClasses, class_names: str) -> dict:
+    """ Applies the rules of the given classes in the order of the stylesheet, as the browser does """
+
+    names = set(class_names.split())
+    applied = {}
+    for class_name, rules in classes.rules:
+        if class_name in names:
+            applied.update(rules)
+    return applied
+
+
+@pytest.mark.parametrize("classes", [
+                                        stylesheet.BUTTON_CLASSES,
+                                        stylesheet.CARD_CLASSES,
+                                        stylesheet.BADGE_CLASSES,
+                                        stylesheet.TABLE_CELL_CLASSES,
+                                    ], ids=lambda classes: classes.prefix)
+def test_classes_reproduce_every_variant(classes):
+    for values in itertools.product(*classes.axes.values()):
+        variant = dict(zip(classes.axes, values))
+
+        assert cascade(classes, classes.class_name(**variant)) == flatten_style(classes.factory(**variant)), variant
+
+
+def test_values_without_classes_fall_back_to_the_inline_styles(monkeypatch):
+    assert stylesheet.button_class(variant="unknown") is None
+    assert stylesheet.table_cell_class(striped=True, row_index=7) == stylesheet.table_cell_class(striped=True, row_index=1)
+
+    monkeypatch.setattr(stylesheet, "USE_STYLE_CLASSES", False)
+    assert stylesheet.button_class() is None
+
+
+def test_committed_stylesheet_is_up_to_date():
+    assert not stylesheet.is_stylesheet_outdated()
+
+
+def test_outdated_stylesheets_are_detected_and_rewritten(tmp_path):
+    path = str(tmp_path / "styles" / "design_system.css")
+
+    assert stylesheet.is_stylesheet_outdated(path)
+    assert stylesheet.write_stylesheet(path)
+    assert not stylesheet.is_stylesheet_outdated(path)
+    assert not stylesheet.write_stylesheet(path)
@@ -0,0 +1,37 @@
+# tests/test_sync_token.py
+
+# NOTE: Tests of the opaque sync tokens of the delta sync (GET /events/changes): round trip, rejected tokens and expiry.
+
+# Import necessary modules
+import base64                                                                   # Importing base64 to forge tokens
+from datetime import datetime, timedelta                                        # Importing datetime for the watermarks
+import pytest                                                                   # Importing pytest for the tests
+from app.config import sync_settings                                            # Importing the delta sync settings
+from app.api.utils.sync_token import encode_sync_token, decode_sync_token, is_sync_token_expired    # Importing the sync token helpers
+
+SYNCED_AT = datetime(2025, 3, 1, 12, 30, 15, 250000)
+
+
+def test_tokens_round_trip_to_the_watermark_before_the_sync():
+    token = encode_sync_token(SYNCED_AT)
+
+    assert decode_sync_token(token) == SYNCED_AT - timedelta(seconds=sync_settings.SYNC_TOKEN_OVERLAP_SECONDS)
+    assert "=" not in token and SYNCED_AT.isoformat() not in token
+
+
+@pytest.mark.parametrize("token", [
+                                        "not a token!",
+                                        base64.urlsafe_b64encode(b"2:2025-03-01T12:30:15").decode(),
+                                        base64.urlsafe_b64encode(b"1:yesterday").decode(),
+                                        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+                                    ])
+def test_invalid_tokens_raise_value_error(token):
+    with pytest.raises(ValueError):
+        decode_sync_token(token)
+
+
+def test_tokens_expire_with_the_tombstones_retention():
+    retention = timedelta(days=sync_settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+
+    assert not is_sync_token_expired(decode_sync_token(encode_sync_token(datetime.now())))
+    assert is_sync_token_expired(datetime.now() - retention - timedelta(minutes=1))
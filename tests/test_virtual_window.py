@@ -0,0 +1,56 @@
+# tests/test_virtual_window.py
+
+# NOTE: Tests of the rendered windows of the virtualized clients grid and orders table: the window sent by the browser is clamped
+        # to the matching items, and the client cards have a fixed height (single truncated lines) so the fixed rows never clip them.
+
+# Import necessary modules
+import pytest                                                                   # Importing pytest for the tests
+import reflex as rx                                                             # Importing reflex to render the cards
+from app.state.app_state import AppState, MAX_WINDOW_ITEMS, clamp_window        # Importing the window helpers
+from app.components.clients import clients_view                                 # Importing the clients view
+from app.components.shared.virtual_list import _spacer_height                   # Importing the spacer height of the virtualized lists
+
+
+@pytest.mark.parametrize("window, total, expected", [
+                                                        ([0, 30], 100, (0, 30)),
+                                                        ([-5, 10], 100, (0, 10)),
+                                                        ([150, 120], 100, (100, 120)),      # Past the items, the slice is empty
+                                                        ([20, 10], 100, (20, 20)),
+                                                        ([10, 10_000], 100_000, (10, 10 + MAX_WINDOW_ITEMS)),
+                                                        (["3", "9"], 100, (3, 9)),
+                                                    ])
+def test_clamp_window(window, total, expected):
+    assert clamp_window(window, total) == expected
+
+
+def test_client_cards_truncate_every_text_line():
+    rendered = str(rx.foreach(AppState.filtered_clients, clients_view._client_card).render())
+
+    # Name, company, email, phone and address
+    assert rendered.count('["textOverflow"] : "ellipsis"') == 5
+    assert rendered.count('["whiteSpace"] : "nowrap"') == 5
+
+
+@pytest.mark.parametrize("total, window, rows_before, rows_after", [
+                                                                    (10, (0, 6), 0, 2),     # 4 clients below: a full row and a partial one
+                                                                    (10, (3, 9), 1, 1),     # 1 client below, still a whole row
+                                                                    (9, (0, 6), 0, 1),
+                                                                    (11, (9, 11), 3, 0),
+                                                                ])
+def test_spacers_count_partial_rows_as_whole_rows(total, window, rows_before, rows_after):
+    start, end = clamp_window(list(window), total)
+    row_height = clients_view.CLIENT_ROW_HEIGHT
+
+    assert _spacer_height(start, 3, row_height) == f"{rows_before * row_height}px"
+    assert _spacer_height(total - end, 3, row_height) == f"{rows_after * row_height}px"
+
+
+def test_spacer_height_rounds_up_in_the_browser():
+    height = str(_spacer_height(AppState.clients_after_window, 3, clients_view.CLIENT_ROW_HEIGHT))
+
+    assert "Math.floor(" in height and "+ 3) - 1) / 3)" in height
+    assert height.endswith(f"* {clients_view.CLIENT_ROW_HEIGHT})px")
+
+
+def test_client_rows_fit_the_card_and_the_gap():
+    assert clients_view.CLIENT_ROW_HEIGHT >= clients_view.CLIENT_CARD_HEIGHT + clients_view.CLIENT_GRID_GAP